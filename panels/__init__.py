@@ -1,80 +1,438 @@
 """
 QPanel Assets - Auto-Registration System
 Automatically loads and registers all panel modules in this directory
+
+Lazy mode (register(lazy=True) or QPANEL_ASSETS_LAZY=1) registers only a
+lightweight stub per panel at startup. The real module is imported and its
+classes registered the first time one of its panels is drawn or selected.
+
+reload_changed() swaps in an updated release without touching panels
+whose source did not change.
 """
 
 import bpy
+import functools
 import importlib
+import os
 import sys
-from pathlib import Path
+import time
+
+from . import _index as _panel_index
+from . import _background
+from . import _draw_profiler
+from . import _profiling
+from ._draw_profiler import (
+    enable as enable_draw_profiling,
+    disable as disable_draw_profiling,
+    get_stats as get_draw_stats,
+    format_report as format_draw_report,
+)
+from ._profiling import (
+    get_report as get_registration_report,
+    format_report as format_registration_report,
+    write_report as write_registration_report,
+)
 
 
 # Modules list - will be populated dynamically
 _modules = []
 _registered = False
 
+# Lazy registry state
+LAZY_LOADING = os.environ.get("QPANEL_ASSETS_LAZY", "") == "1"
+_lazy = False
+_stubs = {}            # module name -> list of panel stub infos
+_stub_classes = {}     # module name -> registered stub classes
+_pending_loads = set()
+_failed_loads = set()
+
+_index = None
+
+# Incremental reload state: hash of the source each module was imported
+# from (index hash for stubs, whose metadata comes from the index)
+_module_hashes = {}    # panel module name -> sha256
+_shared_hashes = {}    # private helper module name -> sha256
+
+
+def get_index():
+    """Return the panel index (module -> classes -> bl_* metadata).
+
+    Reads the prebuilt panel_index.json; falls back to parsing the module
+    sources with ast when no index ships or when its module list no longer
+    matches the directory (a panel file was added or removed since).
+    """
+    global _index
+    if _index is None:
+        panels_dir = os.path.dirname(__file__)
+        _index = _panel_index.load_index(panels_dir)
+        if (_index is None
+                or sorted(_index["modules"]) != _panel_index.module_names(panels_dir)):
+            _index = _panel_index.build_index(panels_dir)
+    return _index
+
+
+def _panel_module_names():
+    """Return the names of all panel modules listed in the index."""
+    return sorted(get_index()["modules"])
+
 
 def discover_modules():
-    """Auto-discover all Python modules in panels directory."""
+    """Import all panel modules listed in the panel index."""
     global _modules
     _modules.clear()
-    
-    panels_dir = Path(__file__).parent
-    
-    for py_file in panels_dir.glob("*.py"):
-        # Skip __init__.py and private files
-        if py_file.name.startswith("_"):
-            continue
-        
-        module_name = py_file.stem
-        full_module_name = f"{__package__}.{module_name}"
-        
-        try:
-            # Import or reload module
-            if full_module_name in sys.modules:
-                module = importlib.reload(sys.modules[full_module_name])
-            else:
-                module = importlib.import_module(f".{module_name}", package=__package__)
-            
+
+    for module_name in _panel_module_names():
+        module = _import_module(module_name)
+        if module is not None:
             _modules.append(module)
-        except Exception as e:
-            print(f"[QPanel Assets] Failed to load {module_name}: {e}")
 
 
-def register():
-    """Register all discovered panel modules."""
-    global _registered
-    
-    if _registered:
-        return
-    
-    # Discover modules first
-    discover_modules()
-    
-    # Register each module
+def _import_module(module_name):
+    """Import or reload a panel module, returning None on failure."""
+    full_module_name = f"{__package__}.{module_name}"
+
+    start = time.perf_counter()
+    try:
+        # Import or reload module
+        if full_module_name in sys.modules:
+            module = importlib.reload(sys.modules[full_module_name])
+        else:
+            module = importlib.import_module(f".{module_name}", package=__package__)
+    except Exception as e:
+        _profiling.record_import(module_name, time.perf_counter() - start, error=e)
+        print(f"[QPanel Assets] Failed to load {module_name}: {e}")
+        return None
+    _profiling.record_import(module_name, time.perf_counter() - start)
+
+    # The file actually imported, not the index entry (which may be stale)
+    _module_hashes[module_name] = _panel_index.source_hash(os.path.dirname(__file__), module_name)
+    return module
+
+
+def _find_loaded(module_name):
+    """Return the loaded panel module with this name, or None."""
     for module in _modules:
-        if hasattr(module, 'register'):
+        if module.__name__.rpartition(".")[2] == module_name:
+            return module
+    return None
+
+
+def _make_stub_class(module_name, info):
+    """Build a placeholder Panel that loads the real module when drawn."""
+    def draw(self, context):
+        if module_name in _failed_loads:
+            self.layout.label(text="Panel failed to load (see console)", icon='ERROR')
+            return
+        self.layout.label(text="Loading panel...", icon='TIME')
+        _schedule_load(module_name)
+
+    attributes = {key: info[key] for key in _panel_index.CLASS_ATTRIBUTES if key in info}
+    attributes.setdefault("bl_label", info["bl_idname"])
+    attributes.setdefault("bl_space_type", 'VIEW_3D')
+    attributes.setdefault("bl_region_type", 'WINDOW')
+    attributes["bl_qpanel_module"] = module_name
+    attributes["draw"] = draw
+
+    return type(info["class_name"], (bpy.types.Panel,), attributes)
+
+
+def _register_stubs():
+    """Register one stub per panel; modules without panels load eagerly."""
+    _stubs.clear()
+    _stub_classes.clear()
+
+    for module_name, info in _panel_index.panel_entries(get_index()):
+        _stubs.setdefault(module_name, []).append(info)
+
+    for module_name in _panel_module_names():
+        if module_name in _stubs:
+            _register_module_stubs(module_name)
+        else:
+            load_module(module_name)
+
+
+def _register_module_stubs(module_name):
+    """Register the stub classes of a module from its index entries."""
+    registered = []
+    with _profiling.record_registration(module_name, stub=True):
+        for info in _stubs[module_name]:
+            cls = _make_stub_class(module_name, info)
             try:
-                module.register()
+                bpy.utils.register_class(cls)
+                registered.append(cls)
             except Exception as e:
-                print(f"[QPanel Assets] Failed to register {module.__name__}: {e}")
-    
+                print(f"[QPanel Assets] Failed to register stub {info['bl_idname']}: {e}")
+    _stub_classes[module_name] = registered
+
+
+def _unregister_stubs(module_name):
+    """Unregister the stub classes of a module."""
+    for cls in reversed(_stub_classes.pop(module_name, [])):
+        try:
+            bpy.utils.unregister_class(cls)
+        except Exception as e:
+            print(f"[QPanel Assets] Failed to unregister stub {cls.bl_idname}: {e}")
+
+
+def get_panel_stubs():
+    """Return the metadata of every panel from the index.
+
+    Lets the Panel Selector list and search panels without loading them.
+    """
+    return [dict(info, module=module_name)
+            for module_name, info in _panel_index.panel_entries(get_index())]
+
+
+def load_module(module_name):
+    """Import a panel module and register its real classes.
+
+    In lazy mode this replaces the module's stubs. Safe to call repeatedly.
+    """
+    module = _find_loaded(module_name)
+    if module is not None:
+        return module
+
+    module = _import_module(module_name)
+    if module is None:
+        return None
+
+    _unregister_stubs(module_name)
+    if not _register_module(module):
+        _restore_stubs(module_name)
+        return None
+
+    _modules.append(module)
+    return module
+
+
+def _register_module(module):
+    """Call a module's register(), recording its cost. Returns success."""
+    module_name = module.__name__.rpartition(".")[2]
+    if hasattr(module, 'register'):
+        try:
+            with _profiling.record_registration(module_name):
+                module.register()
+        except Exception as e:
+            print(f"[QPanel Assets] Failed to register {module.__name__}: {e}")
+            _rollback_registration(module)
+            return False
+
+    _draw_profiler.track_module(module_name, module)
+    return True
+
+
+def _rollback_registration(module):
+    """Best effort: unregister the classes a failed register() left behind."""
+    if hasattr(module, 'unregister'):
+        try:
+            module.unregister()
+            return
+        except Exception as e:
+            print(f"[QPanel Assets] Failed to unregister {module.__name__}: {e}")
+
+    # unregister() stops at the first class that never got registered
+    for cls in reversed(getattr(module, 'classes', ())):
+        try:
+            bpy.utils.unregister_class(cls)
+        except Exception:
+            pass
+
+
+def _restore_stubs(module_name):
+    """Register a module's stubs again after its real classes failed to register."""
+    panels = [info for name, info in _panel_index.panel_entries(get_index()) if name == module_name]
+    if _lazy and panels:
+        _stubs[module_name] = panels
+        _register_module_stubs(module_name)
+
+
+def load_panel(bl_idname):
+    """Make sure the module defining a panel is loaded.
+
+    Called by the Panel Selector when a panel is selected or opened.
+    Returns the module, or None if no panel matches bl_idname.
+    """
+    for module_name, info in _panel_index.panel_entries(get_index()):
+        if info["bl_idname"] == bl_idname:
+            return load_module(module_name)
+    return None
+
+
+def _schedule_load(module_name):
+    """Defer loading to a timer: classes cannot be swapped while drawing."""
+    if module_name in _pending_loads:
+        return
+    _pending_loads.add(module_name)
+    bpy.app.timers.register(functools.partial(_load_from_timer, module_name),
+                            first_interval=0.0)
+
+
+def _load_from_timer(module_name):
+    _pending_loads.discard(module_name)
+    if not _registered:
+        return None
+
+    if load_module(module_name) is None:
+        _failed_loads.add(module_name)
+
+    # Redraw so open popups pick up the real panel
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+    return None
+
+
+def _unregister_module(module):
+    """Unregister a loaded module's classes and drop it from _modules."""
+    _draw_profiler.untrack_module(module.__name__.rpartition(".")[2])
+    if hasattr(module, 'unregister'):
+        try:
+            module.unregister()
+        except Exception as e:
+            print(f"[QPanel Assets] Failed to unregister {module.__name__}: {e}")
+    _modules.remove(module)
+
+
+def reload_changed():
+    """Reload only the panel modules whose source changed since import.
+
+    Compares the SHA256 of each module file on disk with the hash of the
+    source it was imported from; the shipped index is re-parsed only when
+    its hashes no longer match the files. Changed modules are unregistered, reloaded and
+    registered again; untouched panels stay live. A change in a private
+    helper module (_*.py) reloads every loaded module, since any of them
+    may import it. Returns the names of the modules that were reloaded.
+    """
+    global _index
+
+    # Drop cached directory listings (zipimport caches the archive contents)
+    importlib.invalidate_caches()
+
+    _index = None
+    index = get_index()
+
+    # Compare the sources on disk, not only the shipped index: it is only
+    # trusted (and not re-parsed) while its hashes match the files
+    panels_dir = os.path.dirname(__file__)
+    module_hashes, shared_hashes = _panel_index.source_hashes(panels_dir)
+    if (module_hashes != {name: entry["sha256"] for name, entry in index["modules"].items()}
+            or shared_hashes != index.get("shared", {})):
+        _index = index = _panel_index.build_index(panels_dir)
+    modules = index["modules"]
+
+    changed_shared = [name for name, digest in index.get("shared", {}).items()
+                      if name in _shared_hashes and _shared_hashes[name] != digest]
+
+    reloaded = []
+
+    # Removed or changed modules: tear down their classes first
+    stale = []
+    for module in list(_modules):
+        module_name = module.__name__.rpartition(".")[2]
+        entry = modules.get(module_name)
+        if entry is None:
+            _unregister_module(module)
+            _module_hashes.pop(module_name, None)
+        elif changed_shared or _module_hashes.get(module_name) != entry["sha256"]:
+            _unregister_module(module)
+            stale.append(module_name)
+
+    for module_name in list(_stub_classes):
+        entry = modules.get(module_name)
+        if entry is None or _module_hashes.get(module_name) != entry["sha256"]:
+            _unregister_stubs(module_name)
+            _stubs.pop(module_name, None)
+
+    for name in changed_shared:
+        full_module_name = f"{__package__}.{name}"
+        if full_module_name in sys.modules:
+            importlib.reload(sys.modules[full_module_name])
+    _shared_hashes.clear()
+    _shared_hashes.update(index.get("shared", {}))
+
+    for module_name in stale:
+        if load_module(module_name) is not None:
+            reloaded.append(module_name)
+
+    # New modules, and stubs for changed modules that are not loaded yet
+    for module_name in _panel_module_names():
+        if _find_loaded(module_name) is not None or module_name in _stub_classes:
+            continue
+
+        panels = [info for name, info in _panel_index.panel_entries(index) if name == module_name]
+        if _lazy and panels:
+            _stubs[module_name] = panels
+            _module_hashes[module_name] = modules[module_name]["sha256"]
+            _register_module_stubs(module_name)
+        elif load_module(module_name) is not None:
+            reloaded.append(module_name)
+
+    return reloaded
+
+
+def register(lazy=None):
+    """Register all discovered panel modules.
+
+    lazy: register panel stubs only (defaults to LAZY_LOADING).
+    Calling register() again while registered reloads changed modules only.
+    """
+    global _registered, _lazy
+
+    if _registered:
+        reload_changed()
+        return
+
+    _profiling.reset()
+    _shared_hashes.clear()
+    _shared_hashes.update(_panel_index.source_hashes(os.path.dirname(__file__))[1])
+
+    _lazy = LAZY_LOADING if lazy is None else lazy
+
+    if _lazy:
+        for module_name, entry in get_index()["modules"].items():
+            _module_hashes[module_name] = entry["sha256"]
+        _register_stubs()
+    else:
+        # Discover modules first
+        discover_modules()
+
+        # Register each module
+        for module in _modules:
+            _register_module(module)
+
     _registered = True
 
+    report = _profiling.get_report()
+    print(f"[QPanel Assets] Registered {report['class_count']} classes "
+          f"from {len(report['modules'])} modules in {report['total_ms']:.1f} ms "
+          f"({report['failure_count']} failures)")
+    if _profiling.REPORT_PATH:
+        _profiling.write_report(_profiling.REPORT_PATH)
+
 
 def unregister():
     """Unregister all panel modules."""
-    global _registered
-    
+    global _registered, _index
+
     if not _registered:
         return
-    
+
     for module in reversed(_modules):
+        _draw_profiler.untrack_module(module.__name__.rpartition(".")[2])
         if hasattr(module, 'unregister'):
             try:
                 module.unregister()
             except Exception as e:
                 print(f"[QPanel Assets] Failed to unregister {module.__name__}: {e}")
-    
+
+    for module_name in list(_stub_classes):
+        _unregister_stubs(module_name)
+    _background.shutdown()
+
     _modules.clear()
+    _stubs.clear()
+    _pending_loads.clear()
+    _failed_loads.clear()
+    _module_hashes.clear()
+    _index = None
     _registered = False
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Background Jobs
+Shared thread pool for file I/O done on behalf of panels
+
+Workers only run plain Python (file reads, hashing, directory scans) and
+never touch bpy. Their results are handed to on_done callbacks from a
+bpy.app.timers poll on the main thread, which then tags the UI for
+redraw, so panel caches are only ever modified on the main thread.
+Jobs are keyed by tuples whose first item names the owner, so a module
+can cancel its own jobs when it unregisters.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+
+MAX_WORKERS = min(8, os.cpu_count() or 2)
+POLL_INTERVAL = 0.1  # seconds between result polls while jobs are pending
+
+_executor = None
+_pending = {}  # key -> (future, on_done)
+
+
+def submit(key, on_done, fn, *args):
+    """Run fn(*args) in the pool, then on_done(result) on the main thread.
+
+    A key that is already pending is not submitted again.
+    """
+    global _executor
+    if key in _pending:
+        return
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="qpanel_assets")
+    _pending[key] = (_executor.submit(fn, *args), on_done)
+    if not bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.register(_poll, first_interval=POLL_INTERVAL, persistent=True)
+
+
+def is_pending(key):
+    return key in _pending
+
+
+def pending_count(owner=None):
+    if owner is None:
+        return len(_pending)
+    return sum(1 for key in _pending if key[0] == owner)
+
+
+def _tag_redraw():
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+def _poll():
+    finished = [key for key, (future, _on_done) in _pending.items() if future.done()]
+    for key in finished:
+        future, on_done = _pending.pop(key)
+        if future.cancelled():
+            continue
+        error = future.exception()
+        if error is not None:
+            print(f"[QPanel Assets] Background job {key} failed: {error}")
+            continue
+        try:
+            on_done(future.result())
+        except Exception as e:
+            print(f"[QPanel Assets] Background result {key} failed: {e}")
+
+    if finished:
+        _tag_redraw()
+    return POLL_INTERVAL if _pending else None
+
+
+def cancel(owner):
+    """Drop the pending jobs of an owner (running jobs finish, results are ignored)."""
+    for key in [key for key in _pending if key[0] == owner]:
+        future, _on_done = _pending.pop(key)
+        future.cancel()
+
+
+def shutdown():
+    """Cancel every job and stop the worker threads."""
+    global _executor
+    for future, _on_done in _pending.values():
+        future.cancel()
+    _pending.clear()
+    if bpy.app.timers.is_registered(_poll):
+        bpy.app.timers.unregister(_poll)
+    if _executor is not None:
+        _executor.shutdown(wait=False)
+        _executor = None
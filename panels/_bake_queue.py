@@ -0,0 +1,326 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Bake Queue
+Dependency-ordered sequential baking of a scene's simulations
+
+collect() lists the scene's bakeable simulations (rigid body world,
+cloth, soft body, emitter particles, fluid domains) and orders them so a
+simulation is baked after everything that moves its inputs: the rigid
+body world first, then sims on parent objects, colliders (for cloth, soft
+body and particles), earlier sims in the same stack, and flows/effectors
+(for fluid domains). Cycles (mutual colliders) are broken at the sim
+with the fewest unmet dependencies, then by kind order.
+
+Each bake is one blocking operator call (ptcache.bake / fluid.bake_all).
+Frame-change events fired by a point cache bake give the time spent per
+frame. Fluid bakes run as a job that fires no frame-change events: their
+frames are timed by the modification times of the cache files written
+during the bake (_point_cache lists the same folders). The
+report (order, status, seconds, per-frame seconds, errors) is stored as
+JSON on the scene, like _snapshots, so it is saved with the .blend file
+and a failed or interrupted queue resumes with the sims not yet done.
+"""
+
+import heapq
+import json
+import os
+import time
+from collections import namedtuple
+
+import bpy
+
+from . import _modifier_index, _point_cache
+
+
+REPORT_KEY = "qpanel_bake_report"
+
+# Bake order when no dependency decides
+KIND_ORDER = ('RIGID_BODY', 'CLOTH', 'SOFT_BODY', 'PARTICLES', 'FLUID')
+
+# key: "KIND\towner\tlabel" (owner: object or scene name, label: modifier / particle system name)
+Sim = namedtuple("Sim", "key kind owner label")
+
+
+def _sim(kind, owner, label):
+    return Sim(f"{kind}\t{owner}\t{label}", kind, owner, label)
+
+
+def sim_from_key(key):
+    kind, owner, label = key.split("\t", 2)
+    return Sim(key, kind, owner, label)
+
+
+def _object_sims(obj):
+    sims = []
+    for mod in obj.modifiers:
+        if mod.type in {'CLOTH', 'SOFT_BODY'}:
+            sims.append(_sim(mod.type, obj.name, mod.name))
+        elif mod.type == 'PARTICLE_SYSTEM' and mod.particle_system.settings.type == 'EMITTER':
+            sims.append(_sim('PARTICLES', obj.name, mod.particle_system.name))
+        elif mod.type == 'FLUID' and mod.fluid_type == 'DOMAIN':
+            sims.append(_sim('FLUID', obj.name, mod.name))
+    return sims
+
+
+def _ancestors(obj):
+    parent = obj.parent
+    while parent is not None:
+        yield parent
+        parent = parent.parent
+
+
+def collect(scene):
+    """The scene's simulations in bake order."""
+    world = scene.rigidbody_world
+    sims = []
+    if world is not None and world.enabled and world.collection is not None:
+        sims.append(_sim('RIGID_BODY', scene.name, "Rigid Body World"))
+
+    by_object = {}
+    for obj in scene.objects:
+        object_sims = _object_sims(obj)
+        if object_sims:
+            by_object[obj.name] = object_sims
+            sims.extend(object_sims)
+
+    colliders = [obj.name for obj in scene.objects if _modifier_index.modifier_of_type(obj, 'COLLISION')]
+    fluid_inputs = []
+    for obj in scene.objects:
+        mod = _modifier_index.modifier_of_type(obj, 'FLUID')
+        if mod is not None and mod.fluid_type in {'FLOW', 'EFFECTOR'}:
+            fluid_inputs.append(obj.name)
+
+    # sim key -> keys it must be baked after
+    depends = {sim.key: set() for sim in sims}
+    for obj in scene.objects:
+        object_sims = by_object.get(obj.name)
+        if not object_sims:
+            continue
+        upstream = [ancestor.name for ancestor in _ancestors(obj)]
+        for position, sim in enumerate(object_sims):
+            sources = list(upstream)
+            sources += fluid_inputs if sim.kind == 'FLUID' else colliders
+            for name in sources:
+                if name != obj.name:
+                    depends[sim.key].update(other.key for other in by_object.get(name, ()))
+            # Earlier sims of the same stack feed this one
+            depends[sim.key].update(other.key for other in object_sims[:position])
+            if sims[0].kind == 'RIGID_BODY':
+                depends[sim.key].add(sims[0].key)
+    return _order(sims, depends)
+
+
+def _order(sims, depends):
+    """Topological order, ties broken by kind then scene order."""
+    rank = {sim.key: (KIND_ORDER.index(sim.kind), index) for index, sim in enumerate(sims)}
+    by_key = {sim.key: sim for sim in sims}
+    remaining = {key: set(keys) for key, keys in depends.items()}
+    dependents = {}
+    for key, keys in remaining.items():
+        for dependency in keys:
+            dependents.setdefault(dependency, []).append(key)
+
+    ready = [(rank[key], key) for key, keys in remaining.items() if not keys]
+    heapq.heapify(ready)
+    ordered = []
+    done = set()
+    while len(ordered) < len(sims):
+        if not ready:
+            # Cycle: release the sim with the fewest unmet dependencies, then by kind
+            key = min((key for key in remaining if key not in done),
+                      key=lambda key: (len(remaining[key]), rank[key]))
+            remaining[key].clear()
+            ready.append((rank[key], key))
+        _rank, key = heapq.heappop(ready)
+        if key in done:
+            continue
+        done.add(key)
+        ordered.append(by_key[key])
+        for dependent in dependents.get(key, ()):
+            keys = remaining[dependent]
+            if key in keys:
+                keys.discard(key)
+                if not keys:
+                    heapq.heappush(ready, (rank[dependent], dependent))
+    return ordered
+
+
+def _resolve(scene, sim):
+    """(object or None, PointCache or fluid modifier) for sim, or None when it no longer exists."""
+    if sim.kind == 'RIGID_BODY':
+        world = scene.rigidbody_world
+        return (None, world.point_cache) if world is not None else None
+    obj = bpy.data.objects.get(sim.owner)
+    if obj is None:
+        return None
+    if sim.kind == 'PARTICLES':
+        psys = obj.particle_systems.get(sim.label)
+        return (obj, psys.point_cache) if psys is not None else None
+    mod = obj.modifiers.get(sim.label)
+    if mod is None or mod.type != sim.kind:
+        return None
+    return (obj, mod) if sim.kind == 'FLUID' else (obj, mod.point_cache)
+
+
+def is_baked(scene, sim):
+    resolved = _resolve(scene, sim)
+    if resolved is None:
+        return False
+    if sim.kind == 'FLUID':
+        return resolved[1].domain_settings.has_cache_baked_any
+    return resolved[1].is_baked
+
+
+def _fluid_stamps(domain, since):
+    """[(frame, mtime)] of the newest cache file per frame written after since (epoch seconds)."""
+    newest = {}
+    for directory in _point_cache.fluid_directories(domain):
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                frame = _point_cache.fluid_frame(entry.name)
+                if frame is None:
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if mtime >= since and mtime > newest.get(frame, 0.0):
+                    newest[frame] = mtime
+    return sorted(newest.items())
+
+
+def bake(context, sim):
+    """Bake one simulation; return (seconds, {frame: seconds}). Raises RuntimeError on failure."""
+    resolved = _resolve(context.scene, sim)
+    if resolved is None:
+        raise RuntimeError("no longer exists")
+    obj, handle = resolved
+    if sim.kind == 'FLUID':
+        frame_start = handle.domain_settings.cache_frame_start
+        frame_end = handle.domain_settings.cache_frame_end
+    else:
+        frame_start, frame_end = handle.frame_start, handle.frame_end
+
+    stamps = []
+
+    def on_frame(scene, *args):
+        stamps.append((scene.frame_current, time.perf_counter()))
+
+    bpy.app.handlers.frame_change_post.append(on_frame)
+    wall_start = time.time()
+    start = time.perf_counter()
+    try:
+        if sim.kind == 'FLUID':
+            with context.temp_override(object=obj, active_object=obj):
+                if handle.domain_settings.has_cache_baked_any:
+                    bpy.ops.fluid.free_all()
+                result = bpy.ops.fluid.bake_all()
+        else:
+            with context.temp_override(point_cache=handle):
+                if handle.is_baked:
+                    bpy.ops.ptcache.free_bake()
+                result = bpy.ops.ptcache.bake(bake=True)
+    finally:
+        bpy.app.handlers.frame_change_post.remove(on_frame)
+    seconds = time.perf_counter() - start
+    if 'FINISHED' not in result:
+        raise RuntimeError("bake was cancelled")
+
+    if sim.kind == 'FLUID':
+        stamps = _fluid_stamps(handle.domain_settings, wall_start)
+        start = wall_start
+
+    frames = {}
+    previous = start
+    for frame, stamp in stamps:
+        # The frame restored after baking repeats an earlier one
+        if frame_start <= frame <= frame_end and frame not in frames:
+            frames[frame] = stamp - previous
+        previous = stamp
+    return seconds, frames
+
+
+# Report stored on the scene
+
+_parsed = (None, None)  # (raw JSON, report) of the last load, so redraws do not re-parse
+
+
+def load_report(scene):
+    """{"order": [key], "sims": {key: {"status", "seconds", "frames", "error"}}} or None."""
+    global _parsed
+    raw = scene.get(REPORT_KEY)
+    if not raw:
+        return None
+    if raw == _parsed[0]:
+        return _parsed[1]
+    try:
+        report = json.loads(raw)
+    except ValueError:
+        return None
+    _parsed = (raw, report)
+    return report
+
+
+def save_report(scene, report):
+    global _parsed
+    raw = json.dumps(report)
+    scene[REPORT_KEY] = raw
+    _parsed = (raw, report)
+
+
+def discard_report(scene):
+    if REPORT_KEY in scene:
+        del scene[REPORT_KEY]
+
+
+def new_report(scene, sims, skip_baked=True):
+    """Report with every sim PENDING, or BAKED when its cache is already baked and skip_baked."""
+    report = {"order": [sim.key for sim in sims], "sims": {}}
+    for sim in sims:
+        status = 'BAKED' if skip_baked and is_baked(scene, sim) else 'PENDING'
+        report["sims"][sim.key] = {"status": status, "seconds": 0.0, "frames": {}, "error": ""}
+    return report
+
+
+def next_sim(report):
+    """First sim of report still to bake (PENDING or FAILED), or None."""
+    for key in report["order"]:
+        if report["sims"][key]["status"] in {'PENDING', 'FAILED'}:
+            return sim_from_key(key)
+    return None
+
+
+def record(report, sim, seconds=0.0, frames=None, error=""):
+    entry = report["sims"][sim.key]
+    entry["status"] = 'FAILED' if error else 'DONE'
+    entry["seconds"] = seconds
+    # JSON object keys are strings
+    entry["frames"] = {str(frame): value for frame, value in (frames or {}).items()}
+    entry["error"] = error
+
+
+def slowest_frames(entry, count=3):
+    """[(frame, seconds)] of the slowest frames of a report entry."""
+    frames = sorted(entry["frames"].items(), key=lambda item: -item[1])
+    return [(int(frame), seconds) for frame, seconds in frames[:count]]
+
+
+def bake_next(context, report):
+    """Bake the next sim of report and save the result; return (sim, error), sim None when done."""
+    sim = next_sim(report)
+    if sim is None:
+        return None, ""
+    try:
+        seconds, frames = bake(context, sim)
+    except RuntimeError as e:
+        error = str(e) or "bake failed"
+        record(report, sim, error=error)
+        save_report(context.scene, report)
+        return sim, error
+    record(report, sim, seconds, frames)
+    save_report(context.scene, report)
+    return sim, ""
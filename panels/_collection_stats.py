@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Collection Cost Counters
+Aggregated object / vertex / face / instance totals per collection subtree
+
+Counts come from collection lengths (len(mesh.vertices), len(mesh.polygons),
+the same sizes foreach_get would read), never from per-element loops, and
+are cached at three levels:
+- per mesh datablock (shared by all its users)
+- per object (mesh counts + instanced collections + particle instances)
+- per collection (sum over collection.all_objects)
+
+Geometry edits refresh the edited mesh and apply the difference to the
+cached totals of the collections holding the object. Membership changes
+(collection updates, a changed scene object count) drop the collection
+totals only; scene updates from selection keep them. When a scene lost
+objects, the counts of deleted objects and meshes are pruned as well
+(their pointers may be reused by new datablocks). Collection parent maps
+are kept per scene.
+Counts are base mesh data, before modifiers.
+"""
+
+import bpy
+
+from . import _format, _handlers
+
+
+MAX_INSTANCE_DEPTH = 4  # nested collection instances followed for totals
+
+_mesh_counts = {}    # mesh pointer -> (vertices, faces)
+_object_costs = {}   # object pointer -> (vertices, faces, instances)
+_totals = {}         # collection pointer -> (objects, vertices, faces, instances)
+_parents = {}        # scene pointer -> {collection pointer: [parent collections]}, built on demand
+_has_instancers = False
+_object_counts = {}  # scene pointer -> len(scene.objects) when its totals were last dropped
+
+
+def mesh_counts(mesh):
+    """Return (vertices, faces) of a mesh datablock (cached)."""
+    key = mesh.as_pointer()
+    counts = _mesh_counts.get(key)
+    if counts is None:
+        counts = _mesh_counts[key] = (len(mesh.vertices), len(mesh.polygons))
+    return counts
+
+
+def _compute_object_cost(obj, depth):
+    global _has_instancers
+    vertices = faces = instances = 0
+    if obj.type == 'MESH' and obj.data is not None:
+        vertices, faces = mesh_counts(obj.data)
+
+    if obj.instance_type == 'COLLECTION' and obj.instance_collection is not None:
+        _has_instancers = True
+        instances += 1
+        if depth < MAX_INSTANCE_DEPTH:
+            _objects, v, f, i = collection_totals(obj.instance_collection, depth + 1)
+            vertices += v
+            faces += f
+            instances += i
+
+    for psys in obj.particle_systems:
+        settings = psys.settings
+        if settings.render_type in {'OBJECT', 'COLLECTION'}:
+            instances += settings.count
+    return vertices, faces, instances
+
+
+def object_cost(obj, depth=0):
+    """Return (vertices, faces, instances) of an object (cached)."""
+    key = obj.as_pointer()
+    cost = _object_costs.get(key)
+    if cost is None:
+        cost = _object_costs[key] = _compute_object_cost(obj, depth)
+    return cost
+
+
+def collection_totals(collection, depth=0):
+    """Return (objects, vertices, faces, instances) of a collection subtree (cached)."""
+    key = collection.as_pointer()
+    totals = _totals.get(key)
+    if totals is None:
+        objects = collection.all_objects
+        vertices = faces = instances = 0
+        for obj in objects:
+            v, f, i = object_cost(obj, depth)
+            vertices += v
+            faces += f
+            instances += i
+        totals = _totals[key] = (len(objects), vertices, faces, instances)
+    return totals
+
+
+def summary(collection):
+    """One-line cost summary of a collection subtree for a row label."""
+    objects, vertices, faces, instances = collection_totals(collection)
+    text = f"{objects} ob  {_format.format_count(vertices)} v  {_format.format_count(faces)} f"
+    if instances:
+        text += f"  {_format.format_count(instances)} inst"
+    return text
+
+
+def _collection_parents(scene):
+    parents = _parents.get(scene.as_pointer())
+    if parents is None:
+        parents = _parents[scene.as_pointer()] = {}
+        stack = [scene.collection]
+        while stack:
+            collection = stack.pop()
+            for child in collection.children:
+                parents.setdefault(child.as_pointer(), []).append(collection)
+                stack.append(child)
+    return parents
+
+
+def _prune():
+    """Drop the counts of deleted objects and meshes."""
+    live = {obj.as_pointer() for obj in bpy.data.objects}
+    for key in [key for key in _object_costs if key not in live]:
+        del _object_costs[key]
+    live = {mesh.as_pointer() for mesh in bpy.data.meshes}
+    for key in [key for key in _mesh_counts if key not in live]:
+        del _mesh_counts[key]
+
+
+def _apply_delta(scene, obj, delta):
+    """Add a cost difference to every cached collection holding obj."""
+    parents = _collection_parents(scene)
+    seen = set()
+    stack = list(obj.users_collection)
+    while stack:
+        collection = stack.pop()
+        key = collection.as_pointer()
+        if key in seen:
+            continue
+        seen.add(key)
+        totals = _totals.get(key)
+        if totals is not None:
+            _totals[key] = (totals[0],) + tuple(a + b for a, b in zip(totals[1:], delta))
+        stack.extend(parents.get(key, ()))
+
+
+def _on_update(scene, updates):
+    if not _object_costs:
+        return
+
+    changed = []
+    membership = False
+    check_count = False
+    for id_data, geometry, _transform in updates:
+        if isinstance(id_data, bpy.types.Mesh):
+            _mesh_counts.pop(id_data.as_pointer(), None)
+        elif isinstance(id_data, bpy.types.Object):
+            if id_data.as_pointer() not in _object_costs:
+                # Not counted yet: only new if the scene gained objects
+                check_count = True
+            elif geometry:
+                changed.append(id_data)
+        elif isinstance(id_data, bpy.types.Collection):
+            membership = True
+        elif isinstance(id_data, bpy.types.Scene):
+            # Selection and most scene edits tag the scene too
+            check_count = True
+
+    scene_key = scene.as_pointer()
+    count = len(scene.objects)
+    previous = _object_counts.get(scene_key)
+    if check_count and not membership:
+        membership = count != previous
+    if membership:
+        _object_counts[scene_key] = count
+        _totals.clear()
+        # Collections can be linked in several scenes
+        _parents.clear()
+        if previous is None or count < previous:
+            _prune()
+
+    for obj in changed:
+        if obj.type == 'MESH' and obj.data is not None:
+            _mesh_counts.pop(obj.data.as_pointer(), None)
+        key = obj.as_pointer()
+        old = _object_costs.pop(key)
+        new = object_cost(obj)
+        if new == old or not _totals:
+            continue
+        if _has_instancers:
+            # Instanced collections feed other totals: recount on demand
+            _totals.clear()
+            continue
+        _apply_delta(scene, obj, tuple(b - a for a, b in zip(old, new)))
+
+
+def clear():
+    """Drop every cached count."""
+    global _has_instancers
+    _mesh_counts.clear()
+    _object_costs.clear()
+    _totals.clear()
+    _parents.clear()
+    _has_instancers = False
+    _object_counts.clear()
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=clear)
+    clear()
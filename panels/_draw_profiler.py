@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Draw/Poll Latency Profiler
+Opt-in timing of draw() and poll() for every registered Assets panel
+
+When enabled (enable() or QPANEL_ASSETS_DRAW_PROFILE=1), each panel's
+draw and poll are wrapped; every call's wall time goes into a fixed-size
+ring buffer per (panel, method), summarized as p50/p95/p99. Disabling
+restores the original methods.
+"""
+
+import functools
+import math
+import os
+import time
+from array import array
+
+import bpy
+
+
+ENABLED = os.environ.get("QPANEL_ASSETS_DRAW_PROFILE", "") == "1"
+RING_SIZE = 1024
+
+_tracked = {}     # module name -> panel classes
+_originals = {}   # panel class -> {method name: original class attribute}
+_samples = {}     # (bl_idname, method) -> _RingBuffer
+
+
+class _RingBuffer:
+    """Fixed-size float buffer that overwrites its oldest samples."""
+
+    __slots__ = ("values", "size", "count", "total_calls")
+
+    def __init__(self, size=RING_SIZE):
+        self.values = array('d', bytes(8 * size))
+        self.size = size
+        self.count = 0
+        self.total_calls = 0
+
+    def add(self, value):
+        self.values[self.total_calls % self.size] = value
+        self.total_calls += 1
+        self.count = min(self.count + 1, self.size)
+
+    def last(self):
+        return self.values[(self.total_calls - 1) % self.size] if self.total_calls else 0.0
+
+    def sorted_values(self):
+        return sorted(self.values[:self.count])
+
+
+def _percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(q / 100.0 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def _ring(bl_idname, method):
+    key = (bl_idname, method)
+    ring = _samples.get(key)
+    if ring is None:
+        ring = _samples[key] = _RingBuffer()
+    return ring
+
+
+def _profiled_draw(draw, samples):
+    @functools.wraps(draw)
+    def profiled_draw(self, context):
+        start = time.perf_counter()
+        try:
+            return draw(self, context)
+        finally:
+            samples.add((time.perf_counter() - start) * 1000.0)
+    return profiled_draw
+
+
+def _profiled_poll(poll, samples):
+    @functools.wraps(poll)
+    def profiled_poll(cls, context):
+        start = time.perf_counter()
+        try:
+            return poll(cls, context)
+        finally:
+            samples.add((time.perf_counter() - start) * 1000.0)
+    return classmethod(profiled_poll)
+
+
+def _instrument(cls):
+    if cls in _originals:
+        return
+
+    originals = {}
+    draw = cls.__dict__.get("draw")
+    if draw is not None:
+        originals["draw"] = draw
+        cls.draw = _profiled_draw(draw, _ring(cls.bl_idname, "draw"))
+
+    poll = cls.__dict__.get("poll")
+    if isinstance(poll, classmethod):
+        originals["poll"] = poll
+        cls.poll = _profiled_poll(poll.__func__, _ring(cls.bl_idname, "poll"))
+
+    _originals[cls] = originals
+
+
+def _uninstrument(cls):
+    for name, original in _originals.pop(cls, {}).items():
+        setattr(cls, name, original)
+
+
+def track_module(module_name, module):
+    """Remember a registered module's panels; instrument them if enabled."""
+    panels = [cls for cls in getattr(module, "classes", ())
+              if issubclass(cls, bpy.types.Panel)]
+    _tracked[module_name] = panels
+    if ENABLED:
+        for cls in panels:
+            _instrument(cls)
+
+
+def untrack_module(module_name):
+    """Forget a module's panels (called before it is unregistered)."""
+    for cls in _tracked.pop(module_name, ()):
+        _uninstrument(cls)
+
+
+def enable():
+    """Start timing draw/poll of all tracked panels."""
+    global ENABLED
+    ENABLED = True
+    for panels in _tracked.values():
+        for cls in panels:
+            _instrument(cls)
+
+
+def disable():
+    """Stop timing and restore the original methods. Samples are kept."""
+    global ENABLED
+    ENABLED = False
+    for cls in list(_originals):
+        _uninstrument(cls)
+
+
+def is_enabled():
+    return ENABLED
+
+
+def reset():
+    """Drop all recorded samples."""
+    for ring in _samples.values():
+        ring.count = 0
+        ring.total_calls = 0
+
+
+def get_stats():
+    """Return per (panel, method) latency summaries in ms, slowest p95 first."""
+    stats = []
+    for (bl_idname, method), ring in _samples.items():
+        if not ring.total_calls:
+            continue
+        values = ring.sorted_values()
+        stats.append({
+            "panel": bl_idname,
+            "method": method,
+            "calls": ring.total_calls,
+            "samples": ring.count,
+            "last_ms": ring.last(),
+            "p50_ms": _percentile(values, 50),
+            "p95_ms": _percentile(values, 95),
+            "p99_ms": _percentile(values, 99),
+            "max_ms": values[-1],
+        })
+    stats.sort(key=lambda entry: entry["p95_ms"], reverse=True)
+    return stats
+
+
+def format_report():
+    """Return the latency summaries as a plain-text table."""
+    lines = [
+        "QPanel Assets - Draw/Poll Latency (ms)",
+        f"{'Panel':36s} {'Method':6s} {'Calls':>7s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'max':>8s}",
+    ]
+    for entry in get_stats():
+        lines.append(
+            f"{entry['panel']:36s} {entry['method']:6s} {entry['calls']:7d} "
+            f"{entry['p50_ms']:8.3f} {entry['p95_ms']:8.3f} {entry['p99_ms']:8.3f} {entry['max_ms']:8.3f}"
+        )
+    return "\n".join(lines)
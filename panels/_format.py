@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Label Formatting
+Short byte sizes and counts for panel labels
+"""
+
+
+def format_bytes(value):
+    """Short size: 512 B, 3.4 MB, 1.2 TB ("-" when unknown)"""
+    if value is None:
+        return "-"
+    for unit in ("B", "KB", "MB", "GB"):
+        if value < 1024:
+            return f"{value:.0f} {unit}" if unit == "B" else f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} TB"
+
+
+def format_count(value):
+    """Short count: 950, 45.3k, 12.1M"""
+    if value >= 1_000_000:
+        return f"{value / 1_000_000:.1f}M"
+    if value >= 10_000:
+        return f"{value / 1_000:.1f}k"
+    return str(value)
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Shared Update Listeners
+One depsgraph_update_post handler feeding every panel cache
+
+Panel caches register listeners here instead of adding their own app
+handlers: the depsgraph updates are read once per event and passed to each
+listener as a list of (id, is_updated_geometry, is_updated_transform) with
+original (non-evaluated) IDs. Reset listeners run after file load, undo and
+redo, when cached ID references may no longer be valid. Render listeners
+run before each render with the rendered scene.
+"""
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+_update_listeners = []
+_reset_listeners = []
+_render_listeners = []
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    updates = [(update.id.original, update.is_updated_geometry, update.is_updated_transform)
+               for update in depsgraph.updates]
+    for listener in list(_update_listeners):
+        try:
+            listener(scene, updates)
+        except Exception as e:
+            print(f"[QPanel Assets] Update listener {listener.__qualname__} failed: {e}")
+
+
+@persistent
+def _on_reset(*args):
+    for listener in list(_reset_listeners):
+        try:
+            listener()
+        except Exception as e:
+            print(f"[QPanel Assets] Reset listener {listener.__qualname__} failed: {e}")
+
+
+@persistent
+def _on_render(scene, *args):
+    for listener in list(_render_listeners):
+        try:
+            listener(scene)
+        except Exception as e:
+            print(f"[QPanel Assets] Render listener {listener.__qualname__} failed: {e}")
+
+
+_HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update, _update_listeners),
+    (bpy.app.handlers.load_post, _on_reset, _reset_listeners),
+    (bpy.app.handlers.undo_post, _on_reset, _reset_listeners),
+    (bpy.app.handlers.redo_post, _on_reset, _reset_listeners),
+    (bpy.app.handlers.render_pre, _on_render, _render_listeners),
+)
+
+
+def _sync_handlers():
+    """Install each app handler while at least one of its listeners exists."""
+    for handlers, handler, listeners in _HANDLERS:
+        active = bool(listeners)
+        # Compare by name: a reloaded module brings new function objects
+        installed = [h for h in handlers if getattr(h, "__qualname__", None) == handler.__qualname__
+                     and getattr(h, "__module__", None) == handler.__module__]
+        for h in installed:
+            handlers.remove(h)
+        if active:
+            handlers.append(handler)
+
+
+def add_listener(on_update=None, on_reset=None, on_render=None):
+    """Register callbacks: on_update(scene, updates), on_reset() and on_render(scene)."""
+    if on_update is not None and on_update not in _update_listeners:
+        _update_listeners.append(on_update)
+    if on_reset is not None and on_reset not in _reset_listeners:
+        _reset_listeners.append(on_reset)
+    if on_render is not None and on_render not in _render_listeners:
+        _render_listeners.append(on_render)
+    _sync_handlers()
+
+
+def remove_listener(on_update=None, on_reset=None, on_render=None):
+    """Unregister callbacks added with add_listener()."""
+    if on_update in _update_listeners:
+        _update_listeners.remove(on_update)
+    if on_reset in _reset_listeners:
+        _reset_listeners.remove(on_reset)
+    if on_render in _render_listeners:
+        _render_listeners.remove(on_render)
+    _sync_handlers()
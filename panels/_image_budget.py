@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Image Memory Budget
+LRU unloading of image pixel buffers above a RAM budget
+
+Use is recorded in an LRU order (oldest first) when an image shows up in
+depsgraph updates, when a material using it is edited, and, while
+automatic unloading is on, before each render for the images of visible
+materials. Enforcing the budget frees buffers (Image.buffers_free) of the
+least recently used resident images until the estimated total fits. Never freed: images used by materials of
+visible objects or by the world, images shown in an Image Editor, and
+images with unsaved changes.
+"""
+
+import time
+from collections import OrderedDict
+
+import bpy
+
+from . import _format, _handlers, _image_probe, _image_table
+
+
+AUTO_DELAY = 2.0  # seconds after the last update before an automatic check
+
+_recent = OrderedDict()  # image pointer -> last use time, least recent first
+_material_images = {}    # material pointer -> frozenset of image pointers
+
+
+def touch(pointers):
+    """Mark images (by pointer) as just used."""
+    now = time.monotonic()
+    for pointer in pointers:
+        _recent[pointer] = now
+        _recent.move_to_end(pointer)
+
+
+def _tree_images(node_tree, found, seen):
+    if node_tree is None or node_tree.as_pointer() in seen:
+        return
+    seen.add(node_tree.as_pointer())
+    for node in node_tree.nodes:
+        image = getattr(node, "image", None)
+        if image is not None:
+            found.add(image.as_pointer())
+        if node.type == 'GROUP':
+            _tree_images(node.node_tree, found, seen)
+
+
+def material_images(material):
+    """Image pointers used by a material's node tree (cached per material)."""
+    key = material.as_pointer()
+    images = _material_images.get(key)
+    if images is None:
+        found = set()
+        if material.use_nodes:
+            _tree_images(material.node_tree, found, set())
+        images = _material_images[key] = frozenset(found)
+    return images
+
+
+def protected_images(context):
+    """Pointers of images in use by visible materials, the world or an Image Editor."""
+    objects = getattr(context, "visible_objects", None)
+    if objects is None:
+        # Timers run without a window context
+        objects = [obj for obj in context.scene.objects if obj.visible_get()]
+
+    protected = set()
+    materials = set()
+    for obj in objects:
+        for slot in obj.material_slots:
+            if slot.material is not None and slot.material.as_pointer() not in materials:
+                materials.add(slot.material.as_pointer())
+                protected |= material_images(slot.material)
+
+    world = context.scene.world
+    if world is not None and world.use_nodes:
+        _tree_images(world.node_tree, protected, set())
+
+    window_manager = context.window_manager
+    for window in window_manager.windows if window_manager else ():
+        for area in window.screen.areas:
+            if area.type == 'IMAGE_EDITOR' and area.spaces.active.image is not None:
+                protected.add(area.spaces.active.image.as_pointer())
+    return protected
+
+
+def resident_images():
+    """[(image, estimated bytes)] of images holding pixel buffers."""
+    return [(img, _image_table.estimate_memory(_image_probe.image_info(img)))
+            for img in bpy.data.images if img.has_data]
+
+
+def plan(context, budget_bytes):
+    """Return (resident bytes, [(image, bytes)] to free, least recently used first)."""
+    resident = resident_images()
+    total = sum(size for _img, size in resident)
+    if total <= budget_bytes:
+        return total, []
+
+    protected = protected_images(context)
+    touch(protected)
+    candidates = [(img, size) for img, size in resident
+                  if img.as_pointer() not in protected and not img.is_dirty and img.type == 'IMAGE']
+    # Images never seen in use sort first (time 0)
+    candidates.sort(key=lambda item: _recent.get(item[0].as_pointer(), 0.0))
+
+    to_free = []
+    excess = total - budget_bytes
+    for img, size in candidates:
+        if excess <= 0:
+            break
+        to_free.append((img, size))
+        excess -= size
+    return total, to_free
+
+
+def enforce(context, budget_bytes):
+    """Free LRU image buffers until the budget fits; return (count, bytes freed)."""
+    _total, to_free = plan(context, budget_bytes)
+    freed = 0
+    for img, size in to_free:
+        img.buffers_free()
+        _recent.pop(img.as_pointer(), None)
+        freed += size
+    if to_free:
+        _image_table.invalidate()
+    return len(to_free), freed
+
+
+def _settings():
+    window_manager = bpy.context.window_manager
+    return getattr(window_manager, "qpanel_texture_table", None) if window_manager else None
+
+
+def _auto_check():
+    settings = _settings()
+    if settings is None or not settings.auto_budget:
+        return None
+    count, freed = enforce(bpy.context, settings.budget_mb * 1024 * 1024)
+    if count:
+        print(f"[QPanel Assets] Image budget: freed {count} images "
+              f"({_format.format_bytes(freed)})")
+    return None
+
+
+def _on_update(scene, updates):
+    used = []
+    for id_data, _geometry, _transform in updates:
+        if isinstance(id_data, bpy.types.Image):
+            used.append(id_data.as_pointer())
+        elif isinstance(id_data, bpy.types.Material):
+            _material_images.pop(id_data.as_pointer(), None)
+            used.extend(material_images(id_data))
+        elif isinstance(id_data, bpy.types.NodeTree):
+            # Node group edits may change the images of any material
+            _material_images.clear()
+    touch(used)
+
+    settings = _settings()
+    if settings is not None and settings.auto_budget:
+        # Debounced: one check after the updates settle
+        if bpy.app.timers.is_registered(_auto_check):
+            bpy.app.timers.unregister(_auto_check)
+        bpy.app.timers.register(_auto_check, first_interval=AUTO_DELAY)
+
+
+def _on_render(scene):
+    # Only listening while auto unload is on; a file load resets the setting
+    settings = _settings()
+    if settings is None or not settings.auto_budget:
+        return
+    visible = [obj for obj in scene.objects if obj.visible_get()]
+    for obj in visible:
+        for slot in obj.material_slots:
+            if slot.material is not None:
+                touch(material_images(slot.material))
+
+
+def clear():
+    _recent.clear()
+    _material_images.clear()
+
+
+def set_auto(enabled):
+    """Follow renders only while auto unload is enabled (walks every visible object)."""
+    if enabled:
+        _handlers.add_listener(on_render=_on_render)
+    else:
+        _handlers.remove_listener(on_render=_on_render)
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=clear)
+    settings = _settings()
+    if settings is not None and settings.auto_budget:
+        set_auto(True)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=clear, on_render=_on_render)
+    if bpy.app.timers.is_registered(_auto_check):
+        bpy.app.timers.unregister(_auto_check)
+    clear()
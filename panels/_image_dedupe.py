@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Duplicate Image Finder
+Groups byte-identical images by content hash
+
+Analysis runs as two background jobs (_background): the first stats every
+image file, the second only hashes files whose size matches another
+candidate (identical bytes need identical sizes), in parallel worker
+threads. Digests are cached per path and (mtime, size), so unchanged files
+are not read again on the next analysis. Packed images are hashed from
+their packed data, which is only copied (between the two jobs) when its
+size collides with another image. Images are grouped by digest, color
+space and alpha mode, since the same bytes read as color or as non-color
+data shade differently. Merging remaps every user of the duplicates to one
+datablock (ID.user_remap).
+"""
+
+import functools
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bpy
+
+from . import _background, _image_probe
+
+
+CHUNK_SIZE = 1024 * 1024
+
+_OWNER = "image_dedupe"
+
+_hash_cache = {}  # path -> ((mtime_ns, size), digest)
+_groups = None    # [[image name, ...], ...] from the last analysis, largest first
+_group_sizes = []  # bytes of one copy, per group
+
+
+def _hash_file(path):
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _hash_bytes(data):
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+def _stat_files(paths):
+    """Worker: {path: (mtime_ns, size) or None}."""
+    stats = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            stats[path] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stats[path] = None
+    return stats
+
+
+def _size_counts(files, packed_sizes, stats):
+    """{size: images of that size}, counted per image: datablocks loading the same file are duplicates too."""
+    counts = {}
+    for _name, path in files:
+        stat = stats[path]
+        if stat is not None:
+            counts[stat[1]] = counts.get(stat[1], 0) + 1
+    for _name, size in packed_sizes:
+        counts[size] = counts.get(size, 0) + 1
+    return counts
+
+
+def _analyze_job(files, packed, stats, cache):
+    """Worker: return ({image name: digest}, {path: cache entry}, {image name: size}).
+
+    files: [(image name, path)], packed: [(image name, size, bytes or None)],
+    stats: {path: (mtime_ns, size) or None} from _stat_files
+    """
+    counts = _size_counts(files, [(name, size) for name, size, _data in packed], stats)
+
+    digests = {}
+    new_cache = {}
+    to_hash = []
+    for path, stat in stats.items():
+        if stat is None or counts[stat[1]] < 2:
+            continue
+        cached = cache.get(path)
+        if cached is not None and cached[0] == stat:
+            digests[path] = cached[1]
+        else:
+            to_hash.append(path)
+
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=_background.MAX_WORKERS) as pool:
+            for path, digest in zip(to_hash, pool.map(_safe_hash_file, to_hash)):
+                if digest is not None:
+                    digests[path] = digest
+                    new_cache[path] = (stats[path], digest)
+
+    by_image = {}
+    sizes = {}
+    for name, path in files:
+        if path in digests:
+            by_image[name] = digests[path]
+            sizes[name] = stats[path][1]
+    for name, size, data in packed:
+        if data is not None:
+            by_image[name] = _hash_bytes(data)
+            sizes[name] = size
+    return by_image, new_cache, sizes
+
+
+def _safe_hash_file(path):
+    try:
+        return _hash_file(path)
+    except OSError:
+        return None
+
+
+def _settings(img):
+    """Settings that change how identical bytes shade: only images sharing them are merged."""
+    return img.colorspace_settings.name, img.alpha_mode
+
+
+def _store(settings, result):
+    global _groups, _group_sizes
+    by_image, new_cache, sizes = result
+    _hash_cache.update(new_cache)
+
+    by_content = {}
+    for name, digest in by_image.items():
+        by_content.setdefault((digest, settings.get(name)), []).append(name)
+    groups = [sorted(names) for names in by_content.values() if len(names) > 1]
+    # Most wasted memory first
+    groups.sort(key=lambda names: -sizes[names[0]] * (len(names) - 1))
+    _groups = groups
+    _group_sizes = [sizes[names[0]] for names in groups]
+
+
+def _submit_hashing(files, packed_sizes, settings, stats):
+    """Main thread, once the files are stat'ed: copy colliding packed data and hash."""
+    counts = _size_counts(files, packed_sizes, stats)
+    packed = []
+    for name, size in packed_sizes:
+        img = bpy.data.images.get(name)
+        # Packed data is bpy memory: only copied when its size could match
+        wanted = counts[size] > 1 and img is not None and img.packed_file is not None
+        packed.append((name, size, bytes(img.packed_file.data) if wanted else None))
+
+    cache = dict(_hash_cache)
+    _background.submit((_OWNER, "hash"), functools.partial(_store, settings),
+                       _analyze_job, files, packed, stats, cache)
+
+
+def analyze():
+    """Start a background analysis of bpy.data.images (no-op while one runs)."""
+    if is_running():
+        return
+    files = []
+    packed_sizes = []
+    settings = {}
+    for img in bpy.data.images:
+        settings[img.name] = _settings(img)
+        if img.packed_file is not None:
+            packed_sizes.append((img.name, img.packed_file.size))
+        else:
+            path = _image_probe.image_path(img)
+            if path:
+                files.append((img.name, path))
+
+    paths = sorted({path for _name, path in files})
+    _background.submit((_OWNER, "stat"), functools.partial(_submit_hashing, files, packed_sizes, settings),
+                       _stat_files, paths)
+
+
+def is_running():
+    return _background.pending_count(_OWNER) > 0
+
+
+def groups():
+    """Duplicate groups of the last analysis as [(size, [names])], or None."""
+    if _groups is None:
+        return None
+    return list(zip(_group_sizes, _groups))
+
+
+def merge_group(names):
+    """Remap every image of names to the one with the most users; return the count remapped."""
+    images = [bpy.data.images.get(name) for name in names]
+    images = [img for img in images if img is not None]
+    if len(images) < 2:
+        return 0
+    target = max(images, key=lambda img: (img.users, img.packed_file is None, -len(img.name)))
+    # Color space or alpha mode may have been edited since the analysis
+    images = [img for img in images if _settings(img) == _settings(target)]
+    for img in images:
+        if img != target:
+            img.user_remap(target)
+    return len(images) - 1
+
+
+def forget_group(index):
+    if _groups is not None and 0 <= index < len(_groups):
+        del _groups[index]
+        del _group_sizes[index]
+
+
+def clear():
+    global _groups, _group_sizes
+    _background.cancel(_OWNER)
+    _groups = None
+    _group_sizes = []
@@ -0,0 +1,314 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Image Header Probe
+Image dimensions, channels and bit depth without loading pixels
+
+Reading Image.size on an image that is not loaded makes Blender load the
+whole pixel buffer. Instead:
+- loaded images (has_data) report their own size/channels/depth
+- generated images report generated_width/height
+- file images are probed from the file header only (PNG, JPEG, OpenEXR,
+  TIFF, TGA parsers reading a few bytes to a few KB), in the shared
+  background pool, and cached per path + mtime + size
+- packed images are not probed (reading packed_file.data copies the file)
+"""
+
+import os
+import struct
+import time
+from collections import namedtuple
+
+import bpy
+
+from . import _background
+
+
+ImageInfo = namedtuple("ImageInfo", "width height channels bit_depth format")
+
+REVALIDATE_SECONDS = 5.0  # how often a cached probe re-checks the file's mtime
+
+_OWNER = "image_probe"
+
+_cache = {}  # path -> [(mtime_ns, size), ImageInfo or None, last check time]
+generation = 0  # bumped whenever a probe result changes, keys derived caches
+
+
+# Header parsers (file object in, ImageInfo or None out)
+
+def _read_exact(f, size):
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("truncated header")
+    return data
+
+
+_PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+
+
+def _probe_png(f):
+    header = _read_exact(f, 26)
+    if header[:8] != b"\x89PNG\r\n\x1a\n" or header[12:16] != b"IHDR":
+        return None
+    width, height, bit_depth, color_type = struct.unpack(">IIBB", header[16:26])
+    return ImageInfo(width, height, _PNG_CHANNELS.get(color_type, 4), bit_depth, 'PNG')
+
+
+# Start-of-frame markers (all but DHT, JPG and DAC in the C0-CF range)
+_JPEG_SOF = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _probe_jpeg(f):
+    if _read_exact(f, 2) != b"\xff\xd8":
+        return None
+    while True:
+        marker = _read_exact(f, 2)
+        while marker[0] == 0xFF and marker[1] == 0xFF:
+            # Fill bytes before a marker
+            marker = marker[1:] + _read_exact(f, 1)
+        if marker[0] != 0xFF:
+            return None
+        code = marker[1]
+        if code in (0xD8, 0x01) or 0xD0 <= code <= 0xD7:
+            continue
+        if code in (0xD9, 0xDA):
+            return None
+        length = struct.unpack(">H", _read_exact(f, 2))[0]
+        if code in _JPEG_SOF:
+            precision, height, width, components = struct.unpack(">BHHB", _read_exact(f, 6))
+            return ImageInfo(width, height, components, precision, 'JPEG')
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+_EXR_PIXEL_BITS = {0: 32, 1: 16, 2: 32}
+
+
+def _read_cstring(f, limit=256):
+    chars = bytearray()
+    while True:
+        char = _read_exact(f, 1)
+        if char == b"\0":
+            return bytes(chars)
+        chars += char
+        if len(chars) > limit:
+            raise ValueError("unterminated string")
+
+
+def _probe_exr(f):
+    if _read_exact(f, 4) != b"\x76\x2f\x31\x01":
+        return None
+    _read_exact(f, 4)  # version and flags
+
+    window = None
+    channels = []
+    while True:
+        name = _read_cstring(f)
+        if not name:
+            break
+        _type = _read_cstring(f)
+        size = struct.unpack("<i", _read_exact(f, 4))[0]
+        if name == b"dataWindow":
+            window = struct.unpack("<iiii", _read_exact(f, 16))
+            f.seek(size - 16, os.SEEK_CUR)
+        elif name == b"channels":
+            data = _read_exact(f, size)
+            position = 0
+            while position < len(data) and data[position] != 0:
+                end = data.index(b"\0", position)
+                pixel_type = struct.unpack_from("<i", data, end + 1)[0]
+                channels.append(_EXR_PIXEL_BITS.get(pixel_type, 32))
+                position = end + 1 + 16
+        else:
+            f.seek(size, os.SEEK_CUR)
+        if window is not None and channels:
+            break
+
+    if window is None:
+        return None
+    x_min, y_min, x_max, y_max = window
+    return ImageInfo(x_max - x_min + 1, y_max - y_min + 1, len(channels),
+                     max(channels, default=16), 'OPEN_EXR')
+
+
+_TIFF_TYPES = {3: "H", 4: "I", 16: "Q"}
+_TIFF_TAGS = {256: "width", 257: "height", 258: "bits", 277: "channels"}
+
+
+def _probe_tiff(f):
+    order = _read_exact(f, 2)
+    if order not in (b"II", b"MM"):
+        return None
+    endian = "<" if order == b"II" else ">"
+    magic = struct.unpack(endian + "H", _read_exact(f, 2))[0]
+    if magic == 42:
+        offset = struct.unpack(endian + "I", _read_exact(f, 4))[0]
+        count_code, field_code = "H", "I"
+    elif magic == 43:
+        _read_exact(f, 4)  # BigTIFF offset size and padding
+        offset = struct.unpack(endian + "Q", _read_exact(f, 8))[0]
+        count_code, field_code = "Q", "Q"
+    else:
+        return None
+
+    # IFD entry: tag, type, value count, then the value (or its offset)
+    field_size = struct.calcsize(field_code)
+    entry_size = 4 + 2 * field_size
+    f.seek(offset)
+    count = struct.unpack(endian + count_code, _read_exact(f, struct.calcsize(count_code)))[0]
+    count = min(count, 512)
+    entries = _read_exact(f, count * entry_size)
+
+    values = {}
+    for position in range(0, count * entry_size, entry_size):
+        tag, field_type, value_count = struct.unpack_from(endian + "HH" + field_code, entries, position)
+        if tag not in _TIFF_TAGS or field_type not in _TIFF_TYPES:
+            continue
+        code = _TIFF_TYPES[field_type]
+        value_position = position + 4 + field_size
+        # Only the first value is needed (bits per sample repeats per channel)
+        if value_count * struct.calcsize(code) <= field_size:
+            values[_TIFF_TAGS[tag]] = struct.unpack_from(endian + code, entries, value_position)[0]
+        else:
+            values[_TIFF_TAGS[tag]] = ("offset", struct.unpack_from(endian + field_code, entries, value_position)[0], code)
+
+    bits = values.get("bits", 1)
+    if isinstance(bits, tuple):
+        _marker, bits_offset, code = bits
+        f.seek(bits_offset)
+        bits = struct.unpack(endian + code, _read_exact(f, struct.calcsize(code)))[0]
+    if "width" not in values or "height" not in values:
+        return None
+    return ImageInfo(values["width"], values["height"], values.get("channels", 1), bits, 'TIFF')
+
+
+def _probe_tga(f):
+    header = _read_exact(f, 18)
+    image_type = header[2]
+    if image_type not in (1, 2, 3, 9, 10, 11):
+        return None
+    width, height, pixel_depth, descriptor = struct.unpack("<HHBB", header[12:18])
+    if image_type in (3, 11):
+        channels = 1
+    elif pixel_depth == 32 or descriptor & 0x0F:
+        channels = 4
+    else:
+        channels = 3
+    return ImageInfo(width, height, channels, 8, 'TARGA')
+
+
+_PARSERS = (_probe_png, _probe_jpeg, _probe_exr, _probe_tiff)
+_EXTENSION_PARSERS = {
+    ".png": _probe_png, ".jpg": _probe_jpeg, ".jpeg": _probe_jpeg,
+    ".exr": _probe_exr, ".tif": _probe_tiff, ".tiff": _probe_tiff, ".tga": _probe_tga,
+}
+
+
+def probe_file(path):
+    """Return the ImageInfo of an image file read from its header, or None."""
+    preferred = _EXTENSION_PARSERS.get(os.path.splitext(path)[1].lower())
+    parsers = ((preferred,) if preferred else ()) + tuple(p for p in _PARSERS if p is not preferred)
+    with open(path, "rb") as f:
+        for parser in parsers:
+            f.seek(0)
+            try:
+                info = parser(f)
+            except (ValueError, struct.error, OSError):
+                info = None
+            if info is not None:
+                return info
+    return None
+
+
+# Cached, asynchronous probing
+
+def _stat_key(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _probe_job(path, known_key):
+    """Worker: stat the file and parse its header when it changed."""
+    try:
+        key = _stat_key(path)
+    except OSError:
+        return path, None, None, False
+    if key == known_key:
+        return path, key, None, False
+    try:
+        return path, key, probe_file(path), True
+    except OSError:
+        return path, key, None, True
+
+
+def _store(result):
+    global generation
+    path, key, info, changed = result
+    entry = _cache.get(path)
+    if key is None:
+        if entry is None or entry[0] is not None:
+            generation += 1
+        _cache[path] = [None, None, time.monotonic()]
+    elif changed or entry is None:
+        _cache[path] = [key, info, time.monotonic()]
+        generation += 1
+    else:
+        entry[2] = time.monotonic()
+
+
+def probe_path(path):
+    """Return the cached ImageInfo of a file (None until probed); never blocks."""
+    entry = _cache.get(path)
+    if entry is None or time.monotonic() - entry[2] > REVALIDATE_SECONDS:
+        _background.submit((_OWNER, path), _store, _probe_job, path, entry[0] if entry else None)
+    return entry[1] if entry else None
+
+
+def is_pending(path):
+    return _background.is_pending((_OWNER, path))
+
+
+def file_size(path):
+    """On-disk size in bytes from the last probe of path, or None."""
+    entry = _cache.get(path)
+    if entry is None or entry[0] is None:
+        return None
+    return entry[0][1]
+
+
+def image_path(img):
+    """Absolute file path of an image datablock (first UDIM tile), or None."""
+    if img.source not in {'FILE', 'SEQUENCE', 'TILED'} or not img.filepath:
+        return None
+    path = bpy.path.abspath(img.filepath, library=img.library)
+    if img.source == 'TILED' and len(img.tiles):
+        path = path.replace("<UDIM>", str(img.tiles[0].number))
+    return os.path.normpath(path)
+
+
+def image_info(img):
+    """ImageInfo of an image datablock without loading its pixels (None if unknown yet)."""
+    if img.has_data:
+        width, height = img.size
+        channels = img.channels
+        return ImageInfo(width, height, channels, img.depth // max(channels, 1),
+                         img.file_format)
+    if img.source == 'GENERATED':
+        return ImageInfo(img.generated_width, img.generated_height, 4,
+                         32 if img.use_generated_float else 8, 'GENERATED')
+    if img.packed_file is not None:
+        return None
+    path = image_path(img)
+    return probe_path(path) if path else None
+
+
+_CHANNEL_NAMES = {1: "BW", 2: "BWA", 3: "RGB", 4: "RGBA"}
+
+
+def describe(info):
+    """Short text: 4096x4096 RGBA 16-bit"""
+    channels = _CHANNEL_NAMES.get(info.channels, f"{info.channels}ch")
+    return f"{info.width}x{info.height} {channels} {info.bit_depth}-bit"
+
+
+def clear():
+    _background.cancel(_OWNER)
+    _cache.clear()
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Image Metadata Table
+Cached per-image rows for the texture table (sort, filter, paginate)
+
+One row per image datablock, built from _image_probe (never loads pixels).
+The table is rebuilt when images are added, removed or updated, when new
+header probes arrive, and at most every REFRESH_SECONDS for values that
+change without an update event (user counts, loaded state). Sorted and
+filtered views are cached per (table, sort key, order, filter).
+"""
+
+import time
+
+import bpy
+
+from . import _handlers, _image_probe
+
+
+REFRESH_SECONDS = 2.0
+
+
+class ImageRow:
+    """Metadata of one image datablock."""
+
+    __slots__ = ("image", "name", "name_lower", "info", "width", "height",
+                 "memory", "disk", "users", "packed", "loaded", "state")
+
+    def __init__(self, img):
+        self.image = img
+        self.name = img.name
+        self.name_lower = self.name.lower()
+        self.info = _image_probe.image_info(img)
+        self.width = self.info.width if self.info else 0
+        self.height = self.info.height if self.info else 0
+        self.memory = estimate_memory(self.info)
+        self.users = img.users
+        self.packed = img.packed_file is not None
+        self.loaded = img.has_data
+        if self.packed:
+            self.disk = img.packed_file.size
+        else:
+            path = _image_probe.image_path(img)
+            self.disk = _image_probe.file_size(path) if path else None
+        # Sort key of the state column: packed, then loaded, then on disk only
+        self.state = (self.packed, self.loaded)
+
+
+def estimate_memory(info):
+    """Bytes of Blender's pixel buffer for an image (width x height x channels x bytes)."""
+    if info is None:
+        return 0
+    if info.bit_depth > 8:
+        # High bit depth images are kept as 32-bit float buffers
+        return info.width * info.height * info.channels * 4
+    # Byte buffers are always RGBA
+    return info.width * info.height * 4
+
+
+SORT_KEYS = {
+    'NAME': lambda row: row.name_lower,
+    'RESOLUTION': lambda row: (row.width * row.height, row.name_lower),
+    'MEMORY': lambda row: (row.memory, row.name_lower),
+    'DISK': lambda row: (row.disk or 0, row.name_lower),
+    'USERS': lambda row: (row.users, row.name_lower),
+    'STATE': lambda row: (row.state, row.name_lower),
+}
+
+_rows = None        # [ImageRow]
+_rows_key = None    # (image count, probe generation, dirty generation)
+_rows_time = 0.0
+_rows_version = 0   # bumped on every rebuild, keys the view cache
+_dirty = 0          # bumped by image add/remove/update events
+_view = None        # ((rows version, sort, reverse, filter), [ImageRow])
+
+
+def rows():
+    """All image rows, rebuilt only when the table is stale."""
+    global _rows, _rows_key, _rows_time, _rows_version
+    key = (len(bpy.data.images), _image_probe.generation, _dirty)
+    now = time.monotonic()
+    if _rows is None or key != _rows_key or now - _rows_time > REFRESH_SECONDS:
+        _rows = [ImageRow(img) for img in bpy.data.images]
+        _rows_key = key
+        _rows_time = now
+        _rows_version += 1
+    return _rows
+
+
+def view(sort_by='NAME', reverse=False, name_filter=""):
+    """Rows filtered by name and sorted (cached until the table changes)."""
+    global _view
+    table = rows()
+    query = name_filter.lower()
+    key = (_rows_version, sort_by, reverse, query)
+    if _view is not None and _view[0] == key:
+        return _view[1]
+
+    result = [row for row in table if query in row.name_lower] if query else list(table)
+    result.sort(key=SORT_KEYS.get(sort_by, SORT_KEYS['NAME']), reverse=reverse)
+    _view = (key, result)
+    return result
+
+
+def invalidate():
+    global _dirty, _rows, _view
+    _dirty += 1
+    _rows = None
+    _view = None
+
+
+def _on_update(scene, updates):
+    if _rows is not None and any(isinstance(id_data, bpy.types.Image) for id_data, _g, _t in updates):
+        invalidate()
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=invalidate)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=invalidate)
+    invalidate()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Static Panel Index
+Reads panel metadata from module sources with ast (never imports bpy)
+
+The index is generated at release time by scripts/build_panel_index.py and
+shipped as panels/panel_index.json. At runtime registration and the Panel
+Selector read it instead of scanning and importing every module.
+
+Files are read through the module loader and listed with pkgutil, so the
+same code works from a directory and from the release ZIP (zipimport).
+"""
+
+import ast
+import hashlib
+import json
+import os
+import pkgutil
+
+
+INDEX_FILENAME = "panel_index.json"
+INDEX_FORMAT = 1
+
+CLASS_ATTRIBUTES = (
+    "bl_idname",
+    "bl_label",
+    "bl_space_type",
+    "bl_region_type",
+    "bl_qpanel_category",
+)
+
+
+def _base_name(node):
+    """Return the bare name of a class base (Panel for bpy.types.Panel)."""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return None
+
+
+def scan_source(source, filename="<panel>"):
+    """List the classes defined at module level in a panel module source.
+
+    Each class is a dict with its name, base type, the constant bl_*
+    attributes listed in CLASS_ATTRIBUTES and whether it defines poll().
+    """
+    tree = ast.parse(source, filename=filename)
+
+    classes = []
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+
+        bases = [_base_name(base) for base in node.bases]
+        info = {
+            "class_name": node.name,
+            "type": next((name for name in bases if name), None),
+            "has_poll": False,
+        }
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef) and item.name == "poll":
+                info["has_poll"] = True
+            elif (isinstance(item, ast.Assign)
+                  and len(item.targets) == 1
+                  and isinstance(item.targets[0], ast.Name)
+                  and item.targets[0].id in CLASS_ATTRIBUTES
+                  and isinstance(item.value, ast.Constant)):
+                info[item.targets[0].id] = item.value.value
+        classes.append(info)
+    return classes
+
+
+def read_bytes(panels_dir, filename):
+    """Read a file of the panels package, from a directory or a ZIP archive."""
+    return __loader__.get_data(os.path.join(str(panels_dir), filename))
+
+
+def _iter_module_names(panels_dir):
+    for module_info in pkgutil.iter_modules([str(panels_dir)]):
+        if not module_info.ispkg:
+            yield module_info.name
+
+
+def module_names(panels_dir):
+    """Return the names of all panel modules (private files are skipped)."""
+    return sorted(name for name in _iter_module_names(panels_dir)
+                  if not name.startswith("_"))
+
+
+def shared_module_names(panels_dir):
+    """Return the names of the private helper modules (_*.py)."""
+    return sorted(name for name in _iter_module_names(panels_dir)
+                  if name.startswith("_"))
+
+
+def source_hash(panels_dir, name):
+    """SHA256 of a module's source bytes as the loader reads them."""
+    return hashlib.sha256(read_bytes(panels_dir, f"{name}.py")).hexdigest()
+
+
+def source_hashes(panels_dir):
+    """({panel module: sha256}, {helper module: sha256}) of the files on disk, without parsing."""
+    return ({name: source_hash(panels_dir, name) for name in module_names(panels_dir)},
+            {name: source_hash(panels_dir, name) for name in shared_module_names(panels_dir)})
+
+
+def build_index(panels_dir):
+    """Parse every panel module and return the index dict.
+
+    Private helper modules are not parsed; only their SHA256 is recorded
+    so a reload can tell when shared code changed.
+    """
+    modules = {}
+    for name in module_names(panels_dir):
+        data = read_bytes(panels_dir, f"{name}.py")
+        modules[name] = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "classes": scan_source(data.decode("utf-8"), filename=f"{name}.py"),
+        }
+
+    shared = {name: source_hash(panels_dir, name) for name in shared_module_names(panels_dir)}
+    return {"format": INDEX_FORMAT, "modules": modules, "shared": shared}
+
+
+def dumps(index):
+    """Serialize an index the way it is written to disk."""
+    return json.dumps(index, indent=2, sort_keys=True, ensure_ascii=False) + "\n"
+
+
+def load_index(panels_dir):
+    """Load the prebuilt index, or None if missing or in an unknown format."""
+    try:
+        index = json.loads(read_bytes(panels_dir, INDEX_FILENAME).decode("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if index.get("format") != INDEX_FORMAT:
+        return None
+    return index
+
+
+def panel_entries(index):
+    """Yield (module name, class info) for every Panel class in the index."""
+    for module_name, entry in sorted(index["modules"].items()):
+        for info in entry["classes"]:
+            if info["type"] == "Panel" and "bl_idname" in info:
+                yield module_name, info
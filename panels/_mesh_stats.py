@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Mesh Statistics
+Vectorized mesh analysis (foreach_get into NumPy arrays), cached per mesh
+
+One pass of foreach_get per attribute gives triangle count, tri/quad/n-gon
+breakdown, loose vertices and edges, bounding box, surface area and an
+estimate of the mesh's memory. Results are cached per mesh datablock and
+dropped when the depsgraph reports a geometry change for it, so a mesh is
+analyzed once, not per redraw.
+
+Evaluated (post-modifier) counts are read from the evaluated depsgraph
+object on request and cached per object until the next depsgraph update
+of that object. In Edit Mode the base counts come from bmesh, since the
+mesh datablock is only synced when leaving Edit Mode.
+"""
+
+import bmesh
+import numpy as np
+
+import bpy
+
+from . import _handlers
+
+
+# Bytes per element of mesh attribute data types
+_ATTRIBUTE_SIZES = {
+    'FLOAT': 4, 'INT': 4, 'FLOAT_VECTOR': 12, 'FLOAT_COLOR': 16, 'BYTE_COLOR': 4,
+    'BOOLEAN': 1, 'FLOAT2': 8, 'INT8': 1, 'INT32_2D': 8, 'QUATERNION': 16,
+    'FLOAT4X4': 64, 'STRING': 8,
+}
+
+_stats = {}      # mesh pointer -> dict
+_evaluated = {}  # object pointer -> (vertices, edges, faces, triangles)
+
+
+def _get(collection, attribute, count, dtype, width=1):
+    data = np.empty(count * width, dtype=dtype)
+    collection.foreach_get(attribute, data)
+    return data
+
+
+def _memory(mesh, counts):
+    """Topology arrays plus every extra attribute layer, in bytes."""
+    vertices, edges, faces, loops = counts
+    total = vertices * 12 + edges * 8 + loops * 8 + (faces + 1) * 4
+    domains = {'POINT': vertices, 'EDGE': edges, 'FACE': faces, 'CORNER': loops}
+    for attribute in mesh.attributes:
+        # Positions and internal topology layers are counted above
+        if attribute.name == "position" or attribute.name.startswith("."):
+            continue
+        total += domains.get(attribute.domain, 0) * _ATTRIBUTE_SIZES.get(attribute.data_type, 4)
+    return total
+
+
+def analyze(mesh):
+    """Compute the statistics of a mesh datablock (no cache)."""
+    vertices = len(mesh.vertices)
+    edges = len(mesh.edges)
+    faces = len(mesh.polygons)
+    loops = len(mesh.loops)
+
+    stats = {
+        'vertices': vertices,
+        'edges': edges,
+        'faces': faces,
+        'triangles': 0,
+        'tris': 0,
+        'quads': 0,
+        'ngons': 0,
+        'loose_vertices': vertices,
+        'loose_edges': edges,
+        'bbox_min': (0.0, 0.0, 0.0),
+        'bbox_max': (0.0, 0.0, 0.0),
+        'area': 0.0,
+        'memory': _memory(mesh, (vertices, edges, faces, loops)),
+    }
+
+    if vertices:
+        co = _get(mesh.vertices, "co", vertices, np.float32, 3).reshape(vertices, 3)
+        stats['bbox_min'] = tuple(co.min(axis=0).tolist())
+        stats['bbox_max'] = tuple(co.max(axis=0).tolist())
+
+    if faces:
+        sides = _get(mesh.polygons, "loop_total", faces, np.int32)
+        stats['triangles'] = int(sides.sum(dtype=np.int64)) - 2 * faces
+        stats['tris'] = int(np.count_nonzero(sides == 3))
+        stats['quads'] = int(np.count_nonzero(sides == 4))
+        stats['ngons'] = faces - stats['tris'] - stats['quads']
+        stats['area'] = float(_get(mesh.polygons, "area", faces, np.float32).sum(dtype=np.float64))
+
+    if edges:
+        edge_vertices = _get(mesh.edges, "vertices", edges, np.int32, 2)
+        used = np.zeros(vertices, dtype=bool)
+        used[edge_vertices] = True
+        stats['loose_vertices'] = vertices - int(np.count_nonzero(used))
+
+        if loops:
+            used = np.zeros(edges, dtype=bool)
+            used[_get(mesh.loops, "edge_index", loops, np.int32)] = True
+            stats['loose_edges'] = edges - int(np.count_nonzero(used))
+
+    return stats
+
+
+def mesh_stats(mesh):
+    """Cached statistics of a mesh datablock."""
+    key = mesh.as_pointer()
+    stats = _stats.get(key)
+    if stats is None:
+        stats = _stats[key] = analyze(mesh)
+    return stats
+
+
+def base_counts(obj):
+    """(vertices, edges, faces) of a mesh object, from bmesh in Edit Mode."""
+    if obj.mode == 'EDIT':
+        bm = bmesh.from_edit_mesh(obj.data)
+        return len(bm.verts), len(bm.edges), len(bm.faces)
+    mesh = obj.data
+    return len(mesh.vertices), len(mesh.edges), len(mesh.polygons)
+
+
+def evaluated_counts(obj, depsgraph):
+    """(vertices, edges, faces, triangles) after modifiers, cached per object."""
+    key = obj.as_pointer()
+    counts = _evaluated.get(key)
+    if counts is None:
+        obj_eval = obj.evaluated_get(depsgraph)
+        mesh = obj_eval.to_mesh()
+        try:
+            faces = len(mesh.polygons)
+            counts = (len(mesh.vertices), len(mesh.edges), faces, len(mesh.loops) - 2 * faces)
+        finally:
+            obj_eval.to_mesh_clear()
+        _evaluated[key] = counts
+    return counts
+
+
+def _on_update(scene, updates):
+    if not (_stats or _evaluated):
+        return
+    for id_data, geometry, _transform in updates:
+        if isinstance(id_data, bpy.types.Mesh):
+            _stats.pop(id_data.as_pointer(), None)
+        elif geometry and isinstance(id_data, bpy.types.Object) and id_data.type == 'MESH':
+            # Modifier edits and changed dependencies are geometry updates too
+            _evaluated.pop(id_data.as_pointer(), None)
+            _stats.pop(id_data.data.as_pointer(), None)
+
+
+def clear():
+    _stats.clear()
+    _evaluated.clear()
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=clear)
+    clear()
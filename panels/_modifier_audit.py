@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Scene Modifier Audit
+Every modifier of the scene in compact column arrays
+
+The table is built once per scene into typed arrays (array module), one
+slot per modifier: object index, viewport/render levels, visibility flags
+and estimated output faces in viewport and render. Depsgraph geometry
+updates rewrite the slots of the updated object in place; objects added
+or removed, or a stack whose length changed, trigger one rebuild on the
+next draw. Totals per modifier type and sorted views are cached per table
+version.
+
+Output estimates multiply the object's base face count through the stack
+(subdivision x4 per level, array count, mirror axes...); they size the
+problem, they are not exact counts.
+"""
+
+from array import array
+
+import bpy
+
+from . import _handlers, _modifier_index
+
+
+FLAG_VIEWPORT = 1
+FLAG_RENDER = 2
+
+
+def _factor(mod, render):
+    """Rough face multiplier of a modifier."""
+    kind = mod.type
+    if kind in {'SUBSURF', 'MULTIRES'}:
+        return 4.0 ** _modifier_index.modifier_levels(mod, render)
+    if kind == 'ARRAY':
+        return float(mod.count) if mod.fit_type == 'FIXED_COUNT' else 1.0
+    if kind == 'MIRROR':
+        return 2.0 ** sum(mod.use_axis)
+    if kind == 'SOLIDIFY':
+        return 2.0
+    if kind == 'DECIMATE' and mod.decimate_type == 'COLLAPSE':
+        return mod.ratio
+    return 1.0
+
+
+def _base_faces(obj):
+    return len(obj.data.polygons) if obj.type == 'MESH' and obj.data is not None else 0
+
+
+class ModifierAudit:
+    """Column arrays of every modifier in a scene."""
+
+    def __init__(self, scene):
+        self.scene_key = scene.as_pointer()
+        self.version = 0
+        self._totals = None  # (version, totals)
+        self._view = None    # ((version, sort, reverse, query), rows)
+        self.build(scene)
+
+    def build(self, scene):
+        self.objects = []      # object per object index
+        self.object_rows = {}  # object pointer -> (first row, row count)
+        self.names = []        # modifier name per row
+        self.types = []        # modifier type per row (interned strings)
+        self.object_index = array('I')
+        self.viewport_levels = array('i')
+        self.render_levels = array('i')
+        self.flags = array('B')
+        self.viewport_faces = array('d')
+        self.render_faces = array('d')
+        self.object_count = len(scene.objects)
+        self.dirty = False
+
+        for obj in scene.objects:
+            count = len(obj.modifiers)
+            if not count:
+                continue
+            self.object_rows[obj.as_pointer()] = (len(self.names), count)
+            index = len(self.objects)
+            self.objects.append(obj)
+            for _ in range(count):
+                self.names.append("")
+                self.types.append("")
+            self.object_index.extend([index] * count)
+            self.viewport_levels.extend([0] * count)
+            self.render_levels.extend([0] * count)
+            self.flags.extend([0] * count)
+            self.viewport_faces.extend([0.0] * count)
+            self.render_faces.extend([0.0] * count)
+            self._fill(obj, self.object_rows[obj.as_pointer()][0])
+        self.version += 1
+
+    def _fill(self, obj, first):
+        """Write the rows of one object's stack starting at slot first."""
+        base = _base_faces(obj)
+        viewport = render = float(base)
+        for row, mod in enumerate(obj.modifiers, first):
+            self.names[row] = mod.name
+            self.types[row] = mod.type
+            self.viewport_levels[row] = _modifier_index.modifier_levels(mod, False)
+            self.render_levels[row] = _modifier_index.modifier_levels(mod, True)
+            flags = 0
+            if mod.show_viewport:
+                flags |= FLAG_VIEWPORT
+                viewport *= _factor(mod, False)
+            if mod.show_render:
+                flags |= FLAG_RENDER
+                render *= _factor(mod, True)
+            self.flags[row] = flags
+            self.viewport_faces[row] = viewport
+            self.render_faces[row] = render
+
+    def update_object(self, obj):
+        rows = self.object_rows.get(obj.as_pointer())
+        count = len(obj.modifiers)
+        if rows is None:
+            if count:
+                self.dirty = True
+            return
+        if rows[1] != count:
+            self.dirty = True
+            return
+        self._fill(obj, rows[0])
+        self.version += 1
+
+    def __len__(self):
+        return len(self.names)
+
+    def object_name(self, row):
+        return self.objects[self.object_index[row]].name
+
+    def totals(self):
+        """{type: (modifiers, render output faces)} (cached per version)."""
+        cached = self._totals
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+        totals = {}
+        faces = self.render_faces
+        for row, kind in enumerate(self.types):
+            count, total = totals.get(kind, (0, 0.0))
+            totals[kind] = (count + 1, total + faces[row])
+        self._totals = (self.version, totals)
+        return totals
+
+    def view(self, sort_by='RENDER_FACES', reverse=True, query=""):
+        """Row numbers filtered by object/modifier/type text and sorted (cached)."""
+        key = (self.version, sort_by, reverse, query)
+        cached = self._view
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        rows = range(len(self.names))
+        if query:
+            query = query.lower()
+            rows = [row for row in rows
+                    if query in self.names[row].lower() or query in self.types[row].lower()
+                    or query in self.object_name(row).lower()]
+        columns = {
+            'OBJECT': lambda row: self.object_name(row).lower(),
+            'TYPE': lambda row: self.types[row],
+            'VIEWPORT_LEVELS': self.viewport_levels.__getitem__,
+            'RENDER_LEVELS': self.render_levels.__getitem__,
+            'VIEWPORT_FACES': self.viewport_faces.__getitem__,
+            'RENDER_FACES': self.render_faces.__getitem__,
+        }
+        result = sorted(rows, key=columns.get(sort_by, columns['RENDER_FACES']), reverse=reverse)
+        self._view = (key, result)
+        return result
+
+
+_audit = None
+
+
+def get_audit(scene):
+    """The scene's audit table, built on first use and rebuilt when stale."""
+    global _audit
+    if (_audit is None or _audit.scene_key != scene.as_pointer()
+            or _audit.dirty or _audit.object_count != len(scene.objects)):
+        if _audit is not None and _audit.scene_key == scene.as_pointer():
+            _audit.build(scene)
+        else:
+            _audit = ModifierAudit(scene)
+    return _audit
+
+
+def _on_update(scene, updates):
+    if _audit is None or _audit.scene_key != scene.as_pointer():
+        return
+    for id_data, geometry, _transform in updates:
+        if geometry and isinstance(id_data, bpy.types.Object):
+            _audit.update_object(id_data)
+
+
+def invalidate():
+    global _audit
+    _audit = None
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=invalidate)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=invalidate)
+    invalidate()
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Modifier Type Index
+Object → {modifier type: modifier name}, shared by the physics panels
+
+Panels that look for one modifier type (cloth, collision, fluid...) ask
+the index instead of scanning ob.modifiers on every poll and draw. An
+object's entry is built on first lookup and dropped when the depsgraph
+reports a geometry update for the object (adding, removing, reordering or
+editing modifiers are geometry updates). Entries also record the stack
+length, and a looked-up name must still resolve to a modifier of that
+type, so a stale entry is rebuilt instead of returning a wrong modifier.
+
+Names are stored instead of modifier references: a removed modifier's
+Python wrapper must not be touched.
+
+modifier_levels() reads the level-like setting of one modifier, shared by
+the modifier profiler and the modifier audit.
+"""
+
+import bpy
+
+from . import _handlers
+
+
+_index = {}  # object pointer -> (modifier count, {type: first modifier name of that type})
+
+
+def _build(obj):
+    types = {}
+    for mod in obj.modifiers:
+        types.setdefault(mod.type, mod.name)
+    entry = _index[obj.as_pointer()] = (len(obj.modifiers), types)
+    return entry
+
+
+def _entry(obj):
+    entry = _index.get(obj.as_pointer())
+    if entry is None or entry[0] != len(obj.modifiers):
+        entry = _build(obj)
+    return entry
+
+
+def modifier_of_type(obj, kind):
+    """First modifier of obj with type kind, or None."""
+    name = _entry(obj)[1].get(kind)
+    if name is None:
+        return None
+    mod = obj.modifiers.get(name)
+    if mod is None or mod.type != kind:
+        # Renamed or replaced since the entry was built
+        name = _build(obj)[1].get(kind)
+        mod = obj.modifiers.get(name) if name is not None else None
+    return mod
+
+
+def modifier_levels(mod, render):
+    """Level-like setting of a modifier (-1 when it has none)."""
+    if mod.type in {'SUBSURF', 'MULTIRES'}:
+        return mod.render_levels if render else mod.levels
+    if mod.type == 'ARRAY' and mod.fit_type == 'FIXED_COUNT':
+        return mod.count
+    if mod.type == 'SCREW':
+        return mod.render_steps if render else mod.steps
+    return -1
+
+
+def _on_update(scene, updates):
+    if not _index:
+        return
+    for id_data, geometry, _transform in updates:
+        if geometry and isinstance(id_data, bpy.types.Object):
+            _index.pop(id_data.as_pointer(), None)
+
+
+def clear():
+    _index.clear()
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=clear)
+    clear()
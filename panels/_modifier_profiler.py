@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Modifier Profiler
+Evaluation time and added geometry per modifier of an object
+
+The stack is measured cumulatively: all viewport modifiers are disabled,
+then re-enabled one at a time in stack order. After each step the object
+is tagged and depsgraph.update() is timed (best of a few runs), and the
+evaluated mesh is counted. A modifier's cost is the difference to the
+previous step. Viewport visibility is restored afterwards.
+
+Results are cached per object until its stack changes (modifiers added,
+removed, reordered, renamed or toggled, or their viewport levels, array
+count or screw steps edited).
+"""
+
+import time
+
+from . import _handlers, _modifier_index
+
+
+REPEATS = 3
+
+_results = {}  # object pointer -> (stack signature, {modifier name: (ms, vertices, faces)})
+
+
+def stack_signature(obj):
+    # Levels change the cost as much as the stack itself
+    return tuple((mod.name, mod.type, mod.show_viewport,
+                  _modifier_index.modifier_levels(mod, False))
+                 for mod in obj.modifiers)
+
+
+def _evaluated_counts(obj, depsgraph):
+    obj_eval = obj.evaluated_get(depsgraph)
+    try:
+        mesh = obj_eval.to_mesh()
+    except RuntimeError:
+        return 0, 0
+    try:
+        if mesh is None:
+            return 0, 0
+        return len(mesh.vertices), len(mesh.polygons)
+    finally:
+        obj_eval.to_mesh_clear()
+
+
+def _measure(obj, depsgraph, repeats):
+    """Best evaluation time of obj in ms, and its evaluated (vertices, faces)."""
+    best = None
+    for _ in range(repeats):
+        obj.update_tag(refresh={'DATA'})
+        start = time.perf_counter()
+        depsgraph.update()
+        elapsed = (time.perf_counter() - start) * 1000.0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, _evaluated_counts(obj, depsgraph)
+
+
+def profile(context, obj, repeats=REPEATS):
+    """Time every viewport-enabled modifier of obj; return {name: (ms, vertices, faces)}."""
+    depsgraph = context.evaluated_depsgraph_get()
+    modifiers = list(obj.modifiers)
+    enabled = [mod.show_viewport for mod in modifiers]
+    results = {}
+    try:
+        for mod in modifiers:
+            mod.show_viewport = False
+        previous_time, (previous_vertices, previous_faces) = _measure(obj, depsgraph, repeats)
+
+        for mod, was_enabled in zip(modifiers, enabled):
+            if not was_enabled:
+                continue
+            mod.show_viewport = True
+            elapsed, (vertices, faces) = _measure(obj, depsgraph, repeats)
+            results[mod.name] = (max(0.0, elapsed - previous_time),
+                                 vertices - previous_vertices, faces - previous_faces)
+            previous_time, previous_vertices, previous_faces = elapsed, vertices, faces
+    finally:
+        for mod, was_enabled in zip(modifiers, enabled):
+            mod.show_viewport = was_enabled
+        obj.update_tag(refresh={'DATA'})
+        depsgraph.update()
+
+    _results[obj.as_pointer()] = (stack_signature(obj), results)
+    return results
+
+
+def results(obj):
+    """Cached results for obj, or None when never profiled or the stack changed."""
+    cached = _results.get(obj.as_pointer())
+    if cached is None or cached[0] != stack_signature(obj):
+        return None
+    return cached[1]
+
+
+def clear():
+    _results.clear()
+
+
+def register():
+    _handlers.add_listener(on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_reset=clear)
+    clear()
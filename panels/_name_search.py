@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Name Search Index
+Incremental prefix/substring index over datablock names (no bpy)
+
+Names are stored lowercased in a sorted array (bisect prefix lookups) and
+in a trigram -> keys map. A substring query of three or more characters
+intersects the trigram sets of the query and only verifies those
+candidates; shorter queries scan the cached name strings. Adding,
+renaming or removing a name touches only that name's entries.
+"""
+
+import bisect
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NameSearchIndex:
+    """Case-insensitive name index keyed by any hashable key."""
+
+    def __init__(self, items=()):
+        self.names = {}      # key -> lowercase name
+        self.sorted = []     # [(lowercase name, key)]
+        self.trigrams = {}   # trigram -> set of keys
+        self.rebuild(items)
+
+    def rebuild(self, items):
+        """Index (key, name) pairs from scratch."""
+        self.names = {key: name.lower() for key, name in items}
+        self.sorted = sorted((name, key) for key, name in self.names.items())
+        self.trigrams = {}
+        for key, name in self.names.items():
+            for trigram in _trigrams(name):
+                self.trigrams.setdefault(trigram, set()).add(key)
+
+    def __len__(self):
+        return len(self.names)
+
+    def add(self, key, name):
+        """Add a name, or update it after a rename."""
+        name = name.lower()
+        old = self.names.get(key)
+        if old == name:
+            return
+        if old is not None:
+            self.remove(key)
+
+        self.names[key] = name
+        bisect.insort(self.sorted, (name, key))
+        for trigram in _trigrams(name):
+            self.trigrams.setdefault(trigram, set()).add(key)
+
+    def remove(self, key):
+        name = self.names.pop(key, None)
+        if name is None:
+            return
+
+        position = bisect.bisect_left(self.sorted, (name, key))
+        if position < len(self.sorted) and self.sorted[position] == (name, key):
+            del self.sorted[position]
+        for trigram in _trigrams(name):
+            keys = self.trigrams.get(trigram)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.trigrams[trigram]
+
+    def prefix(self, query):
+        """Return the keys whose name starts with query."""
+        query = query.lower()
+        entries = self.sorted
+        position = bisect.bisect_left(entries, (query,))
+        keys = []
+        # Walk by index: slicing would copy the whole tail of the list
+        while position < len(entries) and entries[position][0].startswith(query):
+            keys.append(entries[position][1])
+            position += 1
+        return keys
+
+    def search(self, query):
+        """Return the set of keys whose name contains query."""
+        query = query.lower()
+        if not query:
+            return set(self.names)
+
+        if len(query) < 3:
+            return {key for key, name in self.names.items() if query in name}
+
+        candidates = None
+        for trigram in sorted(_trigrams(query), key=lambda t: len(self.trigrams.get(t, ()))):
+            keys = self.trigrams.get(trigram)
+            if not keys:
+                return set()
+            candidates = set(keys) if candidates is None else candidates & keys
+            if not candidates:
+                return set()
+
+        # Trigrams match out of order too: verify the real substring
+        names = self.names
+        return {key for key in candidates if query in names[key]}
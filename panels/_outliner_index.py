@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Outliner Hierarchy Index
+Persistent parent -> children maps for the outliner panel
+
+Built once per scene, then kept current from depsgraph updates:
+- added objects and reparented/renamed objects move within sorted child
+  lists (bisect), no full sort
+- deletions (object count mismatch) unlink only the missing objects
+- collection changes rebuild the collection map only
+Renames made in the UI are caught through one msgbus subscription per
+indexed object name, and only those entries are re-linked on the next
+lookup. File load, undo and redo drop the
+index since object pointers may change.
+
+Name search indexes (_name_search) are built on first use by the filter
+field and then follow the same incremental updates.
+"""
+
+import bisect
+
+import bpy
+
+from . import _handlers
+from ._name_search import NameSearchIndex
+
+
+ICON_MAP = {
+    'MESH': 'OUTLINER_OB_MESH', 'CURVE': 'OUTLINER_OB_CURVE',
+    'SURFACE': 'OUTLINER_OB_SURFACE', 'META': 'OUTLINER_OB_META',
+    'FONT': 'OUTLINER_OB_FONT', 'ARMATURE': 'OUTLINER_OB_ARMATURE',
+    'LATTICE': 'OUTLINER_OB_LATTICE', 'EMPTY': 'OUTLINER_OB_EMPTY',
+    'LIGHT': 'OUTLINER_OB_LIGHT', 'CAMERA': 'OUTLINER_OB_CAMERA',
+    'SPEAKER': 'OUTLINER_OB_SPEAKER', 'CURVES': 'OUTLINER_OB_CURVES',
+    'POINTCLOUD': 'OUTLINER_OB_POINTCLOUD', 'VOLUME': 'OUTLINER_OB_VOLUME',
+    'GPENCIL': 'OUTLINER_OB_GREASEPENCIL',
+}
+
+ROOT = 0  # parent key of top-level objects
+
+
+class ObjectEntry:
+    """Cached per-object data needed to draw a row."""
+
+    __slots__ = ("obj", "name", "name_full", "parent", "icon")
+
+    def __init__(self, obj, parent):
+        self.obj = obj
+        self.name = obj.name
+        self.name_full = obj.name_full
+        self.parent = parent
+        self.icon = ICON_MAP.get(obj.type, 'OBJECT_DATA')
+
+
+class HierarchyIndex:
+    """Sorted parent -> children and collection -> children maps of a scene."""
+
+    def __init__(self, scene):
+        self.scene_key = scene.as_pointer()
+        self.objects = {}              # object pointer -> ObjectEntry
+        self.by_name = {}              # object name_full -> pointer
+        self.children = {}             # parent pointer (ROOT for top level) -> [(name, pointer)]
+        self.collection_children = {}  # collection pointer -> tuple of child collections
+        self.collection_parents = {}   # collection pointer -> parent collection pointer
+        self.collections = {}          # collection pointer -> collection
+        self.collections_dirty = True
+        self.generation = 0            # bumped on every change, keys derived caches
+        self._object_search = None
+        self._collection_search = None
+        self.rebuild(scene)
+
+    # Building
+
+    def rebuild(self, scene):
+        """Index every object of the scene (one pass, one sort per parent)."""
+        self.objects.clear()
+        self.by_name.clear()
+        self.children.clear()
+
+        parents = {}
+        for obj in scene.objects:
+            pointer = obj.as_pointer()
+            parent = obj.parent
+            parents[pointer] = parent.as_pointer() if parent is not None else ROOT
+            entry = self.objects[pointer] = ObjectEntry(obj, ROOT)
+            self.by_name[entry.name_full] = pointer
+            _subscribe(obj)
+
+        for pointer, entry in self.objects.items():
+            parent = parents[pointer]
+            # Parents outside this scene: show the object at top level
+            entry.parent = parent if parent in self.objects else ROOT
+            self.children.setdefault(entry.parent, []).append((entry.name, pointer))
+
+        for siblings in self.children.values():
+            siblings.sort()
+
+        self._object_search = None
+        self.collections_dirty = True
+        self.generation += 1
+
+    def _rebuild_collections(self, scene):
+        self.collection_children.clear()
+        self.collection_parents.clear()
+        self.collections.clear()
+        stack = [scene.collection]
+        while stack:
+            collection = stack.pop()
+            pointer = collection.as_pointer()
+            children = tuple(collection.children)
+            self.collection_children[pointer] = children
+            self.collections[pointer] = collection
+            for child in children:
+                self.collection_parents[child.as_pointer()] = pointer
+            stack.extend(children)
+        self._collection_search = None
+        self.collections_dirty = False
+        self.generation += 1
+
+    # Incremental updates
+
+    def _unlink(self, pointer, entry):
+        siblings = self.children.get(entry.parent)
+        if not siblings:
+            return
+        position = bisect.bisect_left(siblings, (entry.name, pointer))
+        if position < len(siblings) and siblings[position] == (entry.name, pointer):
+            del siblings[position]
+        if not siblings:
+            del self.children[entry.parent]
+
+    def _link(self, pointer, entry):
+        bisect.insort(self.children.setdefault(entry.parent, []), (entry.name, pointer))
+
+    def update_object(self, obj):
+        """Add an object or move it after a rename/reparent."""
+        pointer = obj.as_pointer()
+        parent = obj.parent
+        parent_pointer = parent.as_pointer() if parent is not None else ROOT
+        if parent_pointer not in self.objects:
+            parent_pointer = ROOT
+
+        entry = self.objects.get(pointer)
+        if entry is None:
+            entry = self.objects[pointer] = ObjectEntry(obj, None)
+        if entry.parent is None:
+            # New object, not linked under a parent yet
+            entry.parent = parent_pointer
+            self._link(pointer, entry)
+            self.by_name[entry.name_full] = pointer
+            _subscribe(obj)
+        elif entry.name != obj.name or entry.parent != parent_pointer:
+            self._unlink(pointer, entry)
+            if self.by_name.get(entry.name_full) == pointer:
+                del self.by_name[entry.name_full]
+            entry.name = obj.name
+            entry.name_full = obj.name_full
+            entry.parent = parent_pointer
+            self._link(pointer, entry)
+            self.by_name[entry.name_full] = pointer
+        else:
+            entry.icon = ICON_MAP.get(obj.type, 'OBJECT_DATA')
+            return
+
+        if self._object_search is not None:
+            self._object_search.add(pointer, entry.name)
+        self.generation += 1
+
+    def _remove(self, pointer):
+        entry = self.objects.pop(pointer)
+        if entry.parent is not None:
+            self._unlink(pointer, entry)
+        if self.by_name.get(entry.name_full) == pointer:
+            del self.by_name[entry.name_full]
+        if self._object_search is not None:
+            self._object_search.remove(pointer)
+        # Children of a removed parent move to the top level
+        for _name, child in self.children.pop(pointer, ()):
+            child_entry = self.objects[child]
+            child_entry.parent = ROOT
+            self._link(child, child_entry)
+
+    def sync_objects(self, scene):
+        """Drop entries of removed objects and add unseen ones (no sorting)."""
+        current = {obj.as_pointer(): obj for obj in scene.objects}
+        for pointer in [pointer for pointer in self.objects if pointer not in current]:
+            self._remove(pointer)
+        added = [obj for pointer, obj in current.items() if pointer not in self.objects]
+        for obj in added:
+            self.objects[obj.as_pointer()] = ObjectEntry(obj, None)
+        for obj in added:
+            self.update_object(obj)
+        self.generation += 1
+
+    def sync_names(self, pointers):
+        """Re-link the entries of pointers, renamed outside depsgraph updates."""
+        for pointer in pointers:
+            entry = self.objects.get(pointer)
+            if entry is None:
+                continue
+            try:
+                renamed = entry.obj.name != entry.name
+            except ReferenceError:
+                # Removed: dropped by the next count check
+                continue
+            if renamed:
+                self.update_object(entry.obj)
+
+    def apply_updates(self, scene, updates):
+        updated = []
+        for id_data, _geometry, _transform in updates:
+            if isinstance(id_data, bpy.types.Object):
+                updated.append(id_data)
+            elif isinstance(id_data, (bpy.types.Collection, bpy.types.Scene)):
+                self.collections_dirty = True
+
+        # Create entries first so children added with their parent find it
+        for obj in updated:
+            pointer = obj.as_pointer()
+            if pointer not in self.objects:
+                self.objects[pointer] = ObjectEntry(obj, None)
+        for obj in updated:
+            self.update_object(obj)
+
+        # Deleted objects (or objects added to excluded collections) never
+        # show up in updates: a count mismatch means entries are stale
+        if len(scene.objects) != len(self.objects):
+            self.sync_objects(scene)
+
+    # Queries (no sorting, no scene scans)
+
+    def child_entries(self, parent=ROOT, start=0):
+        """Yield (pointer, ObjectEntry) of a parent's children from position start, sorted by name."""
+        objects = self.objects
+        siblings = self.children.get(parent, ())
+        for position in range(start, len(siblings)):
+            pointer = siblings[position][1]
+            yield pointer, objects[pointer]
+
+    def has_children(self, pointer):
+        return pointer in self.children
+
+    def lookup(self, name_full):
+        """Return (pointer, ObjectEntry) for an object name, or (None, None)."""
+        pointer = self.by_name.get(name_full)
+        if pointer is None:
+            return None, None
+        return pointer, self.objects[pointer]
+
+    def descendants(self, pointer):
+        """Yield the ObjectEntry of every object parented below pointer."""
+        stack = [pointer]
+        while stack:
+            for _name, child in self.children.get(stack.pop(), ()):
+                yield self.objects[child]
+                stack.append(child)
+
+    def object_search(self):
+        """Name search index over the indexed objects (built on first use)."""
+        if self._object_search is None:
+            self._object_search = NameSearchIndex(
+                (pointer, entry.name) for pointer, entry in self.objects.items())
+        return self._object_search
+
+    def collection_search(self, scene):
+        """Name search index over the scene's collections (built on first use)."""
+        if self.collections_dirty:
+            self._rebuild_collections(scene)
+        if self._collection_search is None:
+            root = scene.collection.as_pointer()
+            self._collection_search = NameSearchIndex(
+                (pointer, collection.name) for pointer, collection in self.collections.items()
+                if pointer != root)
+        return self._collection_search
+
+    def collection_map(self, scene):
+        """Return {pointer: collection} of every collection in the scene."""
+        if self.collections_dirty:
+            self._rebuild_collections(scene)
+        return self.collections
+
+    def sub_collections(self, scene, collection):
+        if self.collections_dirty:
+            self._rebuild_collections(scene)
+        children = self.collection_children.get(collection.as_pointer())
+        if children is None:
+            self._rebuild_collections(scene)
+            children = self.collection_children.get(collection.as_pointer(), ())
+        return children
+
+
+_index = None
+_renamed = set()  # pointers of objects renamed since the last lookup
+_msgbus_owner = object()
+
+
+def _subscribe(obj):
+    bpy.msgbus.subscribe_rna(key=obj.path_resolve("name", False), owner=_msgbus_owner,
+                             args=(obj.as_pointer(),), notify=_on_rename)
+
+
+def _on_update(scene, updates):
+    if _index is not None and scene.as_pointer() == _index.scene_key:
+        _index.apply_updates(scene, updates)
+
+
+def _on_rename(pointer):
+    # UI renames may not reach the depsgraph handler; re-link on next lookup
+    _renamed.add(pointer)
+
+
+def invalidate():
+    """Drop the index; the next get_index() rebuilds it."""
+    global _index
+    _index = None
+
+
+def get_index(scene):
+    """Return the hierarchy index of a scene, building it on first use."""
+    global _index
+    if _index is None or _index.scene_key != scene.as_pointer():
+        # Subscriptions are made per object while the index is built
+        bpy.msgbus.clear_by_owner(_msgbus_owner)
+        _renamed.clear()
+        _index = HierarchyIndex(scene)
+    elif _renamed:
+        _index.sync_names(_renamed)
+        _renamed.clear()
+    return _index
+
+
+def register():
+    _handlers.add_listener(on_update=_on_update, on_reset=invalidate)
+
+
+def unregister():
+    _handlers.remove_listener(on_update=_on_update, on_reset=invalidate)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    invalidate()
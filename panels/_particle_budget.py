@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Particle Display Budget
+Fits the viewport display percentage of all particle systems to a budget
+
+The viewport cost of a particle settings datablock is the number of
+particles it displays over all its users (count, or count x display
+children) times, in polygon mode, the faces of its instance object or
+collection (when displayed as Rendered; other display methods draw
+points), counted from base mesh data when fitting. Costs are measured at
+the original display percentage.
+
+The budget is shared by water filling: every datablock may display up to
+the same cost level L, cheap ones keep their original percentage, and L
+is raised until the budget is spent. Percentages never go below 1%, so
+a very heavy system can keep the total slightly above a tiny budget.
+Original percentages are kept in a
+scene snapshot (_snapshots), so re-fitting starts from them and one
+restore puts them back.
+"""
+
+import math
+from collections import namedtuple
+
+import bpy
+
+from . import _handlers, _snapshots
+
+
+SNAPSHOT = "particle_budget"
+
+# settings: ParticleSettings, users: systems using it, cost: at original percentage
+ParticleCost = namedtuple("ParticleCost", "settings users particles faces original cost")
+
+_last_fit = None  # (budget, total before, total after, [(name, cost, original %, new %)])
+
+
+def _mesh_faces(obj):
+    return len(obj.data.polygons) if obj.type == 'MESH' and obj.data is not None else 0
+
+
+def _instance_faces(settings):
+    """Faces drawn per particle in viewports (1 when particles are not drawn as instances)."""
+    if settings.display_method != 'RENDER':
+        return 1
+    if settings.render_type == 'OBJECT' and settings.instance_object is not None:
+        return max(1, _mesh_faces(settings.instance_object))
+    if settings.render_type == 'COLLECTION' and settings.instance_collection is not None:
+        return max(1, sum(_mesh_faces(obj) for obj in settings.instance_collection.all_objects))
+    return 1
+
+
+def _displayed_particles(settings):
+    """Particles displayed at 100% by one system using settings."""
+    if settings.child_type != 'NONE':
+        return settings.count * max(1, settings.child_nbr)
+    return settings.count
+
+
+def costs(scene, mode='PARTICLES'):
+    """[ParticleCost] of every particle settings datablock used in the scene."""
+    stored = _snapshots.load(scene, SNAPSHOT) or {}
+    users = {}
+    for obj in scene.objects:
+        for psys in obj.particle_systems:
+            users.setdefault(psys.settings, []).append(psys)
+
+    result = []
+    for settings, systems in users.items():
+        original = stored.get(settings.name_full, {}).get("display_percentage", settings.display_percentage)
+        particles = _displayed_particles(settings) * len(systems)
+        faces = _instance_faces(settings) if mode == 'POLYGONS' else 1
+        result.append(ParticleCost(settings, len(systems), particles, faces, original,
+                                   particles * faces * original / 100.0))
+    return result
+
+
+def water_level(values, budget):
+    """Cap L so that sum(min(value, L)) == budget (inf when everything fits)."""
+    remaining = budget
+    values = sorted(values)
+    for index, value in enumerate(values):
+        left = len(values) - index
+        if value * left > remaining:
+            return remaining / left
+        remaining -= value
+    return math.inf
+
+
+def fit(scene, budget, mode='PARTICLES'):
+    """Set display_percentage of every particle settings datablock to fit budget; return the fit summary."""
+    global _last_fit
+    entries = costs(scene, mode)
+    level = water_level([entry.cost for entry in entries], budget)
+
+    snapshot = {}
+    rows = []
+    total_after = 0.0
+    for entry in entries:
+        percentage = entry.original
+        if entry.cost > level:
+            # At least 1% keeps every system visible
+            percentage = max(1, math.floor(entry.original * level / entry.cost))
+        settings = entry.settings
+        if settings.display_percentage != percentage:
+            snapshot[settings.name_full] = {"display_percentage": settings.display_percentage}
+            settings.display_percentage = percentage
+        after = entry.cost * percentage / entry.original if entry.original else 0.0
+        total_after += after
+        rows.append((settings.name, entry.cost, entry.original, percentage))
+
+    if snapshot:
+        _snapshots.merge(scene, SNAPSHOT, snapshot)
+    rows.sort(key=lambda row: -row[1])
+    _last_fit = (budget, sum(entry.cost for entry in entries), total_after, rows)
+    return _last_fit
+
+
+def restore(scene):
+    """Put back the original percentages; return (restored, missing)."""
+    snapshot = _snapshots.load(scene, SNAPSHOT) or {}
+    restored = missing = 0
+    for name, values in snapshot.items():
+        settings = bpy.data.particles.get(name)
+        if settings is None:
+            missing += 1
+            continue
+        settings.display_percentage = values["display_percentage"]
+        restored += 1
+    _snapshots.discard(scene, SNAPSHOT)
+    clear()
+    return restored, missing
+
+
+def last_fit():
+    return _last_fit
+
+
+def clear():
+    global _last_fit
+    _last_fit = None
+
+
+def register():
+    _handlers.add_listener(on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_reset=clear)
+    clear()
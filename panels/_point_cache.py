@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Point Cache Inspector
+Frames, gaps and disk usage of the simulation caches of a scene
+
+scan() collects the disk caches of the scene on the main thread (cloth,
+soft body, particle and rigid body point caches, fluid domain cache
+folders) and lists their directories with os.scandir in the shared thread
+pool (_background), one job per directory. Listings are cached per
+directory and only re-read when the directory mtime changed; adding or
+deleting cache files changes it.
+
+report() matches the listings against each cache's file naming
+(<name>_<frame:06>_<index:02>.bphys, without _<index> for external caches
+with index -1, or <kind>_<frame>.<ext> inside the fluid folders) and is recomputed only when a listing changed. Purging
+deletes the files of frames outside each cache's frame range, also in the
+background, then rescans the touched directories.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+import bpy
+
+from . import _background, _handlers
+
+
+_OWNER = "point_cache"
+
+_BPHYS = re.compile(r"^(?P<prefix>.+)_(?P<frame>\d{6})(?:_(?P<index>\d{2}))?\.bphys$")
+_FLUID = re.compile(r"_(?P<frame>\d+)\.[^.]+(?:\.gz)?$")
+FLUID_FOLDERS = ("config", "data", "noise", "mesh", "particles", "guiding")
+
+# owner: object (or scene) name, label: modifier / system name,
+# directories: absolute paths holding the files, matcher: filename -> frame or None
+CacheSource = namedtuple("CacheSource", "owner label kind directories matcher frame_start frame_end")
+# frames: {frame: bytes}, files: {frame: [path, ...]}
+CacheReport = namedtuple("CacheReport", "source frames files total")
+
+_listings = {}   # directory -> (mtime_ns, [(filename, size)]) or (None, []) when missing
+_sources = None  # [CacheSource] from the last scan()
+_report = None   # (generation, [CacheReport])
+_generation = 0  # bumped when a listing or the sources change
+_last_purge = None  # (files deleted, bytes freed, failures)
+
+
+def _bphys_matcher(prefix, index):
+    # Caches with an index write the _<index:02> suffix; index -1 (external
+    # caches only) writes none. Other caches of the object share the prefix.
+    def match(filename):
+        m = _BPHYS.match(filename)
+        if m is None or m.group("prefix") != prefix:
+            return None
+        file_index = m.group("index")
+        if (int(file_index) if file_index is not None else -1) != index:
+            return None
+        return int(m.group("frame"))
+    return match
+
+
+def fluid_frame(filename):
+    """Frame of a fluid cache file name, or None."""
+    m = _FLUID.search(filename)
+    return int(m.group("frame")) if m is not None else None
+
+
+def fluid_directories(domain):
+    """Absolute folders of a fluid domain's cache."""
+    root = bpy.path.abspath(domain.cache_directory)
+    return tuple(os.path.normpath(os.path.join(root, folder)) for folder in FLUID_FOLDERS)
+
+
+def _point_cache_source(owner, label, kind, id_name, cache):
+    """CacheSource of a PointCache stored on disk, or None for memory caches."""
+    if cache.use_external:
+        directory = bpy.path.abspath(cache.filepath)
+    elif cache.use_disk_cache and bpy.data.filepath:
+        blend = bpy.path.basename(bpy.data.filepath)
+        directory = os.path.join(os.path.dirname(bpy.data.filepath),
+                                 "blendcache_" + os.path.splitext(blend)[0])
+    else:
+        return None
+    # Unnamed caches are stored under the hex-encoded ID name
+    prefix = cache.name or id_name.encode("utf-8").hex().upper()
+    return CacheSource(owner, label, kind, (os.path.normpath(directory),),
+                       _bphys_matcher(prefix, cache.index), cache.frame_start, cache.frame_end)
+
+
+def cache_sources(scene):
+    """Every disk cache of the scene's objects and rigid body world."""
+    sources = []
+    for obj in scene.objects:
+        for mod in obj.modifiers:
+            source = None
+            if mod.type in {'CLOTH', 'SOFT_BODY'}:
+                source = _point_cache_source(obj.name, mod.name, mod.type, obj.name, mod.point_cache)
+            elif mod.type == 'PARTICLE_SYSTEM':
+                source = _point_cache_source(obj.name, mod.particle_system.name, 'PARTICLES',
+                                             obj.name, mod.particle_system.point_cache)
+            elif mod.type == 'FLUID' and mod.fluid_type == 'DOMAIN':
+                domain = mod.domain_settings
+                source = CacheSource(obj.name, mod.name, 'FLUID', fluid_directories(domain),
+                                     fluid_frame, domain.cache_frame_start, domain.cache_frame_end)
+            if source is not None:
+                sources.append(source)
+
+    world = scene.rigidbody_world
+    if world is not None and world.point_cache is not None:
+        source = _point_cache_source(scene.name, "Rigid Body World", 'RIGID_BODY', scene.name, world.point_cache)
+        if source is not None:
+            sources.append(source)
+    return sources
+
+
+def _list_directory(path, known_mtime):
+    """Worker: (mtime_ns, [(filename, size)]), None when unchanged, (None, []) when missing."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None, []
+    if mtime == known_mtime:
+        return None
+    entries = []
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                if entry.is_file():
+                    entries.append((entry.name, entry.stat().st_size))
+            except OSError:
+                continue
+    return mtime, entries
+
+
+def _store_listing(path):
+    def on_done(result):
+        global _generation
+        if result is None:
+            return
+        _listings[path] = result
+        _generation += 1
+    return on_done
+
+
+def _submit_listing(path):
+    known = _listings.get(path, (None, []))[0]
+    _background.submit((_OWNER, "list", path), _store_listing(path), _list_directory, path, known)
+
+
+def scan(scene):
+    """Collect the scene's caches and (re)list their directories in the background."""
+    global _sources, _generation
+    _sources = cache_sources(scene)
+    _generation += 1
+    for directory in {directory for source in _sources for directory in source.directories}:
+        _submit_listing(directory)
+    return len(_sources)
+
+
+def is_scanning():
+    return _background.pending_count(_OWNER) > 0
+
+
+def has_scanned():
+    return _sources is not None
+
+
+def report():
+    """[CacheReport] for the sources of the last scan (cached until a listing changes)."""
+    global _report
+    if _report is not None and _report[0] == _generation:
+        return _report[1]
+
+    reports = []
+    for source in _sources or ():
+        frames = {}
+        files = {}
+        for directory in source.directories:
+            for filename, size in _listings.get(directory, (None, []))[1]:
+                frame = source.matcher(filename)
+                if frame is None:
+                    continue
+                frames[frame] = frames.get(frame, 0) + size
+                files.setdefault(frame, []).append(os.path.join(directory, filename))
+        reports.append(CacheReport(source, frames, files, sum(frames.values())))
+    _report = (_generation, reports)
+    return reports
+
+
+def gaps(cache_report):
+    """[(first, last)] frame ranges missing between the first and last cached frame."""
+    frames = sorted(cache_report.frames)
+    return [(previous + 1, frame - 1) for previous, frame in zip(frames, frames[1:]) if frame - previous > 1]
+
+
+def out_of_range(cache_report):
+    """Frames cached outside the cache's frame range."""
+    start, end = cache_report.source.frame_start, cache_report.source.frame_end
+    return [frame for frame in cache_report.frames if frame < start or frame > end]
+
+
+def totals_by_owner(reports):
+    """{owner: bytes} over all caches of each object (or scene)."""
+    totals = {}
+    for cache_report in reports:
+        totals[cache_report.source.owner] = totals.get(cache_report.source.owner, 0) + cache_report.total
+    return totals
+
+
+def _delete_files(paths):
+    """Worker: (files deleted, bytes freed, failures)."""
+    deleted = freed = failed = 0
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            failed += 1
+            continue
+        deleted += 1
+        freed += size
+    return deleted, freed, failed
+
+
+def purge_out_of_range(reports):
+    """Delete out-of-range frames of reports in the background; return (files, bytes) queued."""
+    paths = []
+    freed = 0
+    directories = set()
+    for cache_report in reports:
+        for frame in out_of_range(cache_report):
+            paths.extend(cache_report.files[frame])
+            freed += cache_report.frames[frame]
+        if out_of_range(cache_report):
+            directories.update(cache_report.source.directories)
+    if not paths:
+        return 0, 0
+
+    def on_done(result):
+        global _last_purge
+        _last_purge = result
+        for directory in directories:
+            _submit_listing(directory)
+
+    _background.submit((_OWNER, "purge"), on_done, _delete_files, paths)
+    return len(paths), freed
+
+
+def last_purge():
+    return _last_purge
+
+
+def clear():
+    global _sources, _report, _last_purge
+    _background.cancel(_OWNER)
+    _listings.clear()
+    _sources = None
+    _report = None
+    _last_purge = None
+
+
+def register():
+    _handlers.add_listener(on_reset=clear)
+
+
+def unregister():
+    _handlers.remove_listener(on_reset=clear)
+    clear()
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Registration Profiling
+Records what panels.register() costs, module by module
+
+For each panel module: import time, classes registered, register_class()
+time per class and failures. Read it with get_report(), format_report()
+or write_report(). Set QPANEL_ASSETS_PROFILE=<path.json> to write the JSON
+report automatically after each register().
+"""
+
+import json
+import os
+import time
+from contextlib import contextmanager
+
+import bpy
+
+
+REPORT_PATH = os.environ.get("QPANEL_ASSETS_PROFILE", "")
+
+_records = {}  # module name -> record dict
+
+
+def _record(module_name):
+    record = _records.get(module_name)
+    if record is None:
+        record = _records[module_name] = {
+            "module": module_name,
+            "import_ms": 0.0,
+            "register_ms": 0.0,
+            "classes": [],
+            "failures": [],
+        }
+    return record
+
+
+def reset():
+    """Forget all recorded timings."""
+    _records.clear()
+
+
+def record_import(module_name, seconds, error=None):
+    """Store the import (or reload) time of a module."""
+    record = _record(module_name)
+    record["import_ms"] += seconds * 1000.0
+    if error is not None:
+        record["failures"].append({"stage": "import", "error": str(error)})
+
+
+@contextmanager
+def record_registration(module_name, stub=False):
+    """Time a module's register() and each register_class() call inside it.
+
+    bpy.utils.register_class is swapped for a timing wrapper while the block
+    runs; module code looks it up at call time so no module changes are needed.
+    """
+    record = _record(module_name)
+    register_class = bpy.utils.register_class
+    class_errors = []
+
+    def timed_register_class(cls):
+        start = time.perf_counter()
+        try:
+            register_class(cls)
+        except Exception as e:
+            # Counted as a failure only, not as a registered class
+            class_errors.append(e)
+            record["failures"].append({"stage": "register_class",
+                                       "class": cls.__name__, "error": str(e)})
+            raise
+        record["classes"].append({
+            "name": cls.__name__,
+            "register_ms": (time.perf_counter() - start) * 1000.0,
+            "stub": stub,
+        })
+
+    start = time.perf_counter()
+    bpy.utils.register_class = timed_register_class
+    try:
+        yield record
+    except Exception as e:
+        if e not in class_errors:
+            record["failures"].append({"stage": "register", "error": str(e)})
+        raise
+    finally:
+        bpy.utils.register_class = register_class
+        record["register_ms"] += (time.perf_counter() - start) * 1000.0
+
+
+def get_report():
+    """Return the recorded timings as a JSON-serializable dict."""
+    modules = sorted(_records.values(),
+                     key=lambda record: record["import_ms"] + record["register_ms"],
+                     reverse=True)
+    return {
+        "blender_version": bpy.app.version_string,
+        "total_ms": sum(record["import_ms"] + record["register_ms"] for record in modules),
+        "class_count": sum(len(record["classes"]) for record in modules),
+        "failure_count": sum(len(record["failures"]) for record in modules),
+        "modules": modules,
+    }
+
+
+def format_report():
+    """Return the report as a plain-text table, slowest modules first."""
+    report = get_report()
+
+    lines = [
+        "QPanel Assets - Registration Profile",
+        f"{'Module':30s} {'Import ms':>10s} {'Register ms':>12s} {'Classes':>8s} {'Failures':>9s}",
+    ]
+    for record in report["modules"]:
+        lines.append(
+            f"{record['module']:30s} {record['import_ms']:10.2f} {record['register_ms']:12.2f} "
+            f"{len(record['classes']):8d} {len(record['failures']):9d}"
+        )
+        for failure in record["failures"]:
+            lines.append(f"    ! {failure['stage']}: {failure['error']}")
+    lines.append(
+        f"{'TOTAL':30s} {report['total_ms']:23.2f} {report['class_count']:8d} {report['failure_count']:9d}"
+    )
+    return "\n".join(lines)
+
+
+def write_report(path):
+    """Write the JSON report to path."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(get_report(), f, indent=2)
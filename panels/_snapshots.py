@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Scene Snapshots
+Restorable property snapshots stored on the scene
+
+Bulk operators record the values they overwrite as {group: {name: value}}
+in a scene custom property (JSON), so the snapshot is saved with the .blend
+file and follows undo. Merging keeps the oldest value of each entry:
+repeated operations still restore the state before the first one.
+"""
+
+import json
+
+
+PREFIX = "qpanel_snapshot_"
+
+
+def load(scene, key):
+    """Return the snapshot dict stored under key, or None."""
+    raw = scene.get(PREFIX + key)
+    if not raw:
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError:
+        return None
+
+
+def exists(scene, key):
+    return bool(scene.get(PREFIX + key))
+
+
+def merge(scene, key, snapshot):
+    """Add snapshot entries under key without overwriting older values."""
+    stored = load(scene, key) or {}
+    for group, values in snapshot.items():
+        current = stored.setdefault(group, {})
+        for name, value in values.items():
+            current.setdefault(name, value)
+    scene[PREFIX + key] = json.dumps(stored)
+
+
+def discard(scene, key):
+    if PREFIX + key in scene:
+        del scene[PREFIX + key]
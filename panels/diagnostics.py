@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+"""
+QPanel Assets - Diagnostics
+Draw/poll latency profiler for the Assets panels
+
+Finds the panels that stall the UI on heavy scenes
+"""
+
+import bpy
+from bpy.types import Panel, Operator
+
+from . import _draw_profiler
+
+
+class QPANEL_OT_draw_profiler_toggle(Operator):
+    """Start or stop timing draw() and poll() of all Assets panels"""
+    bl_idname = "qpanel.draw_profiler_toggle"
+    bl_label = "Toggle Draw Profiler"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        if _draw_profiler.is_enabled():
+            _draw_profiler.disable()
+            self.report({'INFO'}, "Draw profiler disabled")
+        else:
+            _draw_profiler.enable()
+            self.report({'INFO'}, "Draw profiler enabled")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_draw_profiler_reset(Operator):
+    """Clear all recorded draw/poll timings"""
+    bl_idname = "qpanel.draw_profiler_reset"
+    bl_label = "Reset Timings"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        _draw_profiler.reset()
+        return {'FINISHED'}
+
+
+class QPANEL_OT_draw_profiler_report(Operator):
+    """Print the draw/poll latency report to the console and copy it to the clipboard"""
+    bl_idname = "qpanel.draw_profiler_report"
+    bl_label = "Latency Report"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        report = _draw_profiler.format_report()
+        print(report)
+        context.window_manager.clipboard = report
+
+        stats = _draw_profiler.get_stats()
+        if stats:
+            slowest = stats[0]
+            self.report({'INFO'}, f"Slowest: {slowest['panel']}.{slowest['method']} "
+                                  f"p95 {slowest['p95_ms']:.2f} ms (report copied)")
+        else:
+            self.report({'INFO'}, "No samples recorded")
+        return {'FINISHED'}
+
+
+class QPANEL_PT_draw_profiler(Panel):
+    """Draw/Poll Latency Profiler"""
+    bl_label = "Panel Latency"
+    bl_idname = "QPANEL_PT_draw_profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'DIAGNOSTICS'
+
+    max_rows = 15
+
+    def draw(self, context):
+        layout = self.layout
+        enabled = _draw_profiler.is_enabled()
+
+        row = layout.row(align=True)
+        row.operator("qpanel.draw_profiler_toggle",
+                     text="Stop Profiling" if enabled else "Start Profiling",
+                     icon='PAUSE' if enabled else 'PLAY', depress=enabled)
+        row.operator("qpanel.draw_profiler_reset", text="", icon='TRASH')
+        row.operator("qpanel.draw_profiler_report", text="", icon='TEXT')
+
+        stats = _draw_profiler.get_stats()
+        if not stats:
+            layout.label(text="No samples yet - open some panels", icon='INFO')
+            return
+
+        box = layout.box()
+        header = box.row()
+        header.label(text="Panel")
+        header.label(text="Calls")
+        header.label(text="p50 / p95 / p99 ms")
+
+        for entry in stats[:self.max_rows]:
+            row = box.row()
+            row.label(text=f"{entry['panel']}.{entry['method']}")
+            row.label(text=str(entry['calls']))
+            row.label(text=f"{entry['p50_ms']:.2f} / {entry['p95_ms']:.2f} / {entry['p99_ms']:.2f}")
+
+        if len(stats) > self.max_rows:
+            layout.label(text=f"{len(stats) - self.max_rows} more in the report")
+
+
+# Registration
+classes = (
+    QPANEL_OT_draw_profiler_toggle,
+    QPANEL_OT_draw_profiler_reset,
+    QPANEL_OT_draw_profiler_report,
+    QPANEL_PT_draw_profiler,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    for cls in reversed(classes):
+        bpy.utils.unregister_class(cls)
@@ -5,10 +5,379 @@ Complete scene outliner with collections and object hierarchy
 
 Based on Blender's native space_outliner.py
 Fully portable popup display
+
+Rows are virtualized: only one page of rows is built and drawn, and
+collapsed branches are never traversed, so draw cost follows the number
+of visible rows rather than the scene size. The page start is found by
+bisecting cumulative row counts per branch (cached until the index or
+the expanded branches change), not by walking the rows above it. Rows are read from the cached
+hierarchy index (_outliner_index), so a redraw does no sorting or scans.
+
+The filter field queries the index's incremental name search; matching
+rows are listed with their ancestor chain.
+
+Clicking a row selects through a direct name -> object lookup in the
+index (qpanel.outliner_select) instead of object.select_pattern, which
+matches the pattern against every object of the scene.
+
+Branch visibility operators (qpanel.outliner_visibility) isolate, hide,
+show or exclude a whole collection subtree or object hierarchy in one
+operator call: one depsgraph update and one undo step. The overwritten
+values are kept in a scene snapshot (_snapshots) until restored.
+
+Collection rows can show cached subtree cost counters (_collection_stats).
 """
 
 import bpy
-from bpy.types import Panel, Operator
+from bpy.types import Panel, Operator, PropertyGroup
+from bpy.props import BoolProperty, IntProperty, StringProperty, EnumProperty, PointerProperty
+from bisect import bisect_right
+from itertools import islice
+
+from . import _collection_stats, _outliner_index, _snapshots
+
+
+# Expanded branches, as (kind, name_full); everything starts collapsed
+_expanded = set()
+_expanded_version = 0  # bumped on every expand/collapse
+
+# Rows through each child of a branch: ('OBJECT' | 'COLLECTION', pointer) -> [cumulative rows]
+_row_ends = {}
+_row_ends_key = None  # (index id, index generation, expanded version)
+
+# Last filter result: ((index id, index generation, query), rows)
+_filter_cache = None
+
+# name_full of the last clicked object, start of Shift+click ranges
+_anchor = None
+
+VISIBILITY_SNAPSHOT = "outliner_visibility"
+
+VISIBILITY_ACTIONS = (
+    ('ISOLATE', "Isolate", "Show this branch and hide everything else", 'SOLO_ON'),
+    ('HIDE', "Hide Branch", "Hide this branch in viewports", 'HIDE_ON'),
+    ('SHOW', "Show Branch", "Show this branch and its parents in viewports", 'HIDE_OFF'),
+    ('EXCLUDE', "Exclude Branch", "Exclude this collection from the view layer", 'CHECKBOX_DEHLT'),
+)
+
+
+def _iter_collection_rows(index, scene, collection, level, start=0):
+    """Yield (kind, data, level, has_children, key, matched) for a collection subtree."""
+    children = index.sub_collections(scene, collection)
+    for position in range(start, len(children)):
+        child = children[position]
+        key = ('COLLECTION', child.name_full)
+        has_children = bool(index.sub_collections(scene, child))
+        yield 'COLLECTION', child, level, has_children, key, True
+        if has_children and key in _expanded:
+            yield from _iter_collection_rows(index, scene, child, level + 1)
+
+
+def _iter_object_rows(index, pointer, entry, level):
+    """Yield rows for an object and its expanded descendants."""
+    key = ('OBJECT', entry.name_full)
+    has_children = index.has_children(pointer)
+    yield 'OBJECT', entry, level, has_children, key, True
+    if has_children and key in _expanded:
+        for child_pointer, child in index.child_entries(pointer):
+            yield from _iter_object_rows(index, child_pointer, child, level + 1)
+
+
+def _collection_ends(index, scene, collection):
+    """Cumulative visible rows through each child collection (cached)."""
+    key = ('COLLECTION', collection.as_pointer())
+    ends = _row_ends.get(key)
+    if ends is None:
+        ends = _row_ends[key] = []
+        total = 0
+        for child in index.sub_collections(scene, collection):
+            total += 1
+            if ('COLLECTION', child.name_full) in _expanded and index.sub_collections(scene, child):
+                total += _collection_ends(index, scene, child)[-1]
+            ends.append(total)
+    return ends
+
+
+def _object_ends(index, pointer):
+    """Cumulative visible rows through each child object (cached)."""
+    key = ('OBJECT', pointer)
+    ends = _row_ends.get(key)
+    if ends is None:
+        ends = _row_ends[key] = []
+        total = 0
+        for child_pointer, child in index.child_entries(pointer):
+            total += 1
+            if ('OBJECT', child.name_full) in _expanded and index.has_children(child_pointer):
+                total += _object_ends(index, child_pointer)[-1]
+            ends.append(total)
+    return ends
+
+
+def _seek(ends, skip):
+    """(child position, rows left to skip inside that child) for skip rows."""
+    position = bisect_right(ends, skip)
+    return position, skip - (ends[position - 1] if position else 0)
+
+
+def _iter_collection_rows_from(index, scene, collection, level, skip):
+    """Yield the rows of a collection subtree, skipping the first skip rows."""
+    position, skip = _seek(_collection_ends(index, scene, collection), skip)
+    children = index.sub_collections(scene, collection)
+    if position < len(children) and skip:
+        # Start inside this child's expanded branch
+        yield from _iter_collection_rows_from(index, scene, children[position], level + 1, skip - 1)
+        position += 1
+    yield from _iter_collection_rows(index, scene, collection, level, position)
+
+
+def _iter_object_rows_from(index, pointer, level, skip):
+    """Yield the rows below an object (ROOT: top level), skipping the first skip rows."""
+    position, skip = _seek(_object_ends(index, pointer), skip) if skip else (0, 0)
+    children = index.child_entries(pointer, position)
+    if skip:
+        child_pointer, _child = next(children, (None, None))
+        if child_pointer is not None:
+            yield from _iter_object_rows_from(index, child_pointer, level + 1, skip - 1)
+    for child_pointer, child in children:
+        yield from _iter_object_rows(index, child_pointer, child, level)
+
+
+def iter_rows(scene, start=0):
+    """Yield the visible outliner rows in display order from row start, lazily."""
+    global _row_ends_key
+    index = _outliner_index.get_index(scene)
+    # Rebuilds a dirty collection map first, so the generation below is current
+    index.collection_map(scene)
+    key = (id(index), index.generation, _expanded_version)
+    if _row_ends_key != key:
+        _row_ends.clear()
+        _row_ends_key = key
+
+    collection_rows = _collection_ends(index, scene, scene.collection)
+    collection_rows = collection_rows[-1] if collection_rows else 0
+    skip = start
+    if skip == 0:
+        yield 'HEADER', "Collections", 0, False, None, True
+    skip = max(0, skip - 1)
+    if skip == 0:
+        yield 'SCENE_COLLECTION', scene.collection, 0, False, None, True
+    skip = max(0, skip - 1)
+    if skip < collection_rows:
+        yield from _iter_collection_rows_from(index, scene, scene.collection, 1, skip)
+    skip = max(0, skip - collection_rows)
+
+    if skip == 0:
+        yield 'HEADER', "Objects", 0, False, None, True
+    skip = max(0, skip - 1)
+    yield from _iter_object_rows_from(index, _outliner_index.ROOT, 0, skip)
+
+
+def _ancestor_tree(matches, parent_of, name_of, root):
+    """Return [(pointer, level)] for matches plus their ancestors, depth-first by name."""
+    visible = set()
+    for pointer in matches:
+        while pointer != root and pointer not in visible:
+            visible.add(pointer)
+            pointer = parent_of(pointer)
+
+    children = {}
+    for pointer in visible:
+        children.setdefault(parent_of(pointer), []).append((name_of(pointer), pointer))
+
+    tree = []
+    stack = [(pointer, 0) for _name, pointer in sorted(children.get(root, ()), reverse=True)]
+    while stack:
+        pointer, level = stack.pop()
+        tree.append((pointer, level))
+        for _name, child in sorted(children.get(pointer, ()), reverse=True):
+            stack.append((child, level + 1))
+    return tree
+
+
+def filtered_rows(scene, query):
+    """Return the rows matching query with their ancestor chains (cached per query)."""
+    global _filter_cache
+    index = _outliner_index.get_index(scene)
+    # Rebuilds a dirty collection map first, so the generation below is current
+    index.collection_map(scene)
+
+    cache_key = (id(index), index.generation, query)
+    if _filter_cache is not None and _filter_cache[0] == cache_key:
+        return _filter_cache[1]
+
+    collection_matches = index.collection_search(scene).search(query)
+    rows = [('HEADER', "Collections", 0, False, None, True)]
+    tree = _ancestor_tree(collection_matches,
+                          parent_of=index.collection_parents.get,
+                          name_of=lambda pointer: index.collections[pointer].name,
+                          root=scene.collection.as_pointer())
+    rows += [('COLLECTION', index.collections[pointer], level + 1, False, None,
+              pointer in collection_matches) for pointer, level in tree]
+
+    object_matches = index.object_search().search(query)
+    objects = index.objects
+    rows.append(('HEADER', "Objects", 0, False, None, True))
+    tree = _ancestor_tree(object_matches,
+                          parent_of=lambda pointer: objects[pointer].parent,
+                          name_of=lambda pointer: objects[pointer].name,
+                          root=_outliner_index.ROOT)
+    rows += [('OBJECT', objects[pointer], level, False, None,
+              pointer in object_matches) for pointer, level in tree]
+
+    _filter_cache = (cache_key, rows)
+    return rows
+
+
+def visible_rows(scene, settings):
+    """Rows in display order for the current filter."""
+    if settings.filter:
+        return filtered_rows(scene, settings.filter)
+    return iter_rows(scene)
+
+
+def _indent(row, level, has_children, key):
+    """Indentation plus the expand/collapse toggle of a row."""
+    for _ in range(level):
+        row.label(text="", icon='BLANK1')
+
+    if has_children:
+        expanded = key in _expanded
+        op = row.operator("qpanel.outliner_toggle", text="", emboss=False,
+                          icon='DISCLOSURE_TRI_DOWN' if expanded else 'DISCLOSURE_TRI_RIGHT')
+        op.kind, op.name = key
+    else:
+        row.label(text="", icon='BLANK1')
+
+
+def _branch_menu(row, kind, name):
+    """Button opening the branch visibility actions of a row."""
+    op = row.operator("qpanel.outliner_visibility", text="", icon='DOWNARROW_HLT', emboss=False)
+    op.kind = kind
+    op.name = name
+    op.menu = True
+
+
+def draw_collection_row(layout, collection, level, has_children, key, matched=True, show_stats=False):
+    """Draw one collection row"""
+    row = layout.row(align=True)
+    row.active = matched
+    _indent(row, level, has_children, key)
+
+    row.prop(collection, "hide_viewport", text="", emboss=False,
+            icon='HIDE_OFF' if not collection.hide_viewport else 'HIDE_ON')
+    row.label(text=collection.name, icon='OUTLINER_COLLECTION')
+    if show_stats:
+        row.label(text=_collection_stats.summary(collection))
+    _branch_menu(row, 'COLLECTION', collection.name_full)
+    row.prop(collection, "hide_render", text="", emboss=False)
+
+
+def draw_object_row(layout, entry, level, has_children, key, matched=True):
+    """Draw one object row from its index entry"""
+    obj = entry.obj
+    row = layout.row(align=True)
+    row.active = matched
+    _indent(row, level, has_children, key)
+
+    row.prop(obj, "hide_viewport", text="", emboss=False,
+            icon='HIDE_OFF' if not obj.hide_viewport else 'HIDE_ON')
+
+    row.operator("qpanel.outliner_select", text=entry.name, icon=entry.icon,
+                 emboss=False).name = entry.name_full
+    _branch_menu(row, 'OBJECT', entry.name_full)
+    row.prop(obj, "hide_render", text="", emboss=False)
+
+
+def draw_outliner(layout, context):
+    """Draw one page of outliner rows (shared by the Panel and the popup)"""
+    settings = context.window_manager.qpanel_outliner
+    scene = context.scene
+
+    row = layout.row(align=True)
+    row.prop(settings, "filter", text="", icon='VIEWZOOM')
+    row.prop(settings, "show_stats", text="", icon='MESH_DATA')
+
+    def page():
+        # One extra row tells whether a next page exists
+        count = settings.page_size + 1
+        if settings.filter:
+            return filtered_rows(scene, settings.filter)[settings.scroll:settings.scroll + count]
+        return list(islice(iter_rows(scene, settings.scroll), count))
+
+    try:
+        rows = page()
+    except ReferenceError:
+        # An indexed object was removed before the index saw the update
+        _outliner_index.invalidate()
+        rows = page()
+    has_more = len(rows) > settings.page_size
+    rows = rows[:settings.page_size]
+
+    box = layout.box()
+    if not rows:
+        box.label(text="No rows past this point", icon='INFO')
+    for kind, data, level, has_children, key, matched in rows:
+        if kind == 'HEADER':
+            box.label(text=data, icon='OUTLINER_COLLECTION' if data == "Collections" else 'OBJECT_DATAMODE')
+        elif kind == 'SCENE_COLLECTION':
+            row = box.row(align=True)
+            row.label(text="Scene Collection", icon='SCENE_DATA')
+            if settings.show_stats:
+                row.label(text=_collection_stats.summary(data))
+            row.prop(data, "hide_viewport", text="", emboss=False)
+            row.prop(data, "hide_render", text="", emboss=False)
+        elif kind == 'COLLECTION':
+            draw_collection_row(box, data, level, has_children, key, matched, settings.show_stats)
+        else:
+            draw_object_row(box, data, level, has_children, key, matched)
+
+    # Page controls
+    row = layout.row(align=True)
+    sub = row.row(align=True)
+    sub.enabled = settings.scroll > 0
+    sub.operator("qpanel.outliner_page", text="", icon='TRIA_UP_BAR').direction = 'TOP'
+    sub.operator("qpanel.outliner_page", text="", icon='TRIA_UP').direction = 'UP'
+    row.label(text=f"Rows {settings.scroll + 1}-{settings.scroll + len(rows)}")
+    sub = row.row(align=True)
+    sub.enabled = has_more
+    sub.operator("qpanel.outliner_page", text="", icon='TRIA_DOWN').direction = 'DOWN'
+    row.prop(settings, "page_size", text="Rows")
+
+    if _snapshots.exists(scene, VISIBILITY_SNAPSHOT):
+        layout.operator("qpanel.outliner_visibility_restore", icon='LOOP_BACK')
+
+
+def _filter_update(self, context):
+    self.scroll = 0
+
+
+class QPANEL_PG_outliner(PropertyGroup):
+    """Outliner view state (scroll position, page size, name filter)"""
+    scroll: IntProperty(
+        name="Scroll",
+        description="Index of the first visible row",
+        default=0,
+        min=0,
+    )
+    page_size: IntProperty(
+        name="Rows per Page",
+        description="Number of rows drawn at once",
+        default=40,
+        min=5,
+        max=500,
+    )
+    filter: StringProperty(
+        name="Filter",
+        description="Show objects and collections whose name contains this text",
+        default="",
+        options={'TEXTEDIT_UPDATE'},
+        update=_filter_update,
+    )
+    show_stats: BoolProperty(
+        name="Collection Stats",
+        description="Show object, vertex, face and instance totals of each collection subtree",
+        default=False,
+    )
 
 
 class QPANEL_PT_outliner(Panel):
@@ -18,82 +387,321 @@ class QPANEL_PT_outliner(Panel):
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'WINDOW'
     bl_qpanel_category = 'OUTLINER'
-    
+
     def draw(self, context):
-        layout = self.layout
+        draw_outliner(self.layout, context)
+
+
+class QPANEL_OT_outliner_toggle(Operator):
+    """Expand or collapse this branch"""
+    bl_idname = "qpanel.outliner_toggle"
+    bl_label = "Toggle Branch"
+    bl_options = {'INTERNAL'}
+
+    kind: StringProperty()
+    name: StringProperty()
+
+    def execute(self, context):
+        global _expanded_version
+        key = (self.kind, self.name)
+        if key in _expanded:
+            _expanded.discard(key)
+        else:
+            _expanded.add(key)
+        _expanded_version += 1
+        return {'FINISHED'}
+
+
+class QPANEL_OT_outliner_select(Operator):
+    """Select this object (Ctrl: extend, Shift: range, Alt: with children)"""
+    bl_idname = "qpanel.outliner_select"
+    bl_label = "Select Object"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    name: StringProperty(
+        name="Object",
+        description="Full name of the object to select",
+    )
+    extend: BoolProperty(
+        name="Extend",
+        description="Toggle the object, keeping the current selection",
+        default=False,
+    )
+    range: BoolProperty(
+        name="Range",
+        description="Select every object row between the last clicked object and this one",
+        default=False,
+    )
+    children: BoolProperty(
+        name="Children",
+        description="Also select every object parented below this one",
+        default=False,
+    )
+
+    def invoke(self, context, event):
+        self.extend = event.ctrl
+        self.range = event.shift
+        self.children = event.alt
+        return self.execute(context)
+
+    def _range_entries(self, scene, settings, entry):
+        """Object entries between the anchor row and entry, in display order."""
+        ends = {entry.name_full, _anchor}
+        entries = []
+        for kind, data, _level, _has_children, _key, _matched in visible_rows(scene, settings):
+            if kind != 'OBJECT':
+                continue
+            if data.name_full in ends:
+                entries.append(data)
+                if len(entries) > 1:
+                    return entries
+            elif entries:
+                entries.append(data)
+        # Anchor row is no longer visible
+        return [entry]
+
+    def execute(self, context):
+        global _anchor
         scene = context.scene
-        
-        # Collections section
-        col_box = layout.box()
-        col_header = col_box.row()
-        col_header.label(text="Collections", icon='OUTLINER_COLLECTION')
-        
-        self.draw_collection(col_box, scene.collection, context, level=0)
-        
-        layout.separator()
-        
-        # Objects section
-        obj_box = layout.box()
-        obj_header = obj_box.row()
-        obj_header.label(text="Objects", icon='OBJECT_DATAMODE')
-        
-        top_level = [obj for obj in scene.objects if obj.parent is None]
-        for obj in sorted(top_level, key=lambda x: x.name):
-            self.draw_object(obj_box, obj, context, level=0)
-    
-    def draw_collection(self, layout, collection, context, level=0):
-        """Draw collection hierarchy"""
-        if level == 0:
-            row = layout.row(align=True)
-            row.label(text="Scene Collection", icon='SCENE_DATA')
-            row.prop(collection, "hide_viewport", text="", emboss=False)
-            row.prop(collection, "hide_render", text="", emboss=False)
-        
-        for child in collection.children:
-            row = layout.row(align=True)
-            
-            for _ in range(level + 1):
-                row.label(text="", icon='BLANK1')
-            
-            row.prop(child, "hide_viewport", text="", emboss=False,
-                    icon='HIDE_OFF' if not child.hide_viewport else 'HIDE_ON')
-            row.label(text=child.name, icon='OUTLINER_COLLECTION')
-            row.prop(child, "hide_render", text="", emboss=False)
-            
-            if child.children:
-                self.draw_collection(layout, child, context, level + 1)
-    
-    def draw_object(self, layout, obj, context, level=0):
-        """Draw object with children"""
-        row = layout.row(align=True)
-        
-        for _ in range(level):
-            row.label(text="", icon='BLANK1')
-        
-        row.prop(obj, "hide_viewport", text="", emboss=False,
-                icon='HIDE_OFF' if not obj.hide_viewport else 'HIDE_ON')
-        
-        icon_map = {
-            'MESH': 'OUTLINER_OB_MESH', 'CURVE': 'OUTLINER_OB_CURVE',
-            'SURFACE': 'OUTLINER_OB_SURFACE', 'META': 'OUTLINER_OB_META',
-            'FONT': 'OUTLINER_OB_FONT', 'ARMATURE': 'OUTLINER_OB_ARMATURE',
-            'LATTICE': 'OUTLINER_OB_LATTICE', 'EMPTY': 'OUTLINER_OB_EMPTY',
-            'LIGHT': 'OUTLINER_OB_LIGHT', 'CAMERA': 'OUTLINER_OB_CAMERA',
-            'SPEAKER': 'OUTLINER_OB_SPEAKER', 'CURVES': 'OUTLINER_OB_CURVES',
-            'POINTCLOUD': 'OUTLINER_OB_POINTCLOUD', 'VOLUME': 'OUTLINER_OB_VOLUME',
-            'GPENCIL': 'OUTLINER_OB_GREASEPENCIL',
-        }
-        icon = icon_map.get(obj.type, 'OBJECT_DATA')
-        
-        op = row.operator("object.select_pattern", text=obj.name, icon=icon, emboss=False)
-        op.pattern = obj.name
-        op.case_sensitive = True
-        op.extend = False
-        
-        row.prop(obj, "hide_render", text="", emboss=False)
-        
-        for child in sorted(obj.children, key=lambda x: x.name):
-            self.draw_object(layout, child, context, level + 1)
+        index = _outliner_index.get_index(scene)
+        pointer, entry = index.lookup(self.name)
+        if entry is None:
+            self.report({'WARNING'}, f"Object '{self.name}' not found")
+            return {'CANCELLED'}
+
+        if self.range and _anchor is not None and _anchor != entry.name_full:
+            entries = self._range_entries(scene, context.window_manager.qpanel_outliner, entry)
+        else:
+            entries = [entry]
+        if self.children:
+            entries += list(index.descendants(pointer))
+
+        if not (self.extend or self.range):
+            # Cost follows the selection, not the scene size
+            for obj in context.selected_objects:
+                obj.select_set(False)
+
+        state = not (self.extend and not self.range and entry.obj.select_get())
+        try:
+            for item in entries:
+                item.obj.select_set(state)
+        except (ReferenceError, RuntimeError):
+            _outliner_index.invalidate()
+            self.report({'WARNING'}, "Object is not in the current view layer")
+            return {'CANCELLED'}
+
+        if state:
+            context.view_layer.objects.active = entry.obj
+        if not self.range:
+            _anchor = entry.name_full
+        return {'FINISHED'}
+
+
+def _collection_branch(index, scene, collection):
+    """The collection and all its descendant collections."""
+    branch = [collection]
+    stack = [collection]
+    while stack:
+        children = index.sub_collections(scene, stack.pop())
+        branch.extend(children)
+        stack.extend(children)
+    return branch
+
+
+def _collection_ancestors(index, collection):
+    ancestors = []
+    pointer = index.collection_parents.get(collection.as_pointer())
+    while pointer in index.collection_parents:
+        ancestors.append(index.collections[pointer])
+        pointer = index.collection_parents[pointer]
+    return ancestors
+
+
+def _layer_collections(view_layer):
+    """Map collection name_full -> LayerCollection of a view layer."""
+    result = {}
+    stack = list(view_layer.layer_collection.children)
+    while stack:
+        layer_collection = stack.pop()
+        result[layer_collection.collection.name_full] = layer_collection
+        stack.extend(layer_collection.children)
+    return result
+
+
+class QPANEL_OT_outliner_visibility(Operator):
+    """Change the visibility of this whole branch in one step"""
+    bl_idname = "qpanel.outliner_visibility"
+    bl_label = "Branch Visibility"
+    bl_options = {'REGISTER', 'UNDO', 'INTERNAL'}
+
+    kind: EnumProperty(
+        items=(
+            ('COLLECTION', "Collection", "Collection and its child collections"),
+            ('OBJECT', "Object", "Object and its children"),
+        ),
+    )
+    name: StringProperty()
+    action: EnumProperty(
+        items=[(identifier, label, description, icon, number)
+               for number, (identifier, label, description, icon) in enumerate(VISIBILITY_ACTIONS)],
+    )
+    menu: BoolProperty(default=False, options={'SKIP_SAVE', 'HIDDEN'})
+
+    def invoke(self, context, event):
+        if not self.menu:
+            return self.execute(context)
+
+        kind, name = self.kind, self.name
+
+        def draw(menu, _context):
+            for identifier, label, _description, icon in VISIBILITY_ACTIONS:
+                if identifier == 'EXCLUDE' and kind != 'COLLECTION':
+                    continue
+                op = menu.layout.operator(self.bl_idname, text=label, icon=icon)
+                op.kind = kind
+                op.name = name
+                op.action = identifier
+
+        context.window_manager.popup_menu(draw, title=name, icon='HIDE_OFF')
+        # Opening the menu changes nothing: no undo step
+        return {'CANCELLED'}
+
+    def _collection_changes(self, context, index, scene):
+        collection = next((c for c in index.collection_map(scene).values() if c.name_full == self.name), None)
+        if collection is None or collection == scene.collection:
+            return None
+
+        if self.action == 'EXCLUDE':
+            layer_collection = _layer_collections(context.view_layer).get(self.name)
+            if layer_collection is None:
+                return None
+            return [(f"exclude/{context.view_layer.name}", layer_collection, self.name, "exclude", True)]
+
+        branch = _collection_branch(index, scene, collection)
+        if self.action == 'HIDE':
+            return [("collections", c, c.name_full, "hide_viewport", True) for c in branch]
+
+        shown = branch + _collection_ancestors(index, collection)
+        changes = [("collections", c, c.name_full, "hide_viewport", False) for c in shown]
+        changes += [("objects", obj, obj.name_full, "hide_viewport", False) for obj in collection.all_objects]
+        if self.action == 'ISOLATE':
+            keep = {c.as_pointer() for c in shown}
+            root = scene.collection.as_pointer()
+            changes += [("collections", c, c.name_full, "hide_viewport", True)
+                        for pointer, c in index.collections.items() if pointer not in keep and pointer != root]
+        return changes
+
+    def _object_changes(self, index):
+        pointer, entry = index.lookup(self.name)
+        if entry is None or self.action == 'EXCLUDE':
+            return None
+
+        branch = [entry] + list(index.descendants(pointer))
+        hide = self.action == 'HIDE'
+        changes = [("objects", e.obj, e.name_full, "hide_viewport", hide) for e in branch]
+        if self.action == 'ISOLATE':
+            keep = {e.name_full for e in branch}
+            changes += [("objects", e.obj, e.name_full, "hide_viewport", True)
+                        for e in index.objects.values() if e.name_full not in keep]
+        return changes
+
+    def execute(self, context):
+        scene = context.scene
+        index = _outliner_index.get_index(scene)
+        if self.kind == 'COLLECTION':
+            changes = self._collection_changes(context, index, scene)
+        else:
+            changes = self._object_changes(index)
+        if changes is None:
+            self.report({'WARNING'}, f"Nothing to change for '{self.name}'")
+            return {'CANCELLED'}
+
+        # Only write values that differ: each RNA write tags an update
+        snapshot = {}
+        count = 0
+        for group, data, name, attr, value in changes:
+            current = getattr(data, attr)
+            if current != value:
+                snapshot.setdefault(group, {})[name] = current
+                setattr(data, attr, value)
+                count += 1
+
+        if snapshot:
+            _snapshots.merge(scene, VISIBILITY_SNAPSHOT, snapshot)
+        self.report({'INFO'}, f"{self.action.title()}: {count} visibility changes")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_outliner_visibility_restore(Operator):
+    """Restore the visibility saved before the branch operations"""
+    bl_idname = "qpanel.outliner_visibility_restore"
+    bl_label = "Restore Visibility"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        return _snapshots.exists(context.scene, VISIBILITY_SNAPSHOT)
+
+    def execute(self, context):
+        scene = context.scene
+        snapshot = _snapshots.load(scene, VISIBILITY_SNAPSHOT) or {}
+        index = _outliner_index.get_index(scene)
+        collections = {c.name_full: c for c in index.collection_map(scene).values()}
+        restored = 0
+
+        for name, value in snapshot.get("collections", {}).items():
+            collection = collections.get(name) or bpy.data.collections.get(name)
+            if collection is not None:
+                collection.hide_viewport = value
+                restored += 1
+
+        for name, value in snapshot.get("objects", {}).items():
+            _pointer, entry = index.lookup(name)
+            obj = entry.obj if entry is not None else bpy.data.objects.get(name)
+            if obj is not None:
+                obj.hide_viewport = value
+                restored += 1
+
+        for group, values in snapshot.items():
+            if not group.startswith("exclude/"):
+                continue
+            view_layer = scene.view_layers.get(group.partition("/")[2])
+            if view_layer is None:
+                continue
+            layer_collections = _layer_collections(view_layer)
+            for name, value in values.items():
+                if name in layer_collections:
+                    layer_collections[name].exclude = value
+                    restored += 1
+
+        _snapshots.discard(scene, VISIBILITY_SNAPSHOT)
+        self.report({'INFO'}, f"Restored {restored} visibility settings")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_outliner_page(Operator):
+    """Scroll the outliner rows"""
+    bl_idname = "qpanel.outliner_page"
+    bl_label = "Scroll Outliner"
+    bl_options = {'INTERNAL'}
+
+    direction: EnumProperty(
+        items=(
+            ('TOP', "Top", "Jump to the first row"),
+            ('UP', "Page Up", "Show the previous page"),
+            ('DOWN', "Page Down", "Show the next page"),
+        ),
+    )
+
+    def execute(self, context):
+        settings = context.window_manager.qpanel_outliner
+        if self.direction == 'TOP':
+            settings.scroll = 0
+        elif self.direction == 'UP':
+            settings.scroll = max(0, settings.scroll - settings.page_size)
+        else:
+            settings.scroll += settings.page_size
+        return {'FINISHED'}
 
 
 class QPANEL_OT_show_outliner(Operator):
@@ -101,27 +709,38 @@ class QPANEL_OT_show_outliner(Operator):
     bl_idname = "qpanel.show_outliner"
     bl_label = "Outliner"
     bl_options = {'REGISTER'}
-    
+
     def invoke(self, context, event):
         return context.window_manager.invoke_popup(self, width=500)
-    
+
     def draw(self, context):
-        panel = QPANEL_PT_outliner()
-        panel.draw(context)
-    
+        draw_outliner(self.layout, context)
+
     def execute(self, context):
         return {'FINISHED'}
 
 
 classes = (
+    QPANEL_PG_outliner,
     QPANEL_PT_outliner,
+    QPANEL_OT_outliner_toggle,
+    QPANEL_OT_outliner_select,
+    QPANEL_OT_outliner_visibility,
+    QPANEL_OT_outliner_visibility_restore,
+    QPANEL_OT_outliner_page,
     QPANEL_OT_show_outliner,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.WindowManager.qpanel_outliner = PointerProperty(type=QPANEL_PG_outliner)
+    _outliner_index.register()
+    _collection_stats.register()
 
 def unregister():
+    _collection_stats.unregister()
+    _outliner_index.unregister()
+    del bpy.types.WindowManager.qpanel_outliner
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -4,10 +4,23 @@ QPanel Assets - Properties Panels
 Essential properties panels (Modifiers, Materials, Object Data)
 
 Based on Blender's native properties_*.py files
+
+The modifier list can profile the active object's stack: evaluation time
+and added geometry per modifier (_modifier_profiler), cached until the
+stack changes. Viewport simplification caps or disables heavy modifiers
+scene-wide in one step and keeps the previous values in a scene snapshot.
+The audit lists every modifier of the scene (_modifier_audit) with levels,
+estimated output faces and totals per type.
 """
 
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, Operator, PropertyGroup
+from bpy.props import BoolProperty, EnumProperty, IntProperty, PointerProperty, StringProperty
+
+from . import _format, _modifier_audit, _modifier_profiler, _snapshots
+
+
+SIMPLIFY_SNAPSHOT = "modifier_simplify"
 
 
 class QPANEL_PT_modifiers(Panel):
@@ -30,14 +43,290 @@ class QPANEL_PT_modifiers(Panel):
             layout.label(text="No modifiers", icon='INFO')
             return
         
+        results = _modifier_profiler.results(obj)
+        row = layout.row()
+        row.operator("qpanel.profile_modifiers", icon='TIME',
+                     text="Re-profile Stack" if results else "Profile Stack")
+        if results:
+            row.label(text=f"Total: {sum(entry[0] for entry in results.values()):.1f} ms")
+        
         for mod in obj.modifiers:
             box = layout.box()
             row = box.row()
             row.label(text=mod.name, icon='MODIFIER')
+            if results and mod.name in results:
+                ms, _vertices, faces = results[mod.name]
+                sign = "+" if faces >= 0 else "-"
+                row.label(text=f"{ms:.1f} ms  {sign}{_format.format_count(abs(faces))} f")
             row.prop(mod, "show_viewport", text="")
             row.prop(mod, "show_render", text="")
 
 
+class QPANEL_OT_profile_modifiers(Operator):
+    """Time each viewport modifier of the active object by re-evaluating the stack one modifier at a time"""
+    bl_idname = "qpanel.profile_modifiers"
+    bl_label = "Profile Modifiers"
+    bl_options = {'REGISTER'}
+    
+    @classmethod
+    def poll(cls, context):
+        return context.object is not None and context.object.mode == 'OBJECT' and len(context.object.modifiers) > 0
+    
+    def execute(self, context):
+        obj = context.object
+        results = _modifier_profiler.profile(context, obj)
+        if not results:
+            self.report({'INFO'}, "No modifiers enabled in the viewport")
+            return {'CANCELLED'}
+        
+        name, (ms, _vertices, _faces) = max(results.items(), key=lambda item: item[1][0])
+        self.report({'INFO'}, f"Slowest: {name} ({ms:.1f} ms)")
+        return {'FINISHED'}
+
+
+def _audit_filter_update(self, context):
+    self.audit_page = 0
+
+
+class QPANEL_PG_modifier_tools(PropertyGroup):
+    """Scene-wide modifier tool settings"""
+    scope: EnumProperty(
+        name="Scope",
+        items=(
+            ('SCENE', "Scene", "Every object of the scene"),
+            ('SELECTED', "Selected", "Selected objects only"),
+        ),
+        default='SCENE',
+    )
+    subdivision_max: IntProperty(
+        name="Max Subdivision",
+        description="Cap viewport levels of Subdivision Surface and Multiresolution modifiers",
+        default=1,
+        min=0,
+        max=6,
+    )
+    array_max: IntProperty(
+        name="Max Array Count",
+        description="Hide Array modifiers with more copies than this in viewports",
+        default=16,
+        min=1,
+    )
+    disable_booleans: BoolProperty(
+        name="Booleans",
+        description="Hide Boolean modifiers in viewports",
+        default=True,
+    )
+    disable_remesh: BoolProperty(
+        name="Remesh",
+        description="Hide Remesh modifiers in viewports",
+        default=True,
+    )
+    audit_filter: StringProperty(
+        name="Filter",
+        description="Show modifiers whose object, name or type contains this text",
+        options={'TEXTEDIT_UPDATE'},
+        update=_audit_filter_update,
+    )
+    audit_sort: EnumProperty(
+        name="Sort By",
+        items=(
+            ('RENDER_FACES', "Render Faces", "Estimated output faces at render time"),
+            ('VIEWPORT_FACES', "Viewport Faces", "Estimated output faces in viewports"),
+            ('RENDER_LEVELS', "Render Levels", "Render levels, steps or count"),
+            ('VIEWPORT_LEVELS', "Viewport Levels", "Viewport levels, steps or count"),
+            ('TYPE', "Type", "Modifier type"),
+            ('OBJECT', "Object", "Object name"),
+        ),
+        default='RENDER_FACES',
+    )
+    audit_reverse: BoolProperty(
+        name="Descending",
+        default=True,
+    )
+    audit_page: IntProperty(
+        name="Page",
+        description="Current audit page",
+        default=0,
+        min=0,
+    )
+    audit_page_size: IntProperty(
+        name="Rows",
+        description="Modifiers per page",
+        default=20,
+        min=5,
+        max=200,
+    )
+
+
+def _simplify_changes(mod, settings):
+    """[(attribute, value)] that simplify one modifier in viewports only."""
+    if not mod.show_viewport:
+        return []
+    if mod.type in {'SUBSURF', 'MULTIRES'} and mod.levels > settings.subdivision_max:
+        return [("levels", settings.subdivision_max)]
+    if mod.type == 'ARRAY' and mod.fit_type == 'FIXED_COUNT' and mod.count > settings.array_max:
+        return [("show_viewport", False)]
+    if mod.type == 'BOOLEAN' and settings.disable_booleans:
+        return [("show_viewport", False)]
+    if mod.type == 'REMESH' and settings.disable_remesh:
+        return [("show_viewport", False)]
+    return []
+
+
+def _snapshot_group(obj, mod):
+    return f"{obj.name_full}\t{mod.name}"
+
+
+class QPANEL_OT_simplify_modifiers(Operator):
+    """Cap or hide heavy modifiers in viewports (render settings are untouched); restorable"""
+    bl_idname = "qpanel.simplify_modifiers"
+    bl_label = "Simplify Viewport"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        settings = context.window_manager.qpanel_modifier_tools
+        objects = context.selected_objects if settings.scope == 'SELECTED' else context.scene.objects
+        
+        snapshot = {}
+        changed = 0
+        for obj in objects:
+            for mod in obj.modifiers:
+                for attribute, value in _simplify_changes(mod, settings):
+                    snapshot.setdefault(_snapshot_group(obj, mod), {})[attribute] = getattr(mod, attribute)
+                    setattr(mod, attribute, value)
+                    changed += 1
+        
+        if not changed:
+            self.report({'INFO'}, "Nothing to simplify")
+            return {'CANCELLED'}
+        
+        _snapshots.merge(context.scene, SIMPLIFY_SNAPSHOT, snapshot)
+        self.report({'INFO'}, f"Simplified {len(snapshot)} modifiers")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_restore_modifiers(Operator):
+    """Restore the modifier settings saved by Simplify Viewport"""
+    bl_idname = "qpanel.restore_modifiers"
+    bl_label = "Restore Modifiers"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return _snapshots.exists(context.scene, SIMPLIFY_SNAPSHOT)
+    
+    def execute(self, context):
+        scene = context.scene
+        snapshot = _snapshots.load(scene, SIMPLIFY_SNAPSHOT) or {}
+        restored = 0
+        missing = 0
+        for group, values in snapshot.items():
+            object_name, _tab, modifier_name = group.partition("\t")
+            obj = bpy.data.objects.get(object_name)
+            mod = obj.modifiers.get(modifier_name) if obj is not None else None
+            if mod is None:
+                missing += 1
+                continue
+            for attribute, value in values.items():
+                setattr(mod, attribute, value)
+            restored += 1
+        
+        _snapshots.discard(scene, SIMPLIFY_SNAPSHOT)
+        message = f"Restored {restored} modifiers"
+        if missing:
+            message += f" ({missing} no longer exist)"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class QPANEL_PT_modifier_simplify(Panel):
+    """Scene-wide Viewport Simplification"""
+    bl_label = "Simplify Modifiers"
+    bl_idname = "QPANEL_PT_modifier_simplify"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'OBJECT'
+    
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.qpanel_modifier_tools
+        
+        layout.row().prop(settings, "scope", expand=True)
+        col = layout.column(align=True)
+        col.prop(settings, "subdivision_max")
+        col.prop(settings, "array_max")
+        row = layout.row(align=True)
+        row.prop(settings, "disable_booleans", toggle=True)
+        row.prop(settings, "disable_remesh", toggle=True)
+        
+        row = layout.row(align=True)
+        row.operator("qpanel.simplify_modifiers", icon='MOD_DECIM')
+        row.operator("qpanel.restore_modifiers", icon='LOOP_BACK')
+        if _snapshots.exists(context.scene, SIMPLIFY_SNAPSHOT):
+            layout.label(text="Original settings saved in the scene", icon='INFO')
+
+
+class QPANEL_PT_modifier_audit(Panel):
+    """Every modifier of the scene, sortable, with estimated output per type"""
+    bl_label = "Modifier Audit"
+    bl_idname = "QPANEL_PT_modifier_audit"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'OBJECT'
+    
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.qpanel_modifier_tools
+        audit = _modifier_audit.get_audit(context.scene)
+        
+        if not len(audit):
+            layout.label(text="No modifiers in the scene", icon='INFO')
+            return
+        
+        # Totals per type, heaviest first
+        box = layout.box()
+        totals = sorted(audit.totals().items(), key=lambda item: -item[1][1])
+        for kind, (count, faces) in totals:
+            row = box.row()
+            row.label(text=kind.title())
+            row.label(text=f"{count}x")
+            row.label(text=f"{_format.format_count(round(faces))} f")
+        
+        layout.prop(settings, "audit_filter", text="", icon='VIEWZOOM')
+        row = layout.row(align=True)
+        row.prop(settings, "audit_sort", text="")
+        row.prop(settings, "audit_reverse", text="", icon='SORT_DESC' if settings.audit_reverse else 'SORT_ASC')
+        row.prop(settings, "audit_page_size", text="Rows")
+        
+        view = audit.view(settings.audit_sort, settings.audit_reverse, settings.audit_filter)
+        pages = max(1, -(-len(view) // settings.audit_page_size))
+        page = min(settings.audit_page, pages - 1)
+        start = page * settings.audit_page_size
+        
+        col = layout.column(align=True)
+        header = col.row()
+        header.label(text="Object / Modifier")
+        header.label(text="Type")
+        header.label(text="Levels V / R")
+        header.label(text="Faces V / R")
+        for index in view[start:start + settings.audit_page_size]:
+            flags = audit.flags[index]
+            row = col.row()
+            row.label(text=f"{audit.object_name(index)} / {audit.names[index]}",
+                      icon='RESTRICT_VIEW_OFF' if flags & _modifier_audit.FLAG_VIEWPORT else 'RESTRICT_VIEW_ON')
+            row.label(text=audit.types[index].title())
+            viewport_levels = audit.viewport_levels[index]
+            render_levels = audit.render_levels[index]
+            row.label(text="-" if viewport_levels < 0 else f"{viewport_levels} / {render_levels}")
+            row.label(text=f"{_format.format_count(round(audit.viewport_faces[index]))} / "
+                           f"{_format.format_count(round(audit.render_faces[index]))}",
+                      icon='RESTRICT_RENDER_OFF' if flags & _modifier_audit.FLAG_RENDER else 'RESTRICT_RENDER_ON')
+        
+        row = layout.row(align=True)
+        row.prop(settings, "audit_page", text="Page")
+        row.label(text=f"of {pages}  ·  {len(view)} modifiers")
+
+
 class QPANEL_PT_materials(Panel):
     """Materials List"""
     bl_label = "Materials"
@@ -68,22 +357,9 @@ class QPANEL_PT_materials(Panel):
                 box.label(text="Empty Slot", icon='INFO')
 
 
-# Classes to register
-classes = (
-    QPANEL_PT_modifiers,
-    QPANEL_PT_materials,
-)
-
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
-
+class QPANEL_PT_constraints(Panel):
+    """Constraints List"""
+    bl_label = "Constraints"
     bl_idname = "QPANEL_PT_constraints"
     bl_space_type = 'VIEW_3D'
     bl_region_type = 'WINDOW'
@@ -108,17 +384,31 @@ def unregister():
             row.prop(con, "mute", text="")
 
 
+# Classes to register
 classes = (
     QPANEL_PT_modifiers,
+    QPANEL_OT_profile_modifiers,
+    QPANEL_PG_modifier_tools,
+    QPANEL_OT_simplify_modifiers,
+    QPANEL_OT_restore_modifiers,
+    QPANEL_PT_modifier_simplify,
+    QPANEL_PT_modifier_audit,
     QPANEL_PT_materials,
-    QPANEL_PT_object_data,
     QPANEL_PT_constraints,
 )
 
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.WindowManager.qpanel_modifier_tools = PointerProperty(type=QPANEL_PG_modifier_tools)
+    _modifier_profiler.register()
+    _modifier_audit.register()
+
 
 def unregister():
+    _modifier_audit.unregister()
+    _modifier_profiler.unregister()
+    del bpy.types.WindowManager.qpanel_modifier_tools
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -4,10 +4,31 @@ QPanel Assets - Mesh Data Properties
 Mesh editing, geometry, and mesh tools
 
 Based on Blender's properties_data_mesh.py
+
+Extended statistics are computed with foreach_get/NumPy by _mesh_stats and
+cached per mesh until its geometry changes. Evaluated counts come from the
+depsgraph and are cached per object until its next update.
 """
 
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, PropertyGroup
+from bpy.props import BoolProperty, PointerProperty
+
+from . import _format, _mesh_stats
+
+
+class QPANEL_PG_mesh_stats(PropertyGroup):
+    """Mesh statistics options"""
+    show_extended: BoolProperty(
+        name="Extended Statistics",
+        description="Triangles, face types, loose elements, bounds, area and memory (cached per mesh)",
+        default=False,
+    )
+    show_evaluated: BoolProperty(
+        name="Evaluated Counts",
+        description="Vertex/face counts after modifiers (read from the evaluated depsgraph)",
+        default=False,
+    )
 
 
 class QPANEL_PT_mesh_data(Panel):
@@ -24,15 +45,67 @@ class QPANEL_PT_mesh_data(Panel):
     
     def draw(self, context):
         layout = self.layout
-        mesh = context.active_object.data
+        ob = context.active_object
+        mesh = ob.data
+        vertices, edges, faces = _mesh_stats.base_counts(ob)
         
         col = layout.column()
         col.label(text="Mesh Info:", icon='MESH_DATA')
         
         stats = col.column(align=True)
-        stats.label(text=f"Vertices: {len(mesh.vertices)}")
-        stats.label(text=f"Edges: {len(mesh.edges)}")
-        stats.label(text=f"Faces: {len(mesh.polygons)}")
+        stats.label(text=f"Vertices: {vertices}")
+        stats.label(text=f"Edges: {edges}")
+        stats.label(text=f"Faces: {faces}")
+        
+        settings = context.window_manager.qpanel_mesh_stats
+        row = layout.row(align=True)
+        row.prop(settings, "show_evaluated", toggle=True, icon='MODIFIER')
+        row.prop(settings, "show_extended", toggle=True, icon='INFO')
+        if settings.show_evaluated:
+            self.draw_evaluated(layout, context, faces)
+        if settings.show_extended:
+            self.draw_extended(layout, context, mesh)
+    
+    @staticmethod
+    def draw_evaluated(layout, context, base_faces):
+        """Post-modifier counts (cached until the object's next depsgraph update)"""
+        ob = context.active_object
+        vertices, edges, faces, triangles = _mesh_stats.evaluated_counts(
+            ob, context.evaluated_depsgraph_get())
+        count = _format.format_count
+        
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text="Evaluated:", icon='MODIFIER')
+        col.label(text=f"Vertices: {count(vertices)}  Edges: {count(edges)}")
+        col.label(text=f"Faces: {count(faces)}  Triangles: {count(triangles)}")
+        if base_faces and faces > base_faces:
+            col.label(text=f"{faces / base_faces:.1f}x the base faces")
+
+    @staticmethod
+    def draw_extended(layout, context, mesh):
+        """Cached vectorized statistics of the mesh"""
+        if context.active_object.mode == 'EDIT':
+            layout.label(text="Leave Edit Mode to update extended statistics", icon='INFO')
+        
+        data = _mesh_stats.mesh_stats(mesh)
+        count = _format.format_count
+        
+        box = layout.box()
+        col = box.column(align=True)
+        col.label(text=f"Triangles: {count(data['triangles'])}")
+        col.label(text=f"Tris / Quads / N-gons: {count(data['tris'])} / "
+                       f"{count(data['quads'])} / {count(data['ngons'])}")
+        col.label(text=f"Loose Vertices: {data['loose_vertices']}  Loose Edges: {data['loose_edges']}")
+        
+        unit_settings = context.scene.unit_settings
+        size = [high - low for low, high in zip(data['bbox_min'], data['bbox_max'])]
+        col.label(text="Bounds: " + " x ".join(
+            bpy.utils.units.to_string(unit_settings.system, 'LENGTH', value * unit_settings.scale_length)
+            for value in size))
+        area = data['area'] * unit_settings.scale_length ** 2
+        col.label(text="Surface Area: " + bpy.utils.units.to_string(unit_settings.system, 'AREA', area))
+        col.label(text=f"Estimated Memory: {_format.format_bytes(data['memory'])}")
 
 
 class QPANEL_PT_mesh_normals(Panel):
@@ -137,6 +210,7 @@ class QPANEL_PT_mesh_uv_maps(Panel):
 
 # Registration
 classes = (
+    QPANEL_PG_mesh_stats,
     QPANEL_PT_mesh_data,
     QPANEL_PT_mesh_normals,
     QPANEL_PT_mesh_vertex_groups,
@@ -147,7 +221,11 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.WindowManager.qpanel_mesh_stats = PointerProperty(type=QPANEL_PG_mesh_stats)
+    _mesh_stats.register()
 
 def unregister():
+    _mesh_stats.unregister()
+    del bpy.types.WindowManager.qpanel_mesh_stats
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -4,10 +4,17 @@ QPanel Assets - Particle System Properties
 Particle systems, hair, and emitters
 
 Based on Blender's properties_particle.py
+
+The display budget panel fits the viewport display percentage of every
+particle system in the scene to one particle or polygon budget
+(_particle_budget) and restores the original percentages in one step.
 """
 
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, Operator, PropertyGroup
+from bpy.props import EnumProperty, IntProperty, PointerProperty
+
+from . import _format, _particle_budget, _snapshots
 
 
 class QPANEL_PT_particle_system(Panel):
@@ -131,18 +138,118 @@ class QPANEL_PT_particle_render(Panel):
             col.prop(settings, "instance_collection", text="Instance Collection")
 
 
+class QPANEL_PG_particle_budget(PropertyGroup):
+    """Viewport particle budget settings"""
+    mode: EnumProperty(
+        name="Budget",
+        items=(
+            ('PARTICLES', "Particles", "Limit the number of particles displayed"),
+            ('POLYGONS', "Polygons", "Limit displayed particles times the faces of their instance object or collection"),
+        ),
+        default='PARTICLES',
+    )
+    budget: IntProperty(
+        name="Budget",
+        description="Total particles (or instanced polygons) to display in viewports",
+        default=1_000_000,
+        min=1,
+    )
+
+
+class QPANEL_OT_particle_budget_fit(Operator):
+    """Lower the viewport display percentage of the heaviest particle systems until the scene fits the budget (restorable)"""
+    bl_idname = "qpanel.particle_budget_fit"
+    bl_label = "Fit Budget"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        settings = context.window_manager.qpanel_particle_budget
+        budget, before, after, rows = _particle_budget.fit(context.scene, settings.budget, settings.mode)
+        if not rows:
+            self.report({'INFO'}, "No particle systems in the scene")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Displayed: {_format.format_count(round(before))} → "
+                              f"{_format.format_count(round(after))}")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_particle_budget_restore(Operator):
+    """Restore the display percentages saved by Fit Budget"""
+    bl_idname = "qpanel.particle_budget_restore"
+    bl_label = "Restore Percentages"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return _snapshots.exists(context.scene, _particle_budget.SNAPSHOT)
+    
+    def execute(self, context):
+        restored, missing = _particle_budget.restore(context.scene)
+        message = f"Restored {restored} particle settings"
+        if missing:
+            message += f" ({missing} no longer exist)"
+        self.report({'INFO'}, message)
+        return {'FINISHED'}
+
+
+class QPANEL_PT_particle_budget(Panel):
+    """Viewport Particle Budget"""
+    bl_label = "Display Budget"
+    bl_idname = "QPANEL_PT_particle_budget"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'PARTICLES'
+    
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.qpanel_particle_budget
+        
+        layout.row().prop(settings, "mode", expand=True)
+        layout.prop(settings, "budget")
+        row = layout.row(align=True)
+        row.operator("qpanel.particle_budget_fit", icon='PARTICLES')
+        row.operator("qpanel.particle_budget_restore", icon='LOOP_BACK')
+        
+        fit = _particle_budget.last_fit()
+        if fit is None:
+            if _snapshots.exists(context.scene, _particle_budget.SNAPSHOT):
+                layout.label(text="Original percentages saved in the scene", icon='INFO')
+            return
+        
+        budget, before, after, rows = fit
+        format_count = _format.format_count
+        layout.label(text=f"{format_count(round(before))} → {format_count(round(after))} "
+                          f"(budget {format_count(budget)})")
+        col = layout.column(align=True)
+        for name, cost, original, percentage in rows[:10]:
+            row = col.row()
+            row.label(text=name, icon='PARTICLE_DATA')
+            row.label(text=format_count(round(cost)))
+            row.label(text=f"{original}% → {percentage}%" if percentage != original else f"{original}%")
+        if len(rows) > 10:
+            col.label(text=f"... {len(rows) - 10} more")
+
+
 # Registration
 classes = (
     QPANEL_PT_particle_system,
     QPANEL_PT_particle_emission,
     QPANEL_PT_particle_velocity,
     QPANEL_PT_particle_render,
+    QPANEL_PG_particle_budget,
+    QPANEL_OT_particle_budget_fit,
+    QPANEL_OT_particle_budget_restore,
+    QPANEL_PT_particle_budget,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.WindowManager.qpanel_particle_budget = PointerProperty(type=QPANEL_PG_particle_budget)
+    _particle_budget.register()
 
 def unregister():
+    _particle_budget.unregister()
+    del bpy.types.WindowManager.qpanel_particle_budget
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
@@ -4,10 +4,21 @@ QPanel Assets - Physics Properties
 Rigidbody, cloth, fluid, and physics simulation
 
 Based on Blender's properties_physics_*.py
+
+Panels find their modifier through the shared type index
+(_modifier_index) instead of scanning the stack on every redraw. The
+cache inspector lists the scene's simulation caches on disk
+(_point_cache): frames, gaps, size per frame and per object, and purges
+frames outside each cache's range. The bake queue (_bake_queue) bakes
+every simulation of the scene in dependency order, one at a time, and
+keeps a per-sim, per-frame timing report on the scene for resuming.
 """
 
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, Operator
+from bpy.props import BoolProperty, StringProperty
+
+from . import _bake_queue, _format, _modifier_index, _point_cache
 
 
 class QPANEL_PT_physics_rigidbody(Panel):
@@ -56,12 +67,7 @@ class QPANEL_PT_physics_cloth(Panel):
         layout = self.layout
         ob = context.active_object
         
-        # Find cloth modifier
-        cloth_mod = None
-        for mod in ob.modifiers:
-            if mod.type == 'CLOTH':
-                cloth_mod = mod
-                break
+        cloth_mod = _modifier_index.modifier_of_type(ob, 'CLOTH')
         
         if cloth_mod:
             cloth = cloth_mod.settings
@@ -94,12 +100,7 @@ class QPANEL_PT_physics_collision(Panel):
         layout = self.layout
         ob = context.active_object
         
-        # Find collision modifier
-        collision_mod = None
-        for mod in ob.modifiers:
-            if mod.type == 'COLLISION':
-                collision_mod = mod
-                break
+        collision_mod = _modifier_index.modifier_of_type(ob, 'COLLISION')
         
         if collision_mod:
             coll = collision_mod.settings
@@ -128,12 +129,7 @@ class QPANEL_PT_physics_fluid(Panel):
         layout = self.layout
         ob = context.active_object
         
-        # Find fluid modifier
-        fluid_mod = None
-        for mod in ob.modifiers:
-            if mod.type == 'FLUID':
-                fluid_mod = mod
-                break
+        fluid_mod = _modifier_index.modifier_of_type(ob, 'FLUID')
         
         if fluid_mod:
             col = layout.column()
@@ -143,18 +139,279 @@ class QPANEL_PT_physics_fluid(Panel):
             col.operator("object.modifier_add", text="Add Fluid", icon='MOD_FLUIDSIM').type = 'FLUID'
 
 
+class QPANEL_OT_point_cache_scan(Operator):
+    """List the scene's simulation caches on disk (directories are read in the background)"""
+    bl_idname = "qpanel.point_cache_scan"
+    bl_label = "Scan Caches"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        count = _point_cache.scan(context.scene)
+        if not count:
+            self.report({'INFO'}, "No disk caches in the scene")
+        return {'FINISHED'}
+
+
+class QPANEL_OT_point_cache_purge(Operator):
+    """Delete cached frames outside each cache's frame range"""
+    bl_idname = "qpanel.point_cache_purge"
+    bl_label = "Purge Out-of-Range Frames"
+    bl_options = {'REGISTER'}
+    
+    owner: StringProperty(
+        name="Object",
+        description="Only purge the caches of this object (all caches when empty)",
+        default="",
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        return _point_cache.has_scanned() and not _point_cache.is_scanning()
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_confirm(self, event)
+    
+    def execute(self, context):
+        reports = [cache_report for cache_report in _point_cache.report()
+                   if not self.owner or cache_report.source.owner == self.owner]
+        files, freed = _point_cache.purge_out_of_range(reports)
+        if not files:
+            self.report({'INFO'}, "No out-of-range frames")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Deleting {files} files ({_format.format_bytes(freed)})")
+        return {'FINISHED'}
+
+
+class QPANEL_PT_physics_cache(Panel):
+    """Simulation Caches on Disk"""
+    bl_label = "Cache Inspector"
+    bl_idname = "QPANEL_PT_physics_cache"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'PHYSICS'
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        row = layout.row(align=True)
+        row.operator("qpanel.point_cache_scan", icon='FILE_REFRESH',
+                     text="Rescan" if _point_cache.has_scanned() else "Scan Caches")
+        row.operator("qpanel.point_cache_purge", icon='TRASH', text="Purge All").owner = ""
+        
+        if _point_cache.is_scanning():
+            layout.label(text="Reading cache directories...", icon='SORTTIME')
+        purge = _point_cache.last_purge()
+        if purge is not None:
+            deleted, freed, failed = purge
+            text = f"Last purge: {deleted} files, {_format.format_bytes(freed)}"
+            layout.label(text=text + (f", {failed} failed" if failed else ""), icon='INFO')
+        if not _point_cache.has_scanned():
+            return
+        
+        reports = _point_cache.report()
+        if not reports:
+            layout.label(text="No disk caches (memory caches are not listed)", icon='INFO')
+            return
+        
+        totals = _point_cache.totals_by_owner(reports)
+        layout.label(text=f"Total: {_format.format_bytes(sum(totals.values()))}")
+        
+        for owner in sorted(totals, key=lambda name: -totals[name]):
+            box = layout.box()
+            row = box.row()
+            row.label(text=owner, icon='OBJECT_DATA')
+            row.label(text=_format.format_bytes(totals[owner]))
+            row.operator("qpanel.point_cache_purge", text="", icon='TRASH').owner = owner
+            
+            for cache_report in reports:
+                source = cache_report.source
+                if source.owner != owner:
+                    continue
+                col = box.column(align=True)
+                col.label(text=f"{source.label} ({source.kind.replace('_', ' ').title()})")
+                if not cache_report.frames:
+                    col.label(text="No cached frames", icon='BLANK1')
+                    continue
+                frames = cache_report.frames
+                col.label(text=f"Frames {min(frames)}-{max(frames)}: {len(frames)} cached, "
+                               f"range {source.frame_start}-{source.frame_end}", icon='BLANK1')
+                col.label(text=f"{_format.format_bytes(cache_report.total / len(frames))} per frame, "
+                               f"{_format.format_bytes(max(frames.values()))} max", icon='BLANK1')
+                gaps = _point_cache.gaps(cache_report)
+                if gaps:
+                    shown = ", ".join(f"{first}-{last}" if last > first else str(first) for first, last in gaps[:4])
+                    col.label(text=f"Gaps: {shown}" + (" ..." if len(gaps) > 4 else ""), icon='ERROR')
+                outside = _point_cache.out_of_range(cache_report)
+                if outside:
+                    wasted = sum(frames[frame] for frame in outside)
+                    col.label(text=f"{len(outside)} frames out of range ({_format.format_bytes(wasted)})", icon='TRASH')
+
+
+_STATUS_ICONS = {
+    'PENDING': 'SORTTIME',
+    'BAKED': 'CHECKMARK',
+    'DONE': 'CHECKMARK',
+    'FAILED': 'ERROR',
+}
+
+
+class QPANEL_OT_bake_queue(Operator):
+    """Bake every simulation of the scene one after another, in dependency order (Esc stops after the current bake)"""
+    bl_idname = "qpanel.bake_queue"
+    bl_label = "Bake Queue"
+    bl_options = {'REGISTER'}
+    
+    resume: BoolProperty(
+        name="Resume",
+        description="Continue the stored queue with the simulations not baked yet",
+        default=False,
+    )
+    skip_baked: BoolProperty(
+        name="Skip Baked",
+        description="Leave simulations whose cache is already baked",
+        default=True,
+    )
+    
+    _timer = None
+    
+    def _start(self, context):
+        scene = context.scene
+        report = _bake_queue.load_report(scene) if self.resume else None
+        if report is None:
+            report = _bake_queue.new_report(scene, _bake_queue.collect(scene), self.skip_baked)
+        _bake_queue.save_report(scene, report)
+        return report
+    
+    def execute(self, context):
+        # Blocking variant, for scripts and background mode
+        report = self._start(context)
+        while True:
+            sim, error = _bake_queue.bake_next(context, report)
+            if sim is None:
+                self.report({'INFO'}, "Bake queue finished")
+                return {'FINISHED'}
+            if error:
+                self.report({'ERROR'}, f"{sim.owner} / {sim.label}: {error}")
+                return {'CANCELLED'}
+    
+    def invoke(self, context, event):
+        report = self._start(context)
+        if _bake_queue.next_sim(report) is None:
+            self.report({'INFO'}, "Nothing to bake")
+            return {'CANCELLED'}
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.1, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            return self._finish(context, {'WARNING'}, "Bake queue stopped; resume to continue")
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        
+        # One bake per timer event: the UI redraws between simulations
+        report = _bake_queue.load_report(context.scene)
+        if report is None:
+            return self._finish(context, {'WARNING'}, "Bake report was removed")
+        sim, error = _bake_queue.bake_next(context, report)
+        if sim is None:
+            return self._finish(context, {'INFO'}, "Bake queue finished")
+        if error:
+            return self._finish(context, {'ERROR'}, f"{sim.owner} / {sim.label}: {error}")
+        for area in context.screen.areas:
+            area.tag_redraw()
+        return {'RUNNING_MODAL'}
+    
+    def _finish(self, context, level, message):
+        context.window_manager.event_timer_remove(self._timer)
+        self.report(level, message)
+        return {'FINISHED'}
+
+
+class QPANEL_OT_bake_queue_clear(Operator):
+    """Remove the stored bake report (caches are kept)"""
+    bl_idname = "qpanel.bake_queue_clear"
+    bl_label = "Clear Bake Report"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return _bake_queue.load_report(context.scene) is not None
+    
+    def execute(self, context):
+        _bake_queue.discard_report(context.scene)
+        return {'FINISHED'}
+
+
+class QPANEL_PT_physics_bake_queue(Panel):
+    """Dependency-ordered Simulation Baking"""
+    bl_label = "Bake Queue"
+    bl_idname = "QPANEL_PT_physics_bake_queue"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'PHYSICS'
+    
+    def draw(self, context):
+        layout = self.layout
+        report = _bake_queue.load_report(context.scene)
+        
+        row = layout.row(align=True)
+        row.operator("qpanel.bake_queue", icon='PHYSICS').resume = False
+        sub = row.row(align=True)
+        sub.enabled = report is not None and _bake_queue.next_sim(report) is not None
+        sub.operator("qpanel.bake_queue", text="Resume", icon='PLAY').resume = True
+        row.operator("qpanel.bake_queue_clear", text="", icon='X')
+        
+        if report is None:
+            layout.label(text="No bake report yet", icon='INFO')
+            return
+        
+        total = sum(entry["seconds"] for entry in report["sims"].values())
+        layout.label(text=f"Total bake time: {total:.1f} s")
+        col = layout.column(align=True)
+        for key in report["order"]:
+            sim = _bake_queue.sim_from_key(key)
+            entry = report["sims"][key]
+            box = col.box()
+            row = box.row()
+            row.label(text=f"{sim.owner} / {sim.label}", icon=_STATUS_ICONS.get(entry["status"], 'DOT'))
+            row.label(text=sim.kind.replace('_', ' ').title())
+            if entry["status"] == 'DONE':
+                share = entry["seconds"] / total * 100.0 if total else 0.0
+                row.label(text=f"{entry['seconds']:.1f} s ({share:.0f}%)")
+                slowest = _bake_queue.slowest_frames(entry)
+                if slowest:
+                    frames = ", ".join(f"{frame}: {seconds:.2f} s" for frame, seconds in slowest)
+                    box.label(text=f"{len(entry['frames'])} frames, slowest {frames}", icon='BLANK1')
+            elif entry["status"] == 'FAILED':
+                box.label(text=entry["error"], icon='BLANK1')
+            else:
+                row.label(text=entry["status"].title())
+
+
 # Registration
 classes = (
     QPANEL_PT_physics_rigidbody,
     QPANEL_PT_physics_cloth,
     QPANEL_PT_physics_collision,
     QPANEL_PT_physics_fluid,
+    QPANEL_OT_point_cache_scan,
+    QPANEL_OT_point_cache_purge,
+    QPANEL_PT_physics_cache,
+    QPANEL_OT_bake_queue,
+    QPANEL_OT_bake_queue_clear,
+    QPANEL_PT_physics_bake_queue,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    _modifier_index.register()
+    _point_cache.register()
 
 def unregister():
+    _point_cache.unregister()
+    _modifier_index.unregister()
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
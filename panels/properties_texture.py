@@ -4,10 +4,19 @@ QPanel Assets - Texture Properties
 Texture settings and image textures
 
 Based on Blender's properties_texture.py
+
+Image sizes come from _image_probe (file headers, cached, background
+threads): drawing the list never loads pixel buffers. Table mode pages,
+filters and sorts the cached rows of _image_table. The memory budget
+frees least recently used image buffers (_image_budget). Duplicates are
+found by content hash in background threads (_image_dedupe).
 """
 
 import bpy
-from bpy.types import Panel
+from bpy.types import Panel, Operator, PropertyGroup
+from bpy.props import BoolProperty, IntProperty, StringProperty, EnumProperty, PointerProperty
+
+from . import _format, _image_budget, _image_dedupe, _image_probe, _image_table
 
 
 class QPANEL_PT_texture_settings(Panel):
@@ -26,6 +35,72 @@ class QPANEL_PT_texture_settings(Panel):
         col.label(text="(Use Shader Editor for modern workflow)")
 
 
+def _filter_update(self, context):
+    self.page = 0
+
+
+def _auto_budget_update(self, context):
+    _image_budget.set_auto(self.auto_budget)
+
+
+class QPANEL_PG_texture_table(PropertyGroup):
+    """Texture table view state"""
+    table_mode: BoolProperty(
+        name="Table",
+        description="Show images as a paginated, sortable table",
+        default=False,
+    )
+    filter: StringProperty(
+        name="Filter",
+        description="Only show images whose name contains this text",
+        default="",
+        options={'TEXTEDIT_UPDATE'},
+        update=_filter_update,
+    )
+    sort_by: EnumProperty(
+        name="Sort By",
+        items=(
+            ('NAME', "Name", "Sort by image name"),
+            ('RESOLUTION', "Resolution", "Sort by pixel count"),
+            ('MEMORY', "Memory", "Sort by estimated pixel buffer size (width x height x channels x bytes)"),
+            ('DISK', "Disk", "Sort by file size (packed size for packed images)"),
+            ('USERS', "Users", "Sort by user count"),
+            ('STATE', "State", "Sort by packed / loaded state"),
+        ),
+        default='MEMORY',
+    )
+    sort_reverse: BoolProperty(
+        name="Descending",
+        description="Largest first",
+        default=True,
+    )
+    page: IntProperty(
+        name="Page",
+        description="Current table page",
+        default=0,
+        min=0,
+    )
+    page_size: IntProperty(
+        name="Rows per Page",
+        default=25,
+        min=5,
+        max=200,
+    )
+    budget_mb: IntProperty(
+        name="Budget (MB)",
+        description="RAM allowed for image pixel buffers",
+        default=8192,
+        min=64,
+        soft_max=65536,
+    )
+    auto_budget: BoolProperty(
+        name="Auto Unload",
+        description="Free least recently used image buffers whenever the budget is exceeded",
+        default=False,
+        update=_auto_budget_update,
+    )
+
+
 class QPANEL_PT_texture_image(Panel):
     """Image Texture"""
     bl_label = "Image Texture"
@@ -37,16 +112,22 @@ class QPANEL_PT_texture_image(Panel):
     def draw(self, context):
         layout = self.layout
         
+        settings = context.window_manager.qpanel_texture_table
+        
+        row = layout.row()
+        row.label(text="Image Textures:", icon='IMAGE_DATA')
+        row.prop(settings, "table_mode", text="Table", toggle=True)
         col = layout.column()
-        col.label(text="Image Textures:", icon='IMAGE_DATA')
         
         # List all images in blend file
-        if bpy.data.images:
+        if bpy.data.images and settings.table_mode:
+            self.draw_table(layout, settings)
+        elif bpy.data.images:
             box = layout.box()
             for img in bpy.data.images:
                 row = box.row()
                 row.label(text=img.name, icon='IMAGE')
-                row.label(text=f"{img.size[0]}x{img.size[1]}" if img.size[0] > 0 else "No size")
+                row.label(text=self.size_text(img))
         else:
             col.label(text="No images loaded")
         
@@ -54,6 +135,178 @@ class QPANEL_PT_texture_image(Panel):
         col = layout.column()
         col.operator("image.open", text="Open Image", icon='FILE_FOLDER')
 
+    @staticmethod
+    def draw_table(layout, settings):
+        """One page of the sorted, filtered image table"""
+        rows = _image_table.view(settings.sort_by, settings.sort_reverse, settings.filter)
+        
+        row = layout.row(align=True)
+        row.prop(settings, "filter", text="", icon='VIEWZOOM')
+        row.prop(settings, "sort_reverse", text="",
+                 icon='SORT_DESC' if settings.sort_reverse else 'SORT_ASC')
+        layout.row(align=True).prop(settings, "sort_by", expand=True)
+        
+        page_size = settings.page_size
+        pages = max(1, -(-len(rows) // page_size))
+        page = min(settings.page, pages - 1)
+        
+        box = layout.box()
+        header = box.row()
+        for title in ("Name", "Size", "Memory", "Disk", "Users"):
+            header.label(text=title)
+        header.label(text="", icon='BLANK1')
+        
+        for entry in rows[page * page_size:(page + 1) * page_size]:
+            line = box.row()
+            line.label(text=entry.name, icon='PACKAGE' if entry.packed else 'IMAGE')
+            line.label(text=f"{entry.width}x{entry.height}" if entry.info else "-")
+            line.label(text=_format.format_bytes(entry.memory) if entry.info else "-")
+            line.label(text=_format.format_bytes(entry.disk))
+            line.label(text=str(entry.users))
+            line.label(text="", icon='CHECKMARK' if entry.loaded else 'BLANK1')
+        
+        row = layout.row(align=True)
+        row.prop(settings, "page", text="Page")
+        row.label(text=f"of {pages}  ·  {len(rows)} images  ·  "
+                       f"{_format.format_bytes(sum(entry.memory for entry in rows))}")
+        row.prop(settings, "page_size", text="Rows")
+
+    @staticmethod
+    def size_text(img):
+        """Size label that never forces a pixel load"""
+        info = _image_probe.image_info(img)
+        if info is not None:
+            return _image_probe.describe(info)
+        if img.packed_file is not None:
+            return "Packed"
+        path = _image_probe.image_path(img)
+        if path and _image_probe.is_pending(path):
+            return "Reading header..."
+        return "No size"
+
+
+class QPANEL_OT_image_budget_enforce(Operator):
+    """Free the least recently used image buffers until the memory budget fits"""
+    bl_idname = "qpanel.image_budget_enforce"
+    bl_label = "Enforce Budget"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        settings = context.window_manager.qpanel_texture_table
+        count, freed = _image_budget.enforce(context, settings.budget_mb * 1024 * 1024)
+        if count:
+            self.report({'INFO'}, f"Freed {count} images ({_format.format_bytes(freed)})")
+        else:
+            self.report({'INFO'}, "Within budget (or only images in use)")
+        return {'FINISHED'}
+
+
+class QPANEL_PT_texture_budget(Panel):
+    """Image Memory Budget"""
+    bl_label = "Image Memory"
+    bl_idname = "QPANEL_PT_texture_budget"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'TEXTURE'
+    
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.qpanel_texture_table
+        
+        # Cached table rows: no pass over image buffers per redraw
+        loaded = [row for row in _image_table.rows() if row.loaded]
+        resident = sum(row.memory for row in loaded)
+        budget = settings.budget_mb * 1024 * 1024
+        
+        col = layout.column()
+        col.label(text=f"Resident: {_format.format_bytes(resident)} in {len(loaded)} images",
+                  icon='ERROR' if resident > budget else 'IMAGE_DATA')
+        col.prop(settings, "budget_mb")
+        row = col.row(align=True)
+        row.prop(settings, "auto_budget", toggle=True)
+        row.operator("qpanel.image_budget_enforce", icon='TRASH')
+
+
+class QPANEL_OT_image_duplicates_analyze(Operator):
+    """Hash image files and packed data in the background to find byte-identical images"""
+    bl_idname = "qpanel.image_duplicates_analyze"
+    bl_label = "Find Duplicates"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        _image_dedupe.analyze()
+        return {'FINISHED'}
+
+
+class QPANEL_OT_image_duplicates_merge(Operator):
+    """Remap all users of identical images to a single datablock"""
+    bl_idname = "qpanel.image_duplicates_merge"
+    bl_label = "Merge Duplicates"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    group: IntProperty(
+        name="Group",
+        description="Duplicate group to merge (-1 merges every group)",
+        default=-1,
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return bool(_image_dedupe.groups())
+
+    def execute(self, context):
+        groups = _image_dedupe.groups()
+        indices = range(len(groups)) if self.group < 0 else [self.group]
+        remapped = 0
+        for index in sorted(indices, reverse=True):
+            if index < len(groups):
+                remapped += _image_dedupe.merge_group(groups[index][1])
+                _image_dedupe.forget_group(index)
+        _image_table.invalidate()
+        self.report({'INFO'}, f"Remapped {remapped} duplicate images")
+        return {'FINISHED'}
+
+
+class QPANEL_PT_texture_duplicates(Panel):
+    """Duplicate Images"""
+    bl_label = "Duplicate Images"
+    bl_idname = "QPANEL_PT_texture_duplicates"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'WINDOW'
+    bl_qpanel_category = 'TEXTURE'
+    
+    max_groups = 20
+    
+    def draw(self, context):
+        layout = self.layout
+        
+        row = layout.row(align=True)
+        if _image_dedupe.is_running():
+            row.label(text="Hashing images...", icon='TIME')
+        else:
+            row.operator("qpanel.image_duplicates_analyze", icon='VIEWZOOM')
+        row.operator("qpanel.image_duplicates_merge", text="Merge All", icon='AUTOMERGE_ON').group = -1
+        
+        groups = _image_dedupe.groups()
+        if groups is None:
+            return
+        if not groups:
+            layout.label(text="No duplicates found", icon='CHECKMARK')
+            return
+        
+        wasted = sum(size * (len(names) - 1) for size, names in groups)
+        layout.label(text=f"{len(groups)} groups, {_format.format_bytes(wasted)} of redundant files")
+        for index, (size, names) in enumerate(groups[:self.max_groups]):
+            box = layout.box()
+            row = box.row()
+            row.label(text=f"{len(names)} x {_format.format_bytes(size)}", icon='IMAGE_DATA')
+            row.operator("qpanel.image_duplicates_merge", text="Merge", icon='AUTOMERGE_ON').group = index
+            col = box.column(align=True)
+            for name in names:
+                col.label(text=name)
+        if len(groups) > self.max_groups:
+            layout.label(text=f"{len(groups) - self.max_groups} more groups (Merge All includes them)")
+
 
 class QPANEL_PT_texture_mapping(Panel):
     """Texture Mapping"""
@@ -78,15 +331,29 @@ class QPANEL_PT_texture_mapping(Panel):
 
 # Registration
 classes = (
+    QPANEL_PG_texture_table,
     QPANEL_PT_texture_settings,
     QPANEL_PT_texture_image,
+    QPANEL_OT_image_budget_enforce,
+    QPANEL_PT_texture_budget,
+    QPANEL_OT_image_duplicates_analyze,
+    QPANEL_OT_image_duplicates_merge,
+    QPANEL_PT_texture_duplicates,
     QPANEL_PT_texture_mapping,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.types.WindowManager.qpanel_texture_table = PointerProperty(type=QPANEL_PG_texture_table)
+    _image_table.register()
+    _image_budget.register()
 
 def unregister():
+    _image_budget.unregister()
+    _image_table.unregister()
+    del bpy.types.WindowManager.qpanel_texture_table
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
+    _image_dedupe.clear()
+    _image_probe.clear()
@@ -0,0 +1,53 @@
+"""
+Build Panel Index for QPanels Assets
+Parses every module under panels/ with ast (no bpy) and writes panels/panel_index.json
+
+Run before each release so registration and the Panel Selector can read
+panel metadata without importing panel code.
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+
+
+def load_index_module(panels_dir):
+    """Load panels/_index.py by path (panels/__init__.py imports bpy)."""
+    spec = importlib.util.spec_from_file_location("qpanel_assets_index", panels_dir / "_index.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    """Build the index, or verify it is up to date with --check."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true",
+                        help="exit with code 1 if panel_index.json is out of date")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).parent.parent
+    panels_dir = repo_root / "panels"
+    panel_index = load_index_module(panels_dir)
+
+    index_file = panels_dir / panel_index.INDEX_FILENAME
+    content = panel_index.dumps(panel_index.build_index(panels_dir))
+
+    if args.check:
+        current = index_file.read_text(encoding="utf-8") if index_file.exists() else ""
+        if current != content:
+            print(f"❌ {index_file.name} is out of date - run: python scripts/build_panel_index.py")
+            sys.exit(1)
+        print(f"✅ {index_file.name} is up to date")
+        return
+
+    index_file.write_text(content, encoding="utf-8")
+
+    index = panel_index.load_index(panels_dir)
+    panel_count = sum(1 for _ in panel_index.panel_entries(index))
+    print(f"✅ {index_file.name} written: {len(index['modules'])} modules, {panel_count} panels")
+
+
+if __name__ == "__main__":
+    main()
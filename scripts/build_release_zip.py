@@ -0,0 +1,134 @@
+"""
+Build Release ZIP for QPanels Assets
+Writes qpanel-assets-vX.zip, importable directly through zipimport
+
+The archive holds the package under a single top-level folder with the
+sources, precompiled bytecode next to each module (the layout zipimport
+looks up) and a fresh panels/panel_index.json. QPanels Core can then
+verify the ZIP and put it on sys.path instead of extracting it:
+
+    sys.path.insert(0, "/path/to/qpanel-assets-v2.1.6.zip")
+    qpanel_assets = importlib.import_module("qpanel_assets")
+
+Run it with the Python version bundled with the target Blender so the
+bytecode matches; on a mismatch zipimport falls back to the sources.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import marshal
+import zipfile
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+
+
+# Fixed timestamp: identical sources give a byte-identical ZIP (stable SHA256)
+ZIP_DATE_TIME = (2026, 1, 1, 0, 0, 0)
+
+PACKAGE_FILES = ("__init__.py", "LICENSE", "README.md", "CHANGELOG.md")
+
+
+def load_index_module(panels_dir):
+    """Load panels/_index.py by path (panels/__init__.py imports bpy)."""
+    spec = importlib.util.spec_from_file_location("qpanel_assets_index", panels_dir / "_index.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def compile_bytecode(source, filename):
+    """Return unchecked hash-based .pyc data (PEP 552) for a source.
+
+    zipimport accepts it without comparing timestamps, so the archive does
+    not depend on file modification times.
+    """
+    code = compile(source, filename, "exec", dont_inherit=True)
+    flags = (0b01).to_bytes(4, "little")  # hash-based, unchecked
+    source_hash = importlib.util.source_hash(source)
+    return MAGIC_NUMBER + flags + source_hash + marshal.dumps(code)
+
+
+def calculate_sha256(file_path):
+    """Calculate SHA256 hash of a file."""
+    sha256_hash = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for byte_block in iter(lambda: f.read(65536), b""):
+            sha256_hash.update(byte_block)
+    return sha256_hash.hexdigest()
+
+
+def write_entry(archive, arcname, data):
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    archive.writestr(info, data)
+
+
+def build_zip(repo_root, output, package_name, bytecode=True):
+    """Write the release archive and return the number of modules it holds."""
+    panels_dir = repo_root / "panels"
+    panel_index = load_index_module(panels_dir)
+    index_data = panel_index.dumps(panel_index.build_index(panels_dir)).encode("utf-8")
+
+    files = [repo_root / name for name in PACKAGE_FILES if (repo_root / name).exists()]
+    files += sorted(panels_dir.glob("*.py"))
+
+    module_count = 0
+    with zipfile.ZipFile(output, "w") as archive:
+        for path in files:
+            relative = path.relative_to(repo_root).as_posix()
+            arcname = f"{package_name}/{relative}"
+            data = path.read_bytes()
+            write_entry(archive, arcname, data)
+
+            if path.suffix == ".py":
+                module_count += 1
+                if bytecode:
+                    write_entry(archive, arcname + "c", compile_bytecode(data, arcname))
+
+        write_entry(archive, f"{package_name}/panels/{panel_index.INDEX_FILENAME}", index_data)
+
+    return module_count
+
+
+def main():
+    """Build the ZIP, print its SHA256 and optionally record it in version.json."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--package-name", default="qpanel_assets",
+                        help="top-level folder (import name) inside the archive")
+    parser.add_argument("--output", type=Path,
+                        help="output path (default: dist/qpanel-assets-v<version>.zip)")
+    parser.add_argument("--no-bytecode", action="store_true",
+                        help="ship sources only")
+    parser.add_argument("--update-version", action="store_true",
+                        help="write sha256 and size into version.json")
+    args = parser.parse_args()
+
+    repo_root = Path(__file__).parent.parent
+    version_file = repo_root / "version.json"
+    version_data = json.loads(version_file.read_text(encoding="utf-8"))
+
+    output = args.output or repo_root / "dist" / f"qpanel-assets-v{version_data['version']}.zip"
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    module_count = build_zip(repo_root, output, args.package_name,
+                             bytecode=not args.no_bytecode)
+    sha256_hash = calculate_sha256(output)
+    size = output.stat().st_size
+
+    print(f"✅ {output.name}: {module_count} modules, {size} bytes")
+    print(f"🔑 SHA256: {sha256_hash}")
+
+    if args.update_version:
+        version_data["sha256"] = sha256_hash
+        version_data["size"] = size
+        with open(version_file, "w", encoding="utf-8") as f:
+            json.dump(version_data, f, indent=4, ensure_ascii=False)
+            f.write("\n")
+        print("✅ version.json updated")
+
+
+if __name__ == "__main__":
+    main()
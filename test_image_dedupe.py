@@ -0,0 +1,79 @@
+"""
+Test du regroupement d'images dupliquées (sans Blender)
+Vérifie _analyze_job sur des fichiers temporaires
+"""
+
+import os
+import sys
+import tempfile
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# _analyze_job is pure Python; the module only needs bpy to import
+if "bpy" not in sys.modules:
+    try:
+        import bpy  # noqa: F401
+    except ImportError:
+        sys.modules["bpy"] = types.SimpleNamespace(types=types.SimpleNamespace())
+
+package = Path(__file__).parent.name
+_image_dedupe = __import__(f"{package}.panels._image_dedupe", fromlist=[""])
+
+print("=" * 60)
+print("QPANELS ASSETS - TEST DUPLICATE IMAGES")
+print("=" * 60)
+
+fail_count = 0
+
+
+def check(label, condition):
+    global fail_count
+    print(f"{'✅' if condition else '❌'} {label}")
+    if not condition:
+        fail_count += 1
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    wood = os.path.join(tmp, "wood.png")
+    copy = os.path.join(tmp, "wood_copy.png")
+    other = os.path.join(tmp, "stone.png")
+    for path, data in ((wood, b"wood" * 64), (copy, b"wood" * 64), (other, b"ston" * 64)):
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def analyze(files):
+        stats = _image_dedupe._stat_files({path for _name, path in files})
+        return _image_dedupe._analyze_job(files, [], stats, {})
+
+    # Two datablocks loading the same file
+    by_image, _cache, sizes = analyze([("wood", wood), ("wood.001", wood)])
+    check("shared path: both datablocks hashed", set(by_image) == {"wood", "wood.001"})
+    check("shared path: same digest", len(set(by_image.values())) == 1)
+
+    # Byte-identical files at different paths, plus a same-size different file
+    result = analyze([("wood", wood), ("copy", copy), ("stone", other)])
+    by_image, _cache, sizes = result
+    check("identical files: same digest", by_image["wood"] == by_image["copy"])
+    check("different content: other digest", by_image["stone"] != by_image["wood"])
+
+    # Unique size: nothing to hash
+    by_image, _cache, sizes = analyze([("wood", wood)])
+    check("single image: not hashed", by_image == {})
+
+    # Same bytes read as color and as non-color data are not merged
+    _image_dedupe._store({"wood": ("sRGB", 'STRAIGHT'), "copy": ("Non-Color", 'STRAIGHT'),
+                          "stone": ("sRGB", 'STRAIGHT')}, result)
+    check("different color space: not grouped", _image_dedupe.groups() == [])
+    _image_dedupe._store({"wood": ("sRGB", 'STRAIGHT'), "copy": ("sRGB", 'STRAIGHT'),
+                          "stone": ("sRGB", 'STRAIGHT')}, result)
+    check("same settings: grouped", _image_dedupe.groups() == [(256, ["copy", "wood"])])
+
+print("=" * 60)
+if fail_count == 0:
+    print("🎯 DUPLICATE DETECTION VALIDATED")
+    sys.exit(0)
+else:
+    print(f"⚠️ {fail_count} CHECKS FAILED")
+    sys.exit(1)
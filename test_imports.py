@@ -29,7 +29,8 @@ panels_list = [
     "space_node",
     "space_sequencer",
     "view3d",
-    "outliner"
+    "outliner",
+    "diagnostics"
 ]
 
 success_count = 0
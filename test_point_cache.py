@@ -0,0 +1,85 @@
+"""
+Test de l'inspecteur de caches de simulation (sans Blender)
+Vérifie la correspondance des fichiers .bphys et la purge hors plage
+"""
+
+import os
+import sys
+import types
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Matching and reports are pure Python; the module only needs bpy to import
+if "bpy" not in sys.modules:
+    try:
+        import bpy  # noqa: F401
+    except ImportError:
+        # _handlers imports bpy.app.handlers and lists its handler hooks
+        bpy = types.ModuleType("bpy")
+        bpy.types = types.SimpleNamespace()
+        bpy.app = types.ModuleType("bpy.app")
+        bpy.app.handlers = types.ModuleType("bpy.app.handlers")
+        bpy.app.handlers.persistent = lambda fn: fn
+        for hook in ("depsgraph_update_post", "load_post", "undo_post", "redo_post", "render_pre"):
+            setattr(bpy.app.handlers, hook, [])
+        sys.modules.update({"bpy": bpy, "bpy.app": bpy.app, "bpy.app.handlers": bpy.app.handlers})
+
+package = Path(__file__).parent.name
+_point_cache = __import__(f"{package}.panels._point_cache", fromlist=[""])
+
+print("=" * 60)
+print("QPANELS ASSETS - TEST POINT CACHES")
+print("=" * 60)
+
+fail_count = 0
+
+
+def check(label, condition):
+    global fail_count
+    print(f"{'✅' if condition else '❌'} {label}")
+    if not condition:
+        fail_count += 1
+
+
+# Two caches of one object share the prefix, only the index differs
+files = ["Cube_000010_00.bphys", "Cube_000200_01.bphys", "Cube_000005.bphys", "Other_000010_00.bphys"]
+
+match = _point_cache._bphys_matcher("Cube", 0)
+check("index 0: own frames only", [match(name) for name in files] == [10, None, None, None])
+match = _point_cache._bphys_matcher("Cube", 1)
+check("index 1: own frames only", [match(name) for name in files] == [None, 200, None, None])
+match = _point_cache._bphys_matcher("Cube", -1)
+check("index -1: only files without index", [match(name) for name in files] == [None, None, 5, None])
+
+directory = os.path.normpath("/tmp/blendcache_test")
+sizes = {"Cube_000010_00.bphys": 100, "Cube_000200_00.bphys": 100, "Cube_000200_01.bphys": 300}
+_point_cache._listings[directory] = (1, list(sizes.items()))
+_point_cache._sources = [
+    _point_cache.CacheSource("Cube", "Cloth", 'CLOTH', (directory,),
+                             _point_cache._bphys_matcher("Cube", 0), 1, 100),
+    _point_cache.CacheSource("Cube", "Softbody", 'SOFT_BODY', (directory,),
+                             _point_cache._bphys_matcher("Cube", 1), 1, 250),
+]
+_point_cache._generation += 1
+
+cloth, softbody = _point_cache.report()
+check("report: frames per cache", sorted(cloth.frames) == [10, 200] and sorted(softbody.frames) == [200])
+check("out of range: other cache not counted",
+      _point_cache.out_of_range(cloth) == [200] and _point_cache.out_of_range(softbody) == [])
+
+# Capture the purge job instead of deleting anything
+submitted = []
+_point_cache._background = types.SimpleNamespace(
+    submit=lambda key, on_done, fn, *args: submitted.append(args[0]))
+queued = _point_cache.purge_out_of_range([cloth, softbody])
+check("purge: only the out-of-range file of its own cache", queued == (1, 100)
+      and submitted == [[os.path.join(directory, "Cube_000200_00.bphys")]])
+
+print("=" * 60)
+if fail_count == 0:
+    print("🎯 POINT CACHE MATCHING VALIDATED")
+    sys.exit(0)
+else:
+    print(f"⚠️ {fail_count} CHECKS FAILED")
+    sys.exit(1)